@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark RSSFeedManager against a local mock feed server.
+
+Serves N synthetic feeds spread over several loopback hosts, loads them
+through an OPML feed list and times fetch_all_news() for increasing N.
+Time per feed should stay roughly flat as N grows.
+
+Usage:
+    python benchmarks/feed_manager_benchmark.py [--feeds 100 250 500 1000]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from aiohttp import web
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config import Config
+from src.news_sources.feed_parser import shutdown_executor
+from src.news_sources.rss_feeds import RSSFeedManager
+from src.utils.seen_store import close_seen_store
+from src.utils.transport import close_session
+
+HOSTS = ['127.0.0.1', '127.0.0.2', '127.0.0.3', '127.0.0.4']
+PORT = 8931
+ITEMS_PER_FEED = 20
+
+def build_feed(feed_id: int) -> bytes:
+    """Build a small RSS document for one feed."""
+    items = ''.join(
+        f"<item><title>Bitcoin update {feed_id}-{i}</title>"
+        f"<link>https://example.com/{feed_id}/{i}</link>"
+        f"<description>&lt;p&gt;BTC and ETH market news {i}&lt;/p&gt;</description>"
+        f"<pubDate>Mon, 01 Jan 2024 {i % 24:02d}:00:00 GMT</pubDate></item>"
+        for i in range(ITEMS_PER_FEED)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed {feed_id}</title>{items}</channel></rss>'.encode()
+
+async def start_server() -> web.AppRunner:
+    """Start the mock feed server on every benchmark host."""
+    cache = {}
+    
+    async def handle_feed(request):
+        feed_id = int(request.match_info['feed_id'])
+        if feed_id not in cache:
+            cache[feed_id] = build_feed(feed_id)
+        return web.Response(body=cache[feed_id], content_type='application/rss+xml')
+    
+    app = web.Application()
+    app.router.add_get('/feed/{feed_id}', handle_feed)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    for host in HOSTS:
+        await web.TCPSite(runner, host, PORT).start()
+    return runner
+
+def write_opml(path: Path, feed_count: int):
+    """Write an OPML feed list pointing at the mock server."""
+    outlines = '\n'.join(
+        f'<outline type="rss" text="feed{i}" xmlUrl="http://{HOSTS[i % len(HOSTS)]}:{PORT}/feed/{i}"/>'
+        for i in range(feed_count)
+    )
+    path.write_text(f'<?xml version="1.0"?><opml version="2.0"><body>{outlines}</body></opml>')
+
+async def run_benchmark(feed_counts):
+    """Time a full fetch of each feed count."""
+    runner = await start_server()
+    workdir = Path(tempfile.mkdtemp())
+    
+    print(f"{'feeds':>6} {'seconds':>9} {'ms/feed':>9} {'items':>7}")
+    try:
+        for feed_count in feed_counts:
+            opml_path = workdir / f'feeds_{feed_count}.opml'
+            write_opml(opml_path, feed_count)
+            Config.RSS_FEED_LIST_FILE = str(opml_path)
+            Config.FEED_STATE_FILE = str(workdir / f'feed_state_{feed_count}.json')
+            
+            # Fresh seen-store per run, so earlier runs don't claim the same items
+            close_seen_store()
+            Config.SEEN_STORE_FILE = str(workdir / f'seen_{feed_count}.db')
+            
+            manager = RSSFeedManager()
+            start = time.perf_counter()
+            items = await manager.fetch_all_news()
+            elapsed = time.perf_counter() - start
+            
+            print(f"{feed_count:>6} {elapsed:>9.2f} {elapsed * 1000 / feed_count:>9.2f} {len(items):>7}")
+            await manager.close_all()
+    finally:
+        await close_session()
+        shutdown_executor()
+        close_seen_store()
+        await runner.cleanup()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--feeds', type=int, nargs='+', default=[100, 250, 500, 1000])
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.feeds))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark HTML-to-text extraction on feed entry descriptions.
+
+The corpus mirrors descriptions served by the default feeds: WordPress
+"appeared first on" footers, embedded tweets with their script tags,
+inline styles, numeric and named entities, images and plain text. Each
+extractor runs over the corpus repeatedly and reports entries per second.
+
+Usage:
+    python benchmarks/text_extract_benchmark.py [--rounds 2000]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+from lxml import html as lxml_html
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.utils.text_extract import html_to_text, html_to_text_batch
+
+CORPUS = [
+    # WordPress feed (bitcoinist, cryptonews)
+    '<p><img width="1024" height="576" src="https://bitcoinist.com/wp-content/uploads/2024/05/btc.jpg" '
+    'class="attachment-large size-large wp-post-image" alt="Bitcoin" decoding="async" /></p>'
+    '<p>Bitcoin&#8217;s price reclaimed the $70,000 level on Monday as spot ETF inflows returned, '
+    'with analysts pointing to a &#8220;supply shock&#8221; ahead of the halving.</p>\n'
+    '<p>The post <a rel="nofollow" href="https://bitcoinist.com/bitcoin-reclaims-70k/">Bitcoin Reclaims $70K '
+    'As ETF Inflows Return</a> appeared first on <a rel="nofollow" href="https://bitcoinist.com">Bitcoinist.com</a>.</p>',
+    # Embedded tweet with widget script
+    '<p>Binance will list the new token at 10:00 UTC.</p>'
+    '<blockquote class="twitter-tweet"><p lang="en" dir="ltr">Binance will list $TOKEN '
+    '<a href="https://t.co/abc">https://t.co/abc</a></p>&mdash; Binance (@binance) '
+    '<a href="https://twitter.com/binance/status/1">May 23, 2024</a></blockquote> '
+    '<script async src="https://platform.twitter.com/widgets.js" charset="utf-8"></script>',
+    # Inline style block and div layout (decrypt)
+    '<style>.article-body p{margin:0}</style><div class="article-body"><div><p>Ethereum developers '
+    'confirmed the Dencun upgrade date&nbsp;during Thursday&#x27;s core devs call.</p><ul><li>Blob '
+    'transactions</li><li>Lower L2 fees</li></ul></div></div>',
+    # Short summary with entities only (coindesk)
+    'The SEC approved 19b-4 filings for spot ether ETFs &amp; set the stage for trading later this year.',
+    # Plain text (NewsAPI description)
+    'Crypto markets slid on Friday after the Fed signalled rates would stay higher for longer.',
+    # Comment and CDATA leftovers
+    '<!-- wp:paragraph --><p>Tether minted another $1 billion USDT on Tron, on-chain data shows.</p>'
+    '<!-- /wp:paragraph --><p><em>Disclaimer:</em> This is not <strong>financial</strong> advice.</p>',
+]
+
+def legacy_extract(content: str) -> str:
+    """Previous pipeline: tag strip in the feed loop, then helpers.clean_text's passes."""
+    content = re.sub(r'<[^>]+>', '', content)
+    content = re.sub(r'\s+', ' ', content.strip())
+    return re.sub(r'<[^>]+>', '', content)
+
+def lxml_extract(content: str) -> str:
+    """lxml parse + text_content(), for comparison."""
+    if not content.strip():
+        return ''
+    return ' '.join(lxml_html.fragment_fromstring(content, create_parent='div').text_content().split())
+
+def time_extractor(name: str, extract, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for entry in CORPUS:
+            extract(entry)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} {rounds * len(CORPUS) / elapsed:>12,.0f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=2000)
+    args = parser.parse_args()
+    
+    print("Sample output:")
+    for entry in CORPUS[:3]:
+        print(f"  {html_to_text(entry)[:100]}")
+    print()
+    
+    print(f"{'extractor':<24} {'entries/s':>12}")
+    time_extractor('legacy regex passes', legacy_extract, args.rounds)
+    time_extractor('lxml text_content', lxml_extract, args.rounds)
+    time_extractor('html_to_text', html_to_text, args.rounds)
+    
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        html_to_text_batch(CORPUS)
+    elapsed = time.perf_counter() - start
+    print(f"{'html_to_text_batch':<24} {args.rounds * len(CORPUS) / elapsed:>12,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import os
+import json
 from dotenv import load_dotenv
 from typing import Dict, List
 
@@ -12,6 +13,35 @@ class Config:
     OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
     DEEPSEEK_API_KEY = os.getenv('DEEPSEEK_API_KEY')
     
+    # Concurrent LLM requests and request quota (0 uses the provider's defaults)
+    LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', 0))
+    LLM_REQUESTS_PER_MINUTE = float(os.getenv('LLM_REQUESTS_PER_MINUTE', 0))
+    
+    # Processing pipeline (analyze workers 0 means one per LLM concurrency slot)
+    PIPELINE_QUEUE_SIZE = int(os.getenv('PIPELINE_QUEUE_SIZE', 100))
+    PIPELINE_ANALYZE_WORKERS = int(os.getenv('PIPELINE_ANALYZE_WORKERS', 0))
+    PIPELINE_STATUS_INTERVAL_SECONDS = float(os.getenv('PIPELINE_STATUS_INTERVAL_SECONDS', 60))
+    
+    # Analysis priority: score points a queued item gains per minute of waiting,
+    # and per-source multipliers as JSON, e.g. {"coindesk": 1.2, "reddit": 0.6}
+    PRIORITY_AGING_PER_MINUTE = float(os.getenv('PRIORITY_AGING_PER_MINUTE', 1.0))
+    SOURCE_WEIGHTS = json.loads(os.getenv('SOURCE_WEIGHTS', '{}'))
+    
+    # Load shedding: while the LLM backlog exceeds SHED_MAX_BACKLOG_SECONDS (0 means one
+    # poll interval), items scoring below SHED_PRIORITY_SCORE get the local fallback analysis
+    ENABLE_LOAD_SHEDDING = os.getenv('ENABLE_LOAD_SHEDDING', 'true').lower() == 'true'
+    SHED_MAX_BACKLOG_SECONDS = float(os.getenv('SHED_MAX_BACKLOG_SECONDS', 0))
+    SHED_PRIORITY_SCORE = float(os.getenv('SHED_PRIORITY_SCORE', 7.0))
+    SHED_EWMA_ALPHA = float(os.getenv('SHED_EWMA_ALPHA', 0.2))
+    
+    # Analysis cascade: local analysis first, escalating to the LLM when local importance
+    # reaches CASCADE_ESCALATE_IMPORTANCE or confidence is below CASCADE_MIN_CONFIDENCE;
+    # CASCADE_AUDIT_RATE of the other items also go to the LLM to measure gate misses
+    ENABLE_ANALYSIS_CASCADE = os.getenv('ENABLE_ANALYSIS_CASCADE', 'true').lower() == 'true'
+    CASCADE_ESCALATE_IMPORTANCE = int(os.getenv('CASCADE_ESCALATE_IMPORTANCE', 5))
+    CASCADE_MIN_CONFIDENCE = int(os.getenv('CASCADE_MIN_CONFIDENCE', 5))
+    CASCADE_AUDIT_RATE = float(os.getenv('CASCADE_AUDIT_RATE', 0.05))
+    
     # News API Configuration
     NEWS_API_KEY = os.getenv('NEWS_API_KEY')
     
@@ -20,6 +50,25 @@ class Config:
     REDDIT_CLIENT_SECRET = os.getenv('REDDIT_CLIENT_SECRET')
     REDDIT_USER_AGENT = os.getenv('REDDIT_USER_AGENT', 'CryptoNewsBot/1.0')
     
+    # NewsAPI quota and queries (queries are separated by ';')
+    NEWS_API_REQUESTS_PER_DAY = int(os.getenv('NEWS_API_REQUESTS_PER_DAY', 1000))
+    NEWS_API_BURST = int(os.getenv('NEWS_API_BURST', 5))
+    NEWS_API_MAX_RETRIES = int(os.getenv('NEWS_API_MAX_RETRIES', 2))
+    NEWS_API_DEFAULT_RETRY_AFTER = int(os.getenv('NEWS_API_DEFAULT_RETRY_AFTER', 60))
+    NEWS_API_PAGE_SIZE = int(os.getenv('NEWS_API_PAGE_SIZE', 100))
+    NEWS_API_MAX_PAGES = int(os.getenv('NEWS_API_MAX_PAGES', 2))
+    NEWS_API_BACKFILL_HOURS = int(os.getenv('NEWS_API_BACKFILL_HOURS', 24))
+    NEWS_API_BACKFILL_MAX_PAGES = int(os.getenv('NEWS_API_BACKFILL_MAX_PAGES', 5))
+    NEWS_API_STATE_FILE = os.getenv('NEWS_API_STATE_FILE', 'data/news_api_state.json')
+    NEWS_API_QUERIES = [
+        query.strip() for query in os.getenv(
+            'NEWS_API_QUERIES',
+            'cryptocurrency OR bitcoin OR ethereum;'
+            'crypto regulation OR SEC bitcoin;'
+            'blockchain OR DeFi OR NFT'
+        ).split(';') if query.strip()
+    ]
+    
     # Alert Configuration
     WEBHOOK_URL = os.getenv('WEBHOOK_URL')
     ALERT_THRESHOLD = int(os.getenv('ALERT_THRESHOLD', 7))
@@ -31,6 +80,69 @@ class Config:
     ENABLE_RSS_MONITORING = os.getenv('ENABLE_RSS_MONITORING', 'true').lower() == 'true'
     ENABLE_NEWS_API = os.getenv('ENABLE_NEWS_API', 'true').lower() == 'true'
     
+    # WebSub push ingestion (CALLBACK_URL must be reachable by the hubs)
+    ENABLE_WEBSUB = os.getenv('ENABLE_WEBSUB', 'false').lower() == 'true'
+    WEBSUB_CALLBACK_URL = os.getenv('WEBSUB_CALLBACK_URL', '')
+    WEBSUB_HOST = os.getenv('WEBSUB_HOST', '0.0.0.0')
+    WEBSUB_PORT = int(os.getenv('WEBSUB_PORT', 8081))
+    WEBSUB_LEASE_SECONDS = int(os.getenv('WEBSUB_LEASE_SECONDS', 86400))
+    WEBSUB_RENEW_MARGIN_SECONDS = int(os.getenv('WEBSUB_RENEW_MARGIN_SECONDS', 3600))
+    WEBSUB_RENEW_CHECK_SECONDS = int(os.getenv('WEBSUB_RENEW_CHECK_SECONDS', 60))
+    WEBSUB_VERIFY_TIMEOUT_SECONDS = int(os.getenv('WEBSUB_VERIFY_TIMEOUT_SECONDS', 300))
+    
+    # Adaptive polling (per-source intervals learned from publish cadence)
+    POLL_MIN_INTERVAL_SECONDS = int(os.getenv('POLL_MIN_INTERVAL_SECONDS', 60))
+    POLL_MAX_INTERVAL_SECONDS = int(os.getenv('POLL_MAX_INTERVAL_SECONDS', 1800))
+    POLL_CADENCE_FACTOR = float(os.getenv('POLL_CADENCE_FACTOR', 0.5))
+    POLL_JITTER = float(os.getenv('POLL_JITTER', 0.1))
+    
+    # Circuit breakers for failing sources and hosts
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', 3))
+    CIRCUIT_HOST_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_HOST_FAILURE_THRESHOLD', 5))
+    CIRCUIT_BASE_DELAY_SECONDS = int(os.getenv('CIRCUIT_BASE_DELAY_SECONDS', 60))
+    CIRCUIT_MAX_DELAY_SECONDS = int(os.getenv('CIRCUIT_MAX_DELAY_SECONDS', 3600))
+    
+    # HTTP Transport Configuration (shared connection pool)
+    HTTP_MAX_CONNECTIONS = int(os.getenv('HTTP_MAX_CONNECTIONS', 100))
+    HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv('HTTP_MAX_CONNECTIONS_PER_HOST', 4))
+    # Per-host limit for the separate LLM pool (0 = unlimited; LLM_MAX_CONCURRENCY bounds it)
+    HTTP_LLM_MAX_CONNECTIONS_PER_HOST = int(os.getenv('HTTP_LLM_MAX_CONNECTIONS_PER_HOST', 0))
+    HTTP_DNS_CACHE_TTL = int(os.getenv('HTTP_DNS_CACHE_TTL', 300))
+    HTTP_KEEPALIVE_SECONDS = float(os.getenv('HTTP_KEEPALIVE_SECONDS', 60))
+    
+    # Feed parsing process pool (0 parses in the default thread pool instead)
+    FEED_PARSER_WORKERS = int(os.getenv('FEED_PARSER_WORKERS', min(4, os.cpu_count() or 1)))
+    
+    # Response size limits (bytes, after decompression)
+    RSS_MAX_BODY_BYTES = int(os.getenv('RSS_MAX_BODY_BYTES', 5 * 1024 * 1024))
+    NEWS_API_MAX_BODY_BYTES = int(os.getenv('NEWS_API_MAX_BODY_BYTES', 10 * 1024 * 1024))
+    
+    # Streaming RSS parse mode (stops reading at the last-seen entry)
+    RSS_STREAMING_PARSE = os.getenv('RSS_STREAMING_PARSE', 'false').lower() == 'true'
+    RSS_STREAM_CHUNK_SIZE = int(os.getenv('RSS_STREAM_CHUNK_SIZE', 16384))
+    
+    # Article content sent to the LLM per item (0 sends everything)
+    MAX_CONTENT_CHARS = int(os.getenv('MAX_CONTENT_CHARS', 1000))
+    
+    # Dedup retention (items seen within the window are skipped)
+    DEDUP_WINDOW_HOURS = float(os.getenv('DEDUP_WINDOW_HOURS', 48))
+    DEDUP_BUCKET_MINUTES = float(os.getenv('DEDUP_BUCKET_MINUTES', 60))
+    
+    # Shared on-disk record of processed items (empty disables it)
+    SEEN_STORE_FILE = os.getenv('SEEN_STORE_FILE', 'data/seen.db')
+    SEEN_STORE_RETENTION_HOURS = float(os.getenv('SEEN_STORE_RETENTION_HOURS', 168))
+    SEEN_STORE_PRUNE_INTERVAL_MINUTES = float(os.getenv('SEEN_STORE_PRUNE_INTERVAL_MINUTES', 60))
+    
+    # Near-duplicate stories across sources (only the first copy is analyzed)
+    ENABLE_NEAR_DUP_DETECTION = os.getenv('ENABLE_NEAR_DUP_DETECTION', 'true').lower() == 'true'
+    NEAR_DUP_WINDOW_HOURS = float(os.getenv('NEAR_DUP_WINDOW_HOURS', 12))
+    NEAR_DUP_THRESHOLD = float(os.getenv('NEAR_DUP_THRESHOLD', 0.6))
+    
+    # Persistent feed state (ETag/Last-Modified validators and body digests),
+    # written at most every FEED_STATE_SAVE_INTERVAL_SECONDS while polling and on shutdown
+    FEED_STATE_FILE = os.getenv('FEED_STATE_FILE', 'data/feed_state.json')
+    FEED_STATE_SAVE_INTERVAL_SECONDS = float(os.getenv('FEED_STATE_SAVE_INTERVAL_SECONDS', 60))
+    
     # Logging Configuration
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FILE = os.getenv('LOG_FILE', 'crypto_alerts.log')
@@ -44,9 +156,22 @@ class Config:
         'bitcoinist': 'https://bitcoinist.com/feed/',
     }
     
+    # Optional feed list (OPML, JSON or text file) replacing RSS_FEEDS
+    RSS_FEED_LIST_FILE = os.getenv('RSS_FEED_LIST_FILE', '')
+    
+    # Concurrency limits for feed fetching
+    RSS_MAX_CONCURRENCY = int(os.getenv('RSS_MAX_CONCURRENCY', 50))
+    RSS_MAX_CONCURRENCY_PER_HOST = int(os.getenv('RSS_MAX_CONCURRENCY_PER_HOST', 2))
+    
+    # Exchange announcement WebSocket streams, as JSON:
+    # {"name": {"url": "wss://...", "subscribe": {"op": "subscribe", "since": "{since}"}}}
+    EXCHANGE_WS_FEEDS = json.loads(os.getenv('EXCHANGE_WS_FEEDS', '{}'))
+    EXCHANGE_WS_HEARTBEAT_SECONDS = float(os.getenv('EXCHANGE_WS_HEARTBEAT_SECONDS', 20))
+    EXCHANGE_WS_QUEUE_SIZE = int(os.getenv('EXCHANGE_WS_QUEUE_SIZE', 1000))
+    
     # Crypto-related keywords for filtering
     CRYPTO_KEYWORDS = [
-        'bitcoin', 'btc', 'ethereum', 'eth', 'cryptocurrency', 'crypto',
+        'bitcoin', 'btc', 'ethereum', 'eth', 'cryptocurrency', 'crypto*',
         'blockchain', 'defi', 'nft', 'altcoin', 'trading', 'exchange',
         'binance', 'coinbase', 'regulation', 'sec', 'cftc', 'fed',
         'inflation', 'interest rate', 'monetary policy', 'cbdc',
@@ -60,6 +185,9 @@ class Config:
         'cz_binance', 'brian_armstrong', 'VitalikButerin', 'michael_saylor'
     ]
     
+    # Maximum Reddit submissions buffered before the stream applies backpressure
+    REDDIT_QUEUE_SIZE = int(os.getenv('REDDIT_QUEUE_SIZE', 500))
+    
     # Reddit subreddits to monitor
     REDDIT_SUBREDDITS = [
         'cryptocurrency', 'bitcoin', 'ethereum', 'cryptomarkets',
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+class FakeClock:
+    """Stands in for time.time/time.monotonic; moves only when a test sets `now`."""
+    
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """A fake clock; patch it over the one function the module under test reads."""
+    return FakeClock()
@@ -7,15 +7,29 @@ Real-time news monitoring with AI analysis for crypto trading opportunities
 import asyncio
 import signal
 import sys
-from datetime import datetime
-from typing import List, Dict
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
 from config import Config
 from src.utils.logger import setup_logger
+from src.news_sources.base import NewsItem, StreamingNewsSource
 from src.news_sources.rss_feeds import RSSFeedManager
 from src.news_sources.news_api import NewsAPISource
+from src.news_sources.reddit import RedditSource
+from src.news_sources.exchange_ws import WebSocketNewsSource
+from src.news_sources.rss_feeds import RSSFeedSource
+from src.news_sources.scheduler import AdaptiveScheduler
+from src.news_sources.websub import WebSubReceiver
 from src.ai_analysis.llm_client import LLMClient
+from src.ai_analysis.near_duplicate import NearDuplicateDetector, StoryCluster
+from src.ai_analysis.priority import pre_score
+from src.ai_analysis.load_shedder import LoadShedder, FALLBACK
+from src.ai_analysis.cascade import AnalysisCascade
 from src.alerts.alert_manager import AlertManager
+from src.news_sources.feed_parser import shutdown_executor
+from src.utils.transport import close_session
+from src.utils.seen_store import close_seen_store
+from src.utils.pipeline import Pipeline, PriorityStage, Stage
 
 class CryptoAlertSystem:
     """Main application class for the crypto alert system."""
@@ -26,6 +40,15 @@ class CryptoAlertSystem:
         self.news_api_source = None
         self.llm_client = None
         self.alert_manager = None
+        self.scheduler = None
+        self.websub_receiver = None
+        self.near_duplicates = None
+        self.load_shedder = None
+        self.cascade = None
+        self.pipeline = None
+        self.analyze_stage = None
+        self.alerts_generated = 0
+        self.streaming_sources: List[StreamingNewsSource] = []
         self.running = False
         
         # Setup signal handlers for graceful shutdown
@@ -36,6 +59,8 @@ class CryptoAlertSystem:
         """Handle shutdown signals."""
         self.logger.info(f"Received signal {signum}, shutting down gracefully...")
         self.running = False
+        if self.scheduler:
+            self.scheduler.stop()
     
     async def initialize(self):
         """Initialize all system components."""
@@ -54,125 +79,241 @@ class CryptoAlertSystem:
         # Initialize components
         if Config.ENABLE_RSS_MONITORING:
             self.rss_manager = RSSFeedManager(self.logger)
-            self.logger.info(f"📡 RSS monitoring enabled for {len(Config.RSS_FEEDS)} feeds")
+            self.logger.info(f"📡 RSS monitoring enabled for {len(self.rss_manager.sources)} feeds")
 
         if Config.ENABLE_NEWS_API and Config.NEWS_API_KEY:
             self.news_api_source = NewsAPISource(self.logger)
             self.logger.info("📰 NewsAPI monitoring enabled")
+        
+        if Config.ENABLE_SOCIAL_MONITORING and Config.REDDIT_CLIENT_ID and Config.REDDIT_CLIENT_SECRET:
+            self.streaming_sources.append(RedditSource(self.logger))
+            self.logger.info(f"👽 Reddit monitoring enabled for {len(Config.REDDIT_SUBREDDITS)} subreddits")
+        
+        for name, stream_config in Config.EXCHANGE_WS_FEEDS.items():
+            self.streaming_sources.append(WebSocketNewsSource(name, stream_config, self.logger))
+        if Config.EXCHANGE_WS_FEEDS:
+            self.logger.info(f"🔌 Exchange announcement streams enabled for {len(Config.EXCHANGE_WS_FEEDS)} exchanges")
 
         self.llm_client = LLMClient(self.logger)
+        self.logger.info(
+            f"🧠 LLM provider: {self.llm_client.provider} "
+            f"(up to {self.llm_client.max_concurrency} concurrent requests)"
+        )
+        if Config.ENABLE_ANALYSIS_CASCADE and self.llm_client.provider != 'fallback':
+            self.cascade = AnalysisCascade(self.llm_client, self.logger)
+            self.logger.info(
+                f"🪜 Analysis cascade: local first, LLM from importance {self.cascade.escalate_importance}/10"
+            )
+        if Config.ENABLE_NEAR_DUP_DETECTION:
+            self.near_duplicates = NearDuplicateDetector(self.logger)
         self.alert_manager = AlertManager(self.logger)
         
+        # Continuous pipeline: polled, streamed and pushed items flow through the same stages.
+        # The analyze stage is a priority queue so likely-important news reaches the LLM first.
+        analyze_workers = Config.PIPELINE_ANALYZE_WORKERS or self.llm_client.max_concurrency
+        self.analyze_stage = PriorityStage(
+            'analyze', self.analyze_job, lambda job: job[2], Config.PRIORITY_AGING_PER_MINUTE / 60,
+            analyze_workers, Config.PIPELINE_QUEUE_SIZE, self.logger
+        )
+        self.pipeline = Pipeline([
+            Stage('filter', self.filter_item, 1, Config.PIPELINE_QUEUE_SIZE, self.logger),
+            self.analyze_stage,
+            Stage('alert', self.alert_job, 1, Config.PIPELINE_QUEUE_SIZE, self.logger)
+        ], self.logger)
+        
+        # Under an LLM backlog, low-priority items degrade to local analysis
+        if Config.ENABLE_LOAD_SHEDDING and self.llm_client.provider != 'fallback':
+            self.load_shedder = LoadShedder(analyze_workers, self.logger)
+            self.llm_client.on_call_complete = self.load_shedder.record_call
+        
+        if Config.ENABLE_WEBSUB and self.rss_manager:
+            if Config.WEBSUB_CALLBACK_URL:
+                self.websub_receiver = WebSubReceiver(self.pipeline.submit, self.logger)
+                await self.websub_receiver.start()
+            else:
+                self.logger.warning("⚠️  ENABLE_WEBSUB is set but WEBSUB_CALLBACK_URL is missing, polling only")
+        
         self.logger.info(f"🎯 Alert threshold set to {Config.ALERT_THRESHOLD}/10")
-        self.logger.info(f"⏱️  Check interval: {Config.CHECK_INTERVAL_MINUTES} minutes")
+        self.logger.info(
+            f"⏱️  Poll interval: {Config.POLL_MIN_INTERVAL_SECONDS}-{Config.POLL_MAX_INTERVAL_SECONDS}s per source "
+            f"(starting at {Config.CHECK_INTERVAL_MINUTES} minutes)"
+        )
         
         self.logger.info("✅ System initialization complete!")
     
-    async def run_monitoring_cycle(self):
-        """Run a single monitoring cycle."""
-        try:
-            self.logger.info("🔍 Starting monitoring cycle...")
-            
-            all_news = []
-            
-            # Fetch RSS news
-            if self.rss_manager and Config.ENABLE_RSS_MONITORING:
-                rss_news = await self.rss_manager.fetch_all_news()
-                all_news.extend([item.to_dict() for item in rss_news])
-                self.logger.info(f"📰 Found {len(rss_news)} relevant RSS news items")
-
-            # Fetch NewsAPI news
-            if self.news_api_source and Config.ENABLE_NEWS_API:
-                news_api_items = await self.news_api_source.fetch_news()
-                all_news.extend([item.to_dict() for item in news_api_items])
-                self.logger.info(f"📡 Found {len(news_api_items)} relevant NewsAPI items")
-            
-            if not all_news:
-                self.logger.info("📭 No new relevant news found")
-                return
-            
-            # Analyze news with AI
-            alerts_generated = 0
-            for news_item in all_news:
-                try:
-                    # Analyze with LLM
-                    analysis = await self.llm_client.analyze_news(
-                        news_item['title'],
-                        news_item['content'],
-                        news_item['source']
-                    )
-                    
-                    # Generate alert if needed
-                    alert = await self.alert_manager.process_news_analysis(news_item, analysis)
-                    if alert:
-                        alerts_generated += 1
-                    
-                    # Small delay to avoid rate limiting
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    self.logger.error(f"Error processing news item: {e}")
-                    continue
-            
-            self.logger.info(f"🚨 Generated {alerts_generated} alerts from {len(all_news)} news items")
-            
-            # Log system stats
-            stats = self.alert_manager.get_alert_stats()
-            if stats['total'] > 0:
-                self.logger.info(f"📊 24h Stats: {stats['total']} alerts, avg importance: {stats['avg_importance']}")
-            
-        except Exception as e:
-            self.logger.error(f"Error in monitoring cycle: {e}")
+    async def filter_item(self, item: NewsItem) -> Optional[Tuple[NewsItem, Optional[StoryCluster], float]]:
+        """Filter stage: group the item with copies of the same story and score it.
+        
+        Only a story's leader is analyzed; later copies are recorded as
+        extra sources and inherit its analysis, unless the leader ended
+        without one. Returns (item, cluster, priority score), or None for
+        a copy.
+        """
+        cluster = None
+        if self.near_duplicates:
+            cluster, is_leader = self.near_duplicates.assign(item)
+            if not (is_leader or cluster.follow(item)):
+                self.logger.info(
+                    f"🔁 {item.source} also reports cluster {cluster.cluster_id} "
+                    f"({len(cluster.sources)} sources), skipping analysis"
+                )
+                return None
+        return item, cluster, pre_score(item)
+    
+    async def analyze_job(self, job: Tuple[NewsItem, Optional[StoryCluster], float]) -> Tuple[NewsItem, Dict]:
+        """Analyze stage: analyze a story's leader and hand the result to its cluster.
+        
+        If the leader's analysis fails, a copy of the story that arrived
+        meanwhile is analyzed in its place.
+        """
+        item, cluster, score = job
+        while True:
+            analysis, error = None, None
+            try:
+                analysis = await self._analyze(item, score)
+            except Exception as e:
+                error = e
+            successor = cluster.set_analysis(analysis) if cluster else None
+            if analysis is not None or successor is None:
+                break
+            self.logger.info(
+                f"🔁 No analysis for cluster {cluster.cluster_id}, analyzing the {successor.source} copy instead"
+            )
+            item, score = successor, pre_score(successor)
+        
+        if error:
+            raise error
+        return item, analysis
+    
+    async def _analyze(self, item: NewsItem, score: float) -> Dict:
+        """Run the analysis cascade, or the LLM for every item without one
+        (concurrency and rate limits are enforced by the client).
+        
+        While the load shedder reports a backlog, low-priority items get the
+        local analysis instead.
+        """
+        local_only = False
+        if self.load_shedder:
+            local_only = self.load_shedder.decide(score, self.analyze_stage.queue.qsize()) == FALLBACK
+        
+        if self.cascade and not local_only:
+            analysis, _ = await self.cascade.analyze(item.title, item.content, item.source)
+            return analysis
+        return await self.llm_client.analyze_news(item.title, item.content, item.source, local_only)
+    
+    async def alert_job(self, job: Tuple[NewsItem, Dict]) -> Optional[Dict]:
+        """Alert stage: generate an alert if the analysis warrants one.
+        
+        Only items at the alert threshold are copied into the dict form the
+        alert manager stores as JSON; the rest never reach it.
+        """
+        item, analysis = job
+        if analysis.get('importance', 0) < Config.ALERT_THRESHOLD:
+            return None
+        alert = await self.alert_manager.process_news_analysis(item.to_dict(), analysis)
+        if alert:
+            self.alerts_generated += 1
+        return alert
+    
+    async def poll_rss_source(self, source: RSSFeedSource) -> List[NewsItem]:
+        """Poll an RSS source and subscribe to its WebSub hub once one is discovered."""
+        news_items = await self.rss_manager.fetch_source_news(source)
+        
+        if self.websub_receiver:
+            await self.websub_receiver.ensure_subscribed(source)
+        
+        return news_items
+    
+    async def consume_stream(self, source: StreamingNewsSource):
+        """Filter and analyze items from a push source as soon as they arrive."""
+        async for batch in source.stream():
+            try:
+                relevant_items = await source.filter_relevant_news(batch, Config.CRYPTO_KEYWORDS)
+                await self.pipeline.submit(relevant_items)
+            except Exception as e:
+                self.logger.error(f"Error processing news from {source.name}: {e}")
+    
+    async def report_pipeline_status(self):
+        """Periodically log stage queue depths and alert totals."""
+        while True:
+            await asyncio.sleep(Config.PIPELINE_STATUS_INTERVAL_SECONDS)
+            depths = ', '.join(f"{name}={depth}" for name, depth in self.pipeline.get_queue_depths().items())
+            self.logger.info(f"📦 Queue depths: {depths} | {self.alerts_generated} alerts so far")
+            if self.load_shedder:
+                stats = self.load_shedder.get_stats()
+                self.logger.info(
+                    f"🚧 Load shedding {'active' if stats['shedding'] else 'idle'}: {stats['decisions']} "
+                    f"(~{stats['analyses_per_minute']} analyses/min)"
+                )
+            if self.cascade:
+                stats = self.cascade.get_stats()
+                self.logger.info(
+                    f"🪜 Cascade: {stats['escalated']}/{stats['analyzed']} escalated, "
+                    f"agreement {stats['escalation_agreement']}, "
+                    f"{stats['audit_misses']}/{stats['audited']} audit misses"
+                )
     
     async def run(self):
         """Main application loop."""
         await self.initialize()
         
+        # Each source is polled on its own adaptive schedule
+        self.scheduler = AdaptiveScheduler(self.logger)
+        if self.rss_manager:
+            for source in self.rss_manager.sources:
+                self.scheduler.add(source, partial(self.poll_rss_source, source))
+        if self.news_api_source:
+            self.scheduler.add(self.news_api_source)
+        
         self.running = True
-        self.logger.info(f"🎬 Starting monitoring loop (checking every {Config.CHECK_INTERVAL_MINUTES} minutes)")
+        self.logger.info(
+            f"🎬 Starting monitoring loop for {len(self.scheduler.schedules)} polled "
+            f"and {len(self.streaming_sources)} streaming sources"
+        )
         
+        self.pipeline.start()
+        stream_tasks = [asyncio.create_task(self.report_pipeline_status())]
         try:
-            while self.running:
-                cycle_start = datetime.now()
-                
-                await self.run_monitoring_cycle()
-                
-                # Calculate sleep time
-                cycle_duration = (datetime.now() - cycle_start).total_seconds()
-                sleep_time = max(0, (Config.CHECK_INTERVAL_MINUTES * 60) - cycle_duration)
-                
-                if sleep_time > 0:
-                    self.logger.info(f"😴 Sleeping for {sleep_time:.1f} seconds until next cycle...")
-                    
-                    # Sleep in small chunks to allow for graceful shutdown
-                    while sleep_time > 0 and self.running:
-                        chunk_sleep = min(10, sleep_time)  # Sleep in 10-second chunks
-                        await asyncio.sleep(chunk_sleep)
-                        sleep_time -= chunk_sleep
+            for source in self.streaming_sources:
+                await source.start()
+                stream_tasks.append(asyncio.create_task(self.consume_stream(source)))
+            
+            # Polls hand items to the pipeline and wait only while its first stage is full
+            await self.scheduler.run(self.pipeline.submit)
                 
         except KeyboardInterrupt:
             self.logger.info("👋 Received keyboard interrupt")
         except Exception as e:
             self.logger.error(f"💥 Unexpected error in main loop: {e}")
         finally:
+            for task in stream_tasks:
+                task.cancel()
             await self.cleanup()
     
     async def cleanup(self):
         """Clean up resources."""
         self.logger.info("🧹 Cleaning up resources...")
         
+        if self.websub_receiver:
+            await self.websub_receiver.stop()
+        
+        for source in self.streaming_sources:
+            await source.stop()
+        
+        if self.pipeline:
+            await self.pipeline.stop()
+        
         if self.rss_manager:
             await self.rss_manager.close_all()
 
-        if self.news_api_source:
-            await self.news_api_source.close()
-
-        if self.llm_client:
-            await self.llm_client.close()
-
         if self.alert_manager:
             await self.alert_manager.close()
         
+        # Close the shared HTTP connection pool and parser workers last
+        await close_session()
+        shutdown_executor()
+        close_seen_store()
+        
         self.logger.info("✅ Cleanup complete. Goodbye! 👋")
 
 async def main():
@@ -0,0 +1,100 @@
+import logging
+import random
+from typing import Dict, Optional, Tuple
+
+from config import Config
+from .llm_client import LLMClient
+
+class AnalysisCascade:
+    """Cheap-first analysis: the local analyser runs first and only items
+    that pass the gate are escalated to the LLM.
+    
+    An item is escalated when its local importance (the keyword score of
+    the headline and body) reaches escalate_importance or its local
+    confidence is below min_confidence. If the LLM call fails or its reply
+    can't be parsed, the local analysis is kept.
+    Escalations record whether the local and LLM analyses agreed on the
+    alert decision; a sample of items the gate kept local is also sent to
+    the LLM, to count alerts the gate would have missed.
+    """
+    
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        logger: Optional[logging.Logger] = None,
+        escalate_importance: Optional[int] = None,
+        min_confidence: Optional[int] = None,
+        audit_rate: Optional[float] = None
+    ):
+        self.llm_client = llm_client
+        self.logger = logger or logging.getLogger(__name__)
+        self.escalate_importance = escalate_importance or Config.CASCADE_ESCALATE_IMPORTANCE
+        self.min_confidence = min_confidence if min_confidence is not None else Config.CASCADE_MIN_CONFIDENCE
+        self.audit_rate = audit_rate if audit_rate is not None else Config.CASCADE_AUDIT_RATE
+        
+        self.local_only = 0
+        self.escalated = 0
+        self.escalation_agreements = 0
+        self.audited = 0
+        self.audit_misses = 0
+        self.llm_failures = 0
+    
+    def should_escalate(self, local: Dict) -> bool:
+        """Whether the local analysis is important or uncertain enough for the LLM."""
+        return (
+            local.get('importance', 0) >= self.escalate_importance
+            or local.get('confidence', 0) < self.min_confidence
+        )
+    
+    @staticmethod
+    def _alerts(analysis: Dict) -> bool:
+        return analysis.get('importance', 0) >= Config.ALERT_THRESHOLD
+    
+    async def analyze(self, title: str, content: str, source: str) -> Tuple[Dict, bool]:
+        """Analyze an item; returns the analysis and whether the LLM produced it."""
+        local = await self.llm_client.analyze_news(title, content, source, local_only=True)
+        escalate = self.should_escalate(local)
+        audit = not escalate and random.random() < self.audit_rate
+        if not (escalate or audit):
+            self.local_only += 1
+            return local, False
+        
+        try:
+            analysis = await self.llm_client.llm_analysis(title, content, source)
+        except Exception as e:
+            self.llm_failures += 1
+            self.logger.error(f"LLM analysis failed, using local analysis: {e}")
+            return local, False
+        
+        agreed = self._alerts(local) == self._alerts(analysis)
+        if escalate:
+            self.escalated += 1
+            self.escalation_agreements += agreed
+        else:
+            self.audited += 1
+            if not agreed:
+                self.audit_misses += 1
+                self.logger.info(
+                    f"🔎 Cascade audit: LLM rated {analysis['importance']}/10 what the gate kept local "
+                    f"({local['importance']}/10): {title[:50]}..."
+                )
+        return analysis, True
+    
+    def get_stats(self) -> Dict:
+        """Get escalation counts and agreement rates for tuning the gate."""
+        total = self.local_only + self.escalated + self.audited + self.llm_failures
+        return {
+            'analyzed': total,
+            'local_only': self.local_only,
+            'escalated': self.escalated,
+            'escalation_rate': round(self.escalated / total, 4) if total else 0.0,
+            'escalation_agreement': (
+                round(self.escalation_agreements / self.escalated, 4) if self.escalated else None
+            ),
+            'audited': self.audited,
+            'audit_misses': self.audit_misses,
+            'audit_agreement': (
+                round(1 - self.audit_misses / self.audited, 4) if self.audited else None
+            ),
+            'llm_failures': self.llm_failures
+        }
@@ -1,19 +1,77 @@
 import asyncio
 import aiohttp
 import json
-from typing import Dict, Optional, List
+import time
+from typing import Callable, Dict, Optional, List
 import logging
 from datetime import datetime
 
 from config import Config
+from ..utils.keyword_matcher import get_matcher
+from ..utils.rate_limiter import TokenBucket
+from ..utils.transport import get_session, get_timeout
+
+# Keyword-based importance used by the fallback analysis and pre-scoring
+# (a trailing * matches any word starting with the stem)
+IMPORTANCE_KEYWORDS = {
+    'regulat*': 8, 'sec': 8, 'ban': 9, 'banned': 9, 'banning': 9, 'approv*': 8,
+    'etf': 7, 'institutional': 6, 'adoption': 6,
+    'hack*': 8, 'exploit*': 8, 'security': 7, 'partnership': 5,
+    'upgrade': 6, 'fork': 7, 'halving': 8
+}
+
+# Confidence of the fallback analysis: clear sentiment and importance keywords
+# raise it, text that is both positive and negative lowers it
+BASE_CONFIDENCE = 5
+MAX_KEYWORD_CONFIDENCE = 2
+
+def keyword_importance(text: str, base: int = 3) -> int:
+    """Highest importance of any importance keyword in the text."""
+    matched = get_matcher(IMPORTANCE_KEYWORDS).matched_keywords(text)
+    return max([base, *(IMPORTANCE_KEYWORDS[keyword] for keyword in matched)])
+
+def local_confidence(scores: Dict[str, float], keyword_hits: int) -> int:
+    """Confidence (1-9) of the fallback analysis from VADER scores and importance keyword hits."""
+    confidence = (
+        BASE_CONFIDENCE
+        + round(2 * abs(scores['compound']))
+        + min(keyword_hits, MAX_KEYWORD_CONFIDENCE)
+        - round(10 * min(scores['pos'], scores['neg']))
+    )
+    return max(1, min(9, confidence))
 
 class LLMClient:
-    """Client for interacting with various LLM APIs."""
+    """Client for interacting with various LLM APIs.
+    
+    analyze_news() may be called concurrently: API calls are limited by a
+    semaphore and, if the provider has a request quota, a token bucket.
+    Both default to the provider's limits unless overridden in Config.
+    If set, on_call_complete is called with the duration of every API call.
+    """
+    
+    # Default limits per provider (requests_per_minute 0 means no quota)
+    PROVIDER_LIMITS = {
+        'openrouter': {'concurrency': 2, 'requests_per_minute': 20},
+        'deepseek': {'concurrency': 8, 'requests_per_minute': 0},
+        'fallback': {'concurrency': 1, 'requests_per_minute': 0}
+    }
+    
+    # Seconds to back off after a 429 without a usable Retry-After header
+    DEFAULT_RETRY_AFTER = 60
     
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
         self.provider = Config.get_active_llm_provider()
-        self.session = None
+        
+        limits = self.PROVIDER_LIMITS[self.provider]
+        self.max_concurrency = Config.LLM_MAX_CONCURRENCY or limits['concurrency']
+        requests_per_minute = Config.LLM_REQUESTS_PER_MINUTE or limits['requests_per_minute']
+        
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.rate_limiter: Optional[TokenBucket] = None
+        if requests_per_minute > 0:
+            self.rate_limiter = TokenBucket(rate=requests_per_minute / 60, capacity=self.max_concurrency)
+        self.on_call_complete: Optional[Callable[[float], None]] = None
         
         # API configurations
         self.api_configs = {
@@ -38,29 +96,42 @@ class LLMClient:
         }
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self.session is None or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=60)
-            self.session = aiohttp.ClientSession(timeout=timeout)
-        return self.session
+        """Get the pooled aiohttp session reserved for LLM calls."""
+        return await get_session('llm')
     
-    async def analyze_news(self, title: str, content: str, source: str) -> Dict:
-        """Analyze news using LLM and return structured analysis."""
+    async def analyze_news(self, title: str, content: str, source: str, local_only: bool = False) -> Dict:
+        """Analyze news using LLM and return structured analysis.
         
-        if self.provider == 'fallback':
-            return await self._fallback_analysis(title, content)
+        With local_only the LLM is skipped in favour of the fallback analysis.
+        """
         
-        prompt = self._create_analysis_prompt(title, content, source)
+        if self.provider == 'fallback' or local_only:
+            return await self._fallback_analysis(title, content)
         
         try:
-            response = await self._call_llm_api(prompt)
-            return self._parse_llm_response(response)
+            return await self.llm_analysis(title, content, source)
         except Exception as e:
             self.logger.error(f"LLM analysis failed, using fallback: {e}")
             return await self._fallback_analysis(title, content)
     
+    async def llm_analysis(self, title: str, content: str, source: str) -> Dict:
+        """Analyze news with the LLM only, raising if the API call fails or its reply can't be parsed."""
+        prompt = self._create_analysis_prompt(title, content, source)
+        async with self._semaphore:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+            started = time.monotonic()
+            try:
+                response = await self._call_llm_api(prompt)
+            finally:
+                if self.on_call_complete:
+                    self.on_call_complete(time.monotonic() - started)
+        return self._parse_llm_response(response)
+    
     def _create_analysis_prompt(self, title: str, content: str, source: str) -> str:
         """Create analysis prompt for the LLM."""
+        if Config.MAX_CONTENT_CHARS:
+            content = content[:Config.MAX_CONTENT_CHARS]
         return f"""
 You are a cryptocurrency trading analyst. Analyze the following news and provide a structured assessment.
 
@@ -104,8 +175,16 @@ Respond ONLY with valid JSON, no additional text.
         async with session.post(
             config['base_url'],
             headers=config['headers'],
-            json=payload
+            json=payload,
+            timeout=get_timeout('llm')
         ) as response:
+            if response.status == 429 and self.rate_limiter:
+                try:
+                    retry_after = float(response.headers.get('Retry-After', self.DEFAULT_RETRY_AFTER))
+                except ValueError:
+                    retry_after = self.DEFAULT_RETRY_AFTER
+                self.rate_limiter.pause(retry_after)
+            
             if response.status != 200:
                 error_text = await response.text()
                 raise Exception(f"API call failed: {response.status} - {error_text}")
@@ -114,7 +193,7 @@ Respond ONLY with valid JSON, no additional text.
             return result['choices'][0]['message']['content']
     
     def _parse_llm_response(self, response: str) -> Dict:
-        """Parse LLM response and extract structured data."""
+        """Parse LLM response and extract structured data, raising ValueError if it is unusable."""
         try:
             # Try to extract JSON from response
             import re
@@ -142,17 +221,8 @@ Respond ONLY with valid JSON, no additional text.
                 raise ValueError("No JSON found in response")
                 
         except Exception as e:
-            self.logger.error(f"Failed to parse LLM response: {e}")
-            # Return fallback analysis
-            return {
-                'importance': 5,
-                'sentiment': 'neutral',
-                'summary': 'Analysis failed, manual review required',
-                'trading_signal': 'Monitor situation',
-                'affected_cryptos': [],
-                'time_horizon': 'short',
-                'confidence': 3
-            }
+            # Callers fall back to the local analysis rather than alert on a placeholder
+            raise ValueError(f"Failed to parse LLM response: {e}") from e
     
     async def _fallback_analysis(self, title: str, content: str) -> Dict:
         """Fallback analysis using simple sentiment analysis."""
@@ -173,18 +243,8 @@ Respond ONLY with valid JSON, no additional text.
                 sentiment = 'neutral'
             
             # Calculate importance based on keywords
-            importance_keywords = {
-                'regulation': 8, 'sec': 8, 'ban': 9, 'approval': 8,
-                'etf': 7, 'institutional': 6, 'adoption': 6,
-                'hack': 8, 'security': 7, 'partnership': 5,
-                'upgrade': 6, 'fork': 7, 'halving': 8
-            }
-            
-            importance = 3  # Base importance
-            text_lower = text.lower()
-            for keyword, score in importance_keywords.items():
-                if keyword in text_lower:
-                    importance = max(importance, score)
+            importance = keyword_importance(text)
+            keyword_hits = len(get_matcher(IMPORTANCE_KEYWORDS).matched_keywords(text))
             
             return {
                 'importance': importance,
@@ -193,7 +253,7 @@ Respond ONLY with valid JSON, no additional text.
                 'trading_signal': f'Monitor {sentiment} sentiment',
                 'affected_cryptos': [],
                 'time_horizon': 'short',
-                'confidence': 6
+                'confidence': local_confidence(scores, keyword_hits)
             }
             
         except Exception as e:
@@ -207,8 +267,3 @@ Respond ONLY with valid JSON, no additional text.
                 'time_horizon': 'short',
                 'confidence': 1
             }
-    
-    async def close(self):
-        """Close the aiohttp session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
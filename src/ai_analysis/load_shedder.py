@@ -0,0 +1,98 @@
+import logging
+from collections import Counter
+from typing import Dict, Optional
+
+from config import Config
+
+# Shedding decisions
+ANALYZE = 'analyze'
+FALLBACK = 'fallback'
+
+# Once shedding, keep going until the backlog falls below this fraction of the limit
+RESUME_FRACTION = 0.5
+
+class LoadShedder:
+    """Decides how each queued item is analyzed when the LLM falls behind.
+    
+    Throughput is estimated from an EWMA of LLM call durations and the
+    number of analyze workers. While the queued backlog would take
+    longer than max_backlog_seconds to clear, items scoring below
+    priority_score get the local fallback analysis; everything else gets
+    the full analysis. Items are never dropped, since they are already
+    claimed in the seen-store and wouldn't be fetched again.
+    """
+    
+    def __init__(
+        self,
+        workers: int,
+        logger: Optional[logging.Logger] = None,
+        max_backlog_seconds: Optional[float] = None,
+        priority_score: Optional[float] = None
+    ):
+        self.workers = workers
+        self.logger = logger or logging.getLogger(__name__)
+        self.max_backlog_seconds = (
+            max_backlog_seconds or Config.SHED_MAX_BACKLOG_SECONDS or Config.CHECK_INTERVAL_MINUTES * 60
+        )
+        self.priority_score = priority_score if priority_score is not None else Config.SHED_PRIORITY_SCORE
+        self.alpha = Config.SHED_EWMA_ALPHA
+        
+        self.call_seconds: Optional[float] = None
+        self.shedding = False
+        self.decisions: Counter = Counter()
+        self.reasons: Counter = Counter()
+    
+    def record_call(self, seconds: float):
+        """Fold one LLM call duration into the throughput estimate."""
+        if self.call_seconds is None:
+            self.call_seconds = seconds
+        else:
+            self.call_seconds += self.alpha * (seconds - self.call_seconds)
+    
+    @property
+    def throughput(self) -> Optional[float]:
+        """Estimated analyses per second, or None before the first call."""
+        if not self.call_seconds:
+            return None
+        return self.workers / self.call_seconds
+    
+    def backlog_seconds(self, queue_depth: int) -> float:
+        """Estimated time to clear the queued items."""
+        throughput = self.throughput
+        return queue_depth / throughput if throughput else 0.0
+    
+    def decide(self, score: float, queue_depth: int) -> str:
+        """Choose ANALYZE or FALLBACK for an item with this priority score."""
+        backlog = self.backlog_seconds(queue_depth)
+        limit = self.max_backlog_seconds * (RESUME_FRACTION if self.shedding else 1)
+        overloaded = backlog > limit
+        if overloaded != self.shedding:
+            self.shedding = overloaded
+            if overloaded:
+                self.logger.warning(
+                    f"🚧 LLM backlog ~{backlog:.0f}s ({queue_depth} queued), "
+                    f"shedding items scoring below {self.priority_score}"
+                )
+            else:
+                self.logger.info(f"✅ LLM backlog back under {limit:.0f}s, shedding stopped")
+        
+        if not overloaded:
+            decision, reason = ANALYZE, 'within_capacity'
+        elif score >= self.priority_score:
+            decision, reason = ANALYZE, 'high_priority'
+        else:
+            decision, reason = FALLBACK, 'backlog_low_priority'
+        
+        self.decisions[decision] += 1
+        self.reasons[reason] += 1
+        return decision
+    
+    def get_stats(self) -> Dict:
+        """Get shedding counters and the current throughput estimate."""
+        throughput = self.throughput
+        return {
+            'shedding': self.shedding,
+            'decisions': dict(self.decisions),
+            'reasons': dict(self.reasons),
+            'analyses_per_minute': round(throughput * 60, 1) if throughput else None
+        }
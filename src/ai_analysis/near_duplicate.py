@@ -0,0 +1,180 @@
+import hashlib
+import random
+import re
+import time
+import logging
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from config import Config
+from ..news_sources.base import NewsItem
+
+# MinHash signature length, split into LSH bands of ROWS_PER_BAND values.
+# 16 bands of 4 rows make pairs above ~0.5 Jaccard likely to collide.
+NUM_PERMUTATIONS = 64
+ROWS_PER_BAND = 4
+
+# Only the lead of the content is fingerprinted; syndicated copies share it
+# even when one outlet runs the full article and another a summary
+CONTENT_PREFIX_CHARS = 600
+
+TOKEN_PATTERN = re.compile(r'\w+')
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+
+def minhash(text: str) -> Tuple[int, ...]:
+    """MinHash signature of the set of words in the text."""
+    tokens = set(TOKEN_PATTERN.findall(TAG_PATTERN.sub(' ', text).lower()))
+    if not tokens:
+        return tuple([_MERSENNE_PRIME] * NUM_PERMUTATIONS)
+    
+    hashes = [_token_hash(token) for token in tokens]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+def estimate_similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+class StoryCluster:
+    """Items judged to be the same story; only the leader is analyzed.
+    
+    Copies that arrive while the leader is being analyzed wait on the
+    cluster. If the leader ends without an analysis, a waiting copy (or the
+    next one to arrive) takes over as leader, so the story isn't lost.
+    """
+    
+    def __init__(self, cluster_id: int, leader: NewsItem, signature: Tuple[int, ...]):
+        self.cluster_id = cluster_id
+        self.leader = leader
+        self.signature = signature
+        self.created_at = time.time()
+        self.sources: List[str] = [leader.source]
+        self.analysis: Optional[Dict] = None
+        self.analyzing = True
+        self.waiting: List[NewsItem] = []
+    
+    def add_member(self, news_item: NewsItem):
+        """Record another outlet carrying this story."""
+        if news_item.source not in self.sources:
+            self.sources.append(news_item.source)
+    
+    def follow(self, news_item: NewsItem) -> bool:
+        """Handle a later copy; returns True if it should be analyzed as the new leader."""
+        if self.analysis is not None:
+            return False
+        if not self.analyzing:
+            self.leader = news_item
+            self.analyzing = True
+            return True
+        self.waiting.append(news_item)
+        return False
+    
+    def set_analysis(self, analysis: Optional[Dict]) -> Optional[NewsItem]:
+        """Store the leader's analysis, which later members inherit.
+        
+        Without an analysis, the first waiting copy becomes the leader and
+        is returned so the caller can analyze it instead.
+        """
+        self.analysis = analysis
+        self.analyzing = False
+        if analysis is not None or not self.waiting:
+            self.waiting.clear()
+            return None
+        self.leader = self.waiting.pop(0)
+        self.analyzing = True
+        return self.leader
+
+class NearDuplicateDetector:
+    """Groups syndicated copies of a story across sources using MinHash LSH.
+    
+    Each item's word set is summarized as a MinHash signature and indexed
+    by band, so candidate clusters are found without scanning every recent
+    story; a candidate is accepted when its estimated Jaccard similarity
+    to the cluster leader reaches the threshold. Clusters are forgotten
+    after the window.
+    """
+    
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        window_seconds: Optional[float] = None,
+        threshold: Optional[float] = None
+    ):
+        self.logger = logger or logging.getLogger(__name__)
+        self.window_seconds = window_seconds or Config.NEAR_DUP_WINDOW_HOURS * 3600
+        self.threshold = threshold or Config.NEAR_DUP_THRESHOLD
+        
+        self.bands = NUM_PERMUTATIONS // ROWS_PER_BAND
+        self._band_index: List[Dict[Tuple[int, ...], List[StoryCluster]]] = [{} for _ in range(self.bands)]
+        self._clusters: Deque[StoryCluster] = deque()
+        self._next_id = 0
+        
+        self.items_seen = 0
+        self.duplicates = 0
+    
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        return [signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND] for band in range(self.bands)]
+    
+    def _expire(self, now: float):
+        """Drop clusters older than the window from the index."""
+        while self._clusters and now - self._clusters[0].created_at > self.window_seconds:
+            cluster = self._clusters.popleft()
+            for band, key in enumerate(self._band_keys(cluster.signature)):
+                bucket = self._band_index[band].get(key)
+                if bucket is not None:
+                    bucket.remove(cluster)
+                    if not bucket:
+                        del self._band_index[band][key]
+    
+    def assign(self, news_item: NewsItem) -> Tuple[StoryCluster, bool]:
+        """Place an item in a story cluster; returns the cluster and whether the item leads it."""
+        now = time.time()
+        self._expire(now)
+        self.items_seen += 1
+        
+        signature = minhash(f"{news_item.title} {news_item.content[:CONTENT_PREFIX_CHARS]}")
+        band_keys = self._band_keys(signature)
+        
+        best, best_similarity = None, self.threshold
+        for band, key in enumerate(band_keys):
+            for cluster in self._band_index[band].get(key, ()):
+                similarity = estimate_similarity(signature, cluster.signature)
+                if similarity >= best_similarity:
+                    best, best_similarity = cluster, similarity
+        
+        if best is not None:
+            best.add_member(news_item)
+            self.duplicates += 1
+            self.logger.debug(
+                f"Near-duplicate of cluster {best.cluster_id} ({best_similarity:.2f} similar): "
+                f"{news_item.title[:50]}... from {news_item.source}"
+            )
+            return best, False
+        
+        cluster = StoryCluster(self._next_id, news_item, signature)
+        self._next_id += 1
+        self._clusters.append(cluster)
+        for band, key in enumerate(band_keys):
+            self._band_index[band].setdefault(key, []).append(cluster)
+        return cluster, True
+    
+    def get_stats(self) -> Dict:
+        """Get clustering statistics."""
+        return {
+            'items': self.items_seen,
+            'active_clusters': len(self._clusters),
+            'duplicates': self.duplicates,
+            'duplicate_rate': round(self.duplicates / self.items_seen, 4) if self.items_seen else 0.0
+        }
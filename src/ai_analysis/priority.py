@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+
+from config import Config
+from ..news_sources.base import NewsItem
+from ..utils.keyword_matcher import get_matcher
+from .llm_client import IMPORTANCE_KEYWORDS, keyword_importance
+
+# Keywords found only in the body count for less than headline keywords
+CONTENT_KEYWORD_DISCOUNT = 0.5
+
+# Each distinct crypto keyword adds this much, up to MAX_CRYPTO_HITS of them
+CRYPTO_KEYWORD_BONUS = 0.2
+MAX_CRYPTO_HITS = 5
+
+# Bonus for a brand-new item, falling linearly to 0 at MAX_NEWS_AGE_HOURS
+RECENCY_BONUS = 2.0
+
+def source_weight(source: str) -> float:
+    """Multiplier for a source from Config.SOURCE_WEIGHTS, by exact name or prefix."""
+    weights = Config.SOURCE_WEIGHTS
+    if source in weights:
+        return float(weights[source])
+    for name, weight in weights.items():
+        if source.startswith(name):
+            return float(weight)
+    return 1.0
+
+def pre_score(news_item: NewsItem) -> float:
+    """Cheap estimate of how important an item is, used to order LLM work.
+    
+    Roughly on the 1-10 importance scale: the fallback's keyword importance
+    (headline matches at full weight, body-only matches discounted), plus
+    bonuses for crypto keyword density and freshness, scaled by source weight.
+    """
+    score = keyword_importance(news_item.title)
+    if news_item.content and get_matcher(IMPORTANCE_KEYWORDS).search(news_item.content):
+        content_score = keyword_importance(news_item.content)
+        score = max(score, score + (content_score - score) * CONTENT_KEYWORD_DISCOUNT)
+    
+    crypto_hits = get_matcher(Config.CRYPTO_KEYWORDS).matched_keywords(f"{news_item.title} {news_item.content}")
+    score += min(len(crypto_hits), MAX_CRYPTO_HITS) * CRYPTO_KEYWORD_BONUS
+    
+    published = news_item.published_date
+    if published:
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=timezone.utc)
+        age_hours = max(0.0, (datetime.now(timezone.utc) - published).total_seconds() / 3600)
+        score += RECENCY_BONUS * max(0.0, 1 - age_hours / Config.MAX_NEWS_AGE_HOURS)
+    
+    return score * source_weight(news_item.source)
@@ -1,10 +1,29 @@
+import asyncio
+import hashlib
+import sys
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
 from datetime import datetime
 import logging
 
+from ..utils.circuit_breaker import CircuitBreaker
+from ..utils.dedup import TimeWindowedDedup
+from ..utils.helpers import canonicalize_url
+from ..utils.keyword_matcher import get_matcher
+from ..utils.seen_store import get_seen_store
+
 class NewsItem:
-    """Represents a single news item."""
+    """Represents a single news item.
+    
+    Slotted to keep per-item memory small, with source names interned.
+    Fields can also be read dict-style (item['title'], item.get('url'),
+    iteration and items()) without building the to_dict() copy. Use
+    to_dict() where a real dict is needed, e.g. for JSON.
+    """
+    
+    __slots__ = ('title', 'content', 'url', 'source', 'published_date', 'author', '_hash_id')
+    
+    FIELDS = ('title', 'content', 'url', 'source', 'published_date', 'author', 'hash_id')
     
     def __init__(
         self,
@@ -18,28 +37,60 @@ class NewsItem:
         self.title = title
         self.content = content
         self.url = url
-        self.source = source
+        self.source = sys.intern(source)
         self.published_date = published_date or datetime.now()
         self.author = author
-        self.hash_id = self._generate_hash()
+        self._hash_id: Optional[str] = None
+    
+    @property
+    def hash_id(self) -> str:
+        """Identity of the article, computed on first use.
+        
+        Based on the canonical URL, so tracking parameters, AMP/mobile copies
+        and the source name don't make the same article look new. Items
+        without a URL fall back to their normalized title.
+        """
+        if self._hash_id is None:
+            identity = canonicalize_url(self.url) or ' '.join(self.title.lower().split())
+            self._hash_id = hashlib.blake2b(identity.encode('utf-8'), digest_size=16).hexdigest()
+        return self._hash_id
+    
+    def __getitem__(self, key: str):
+        """Read a field as it appears in to_dict()."""
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        if key == 'published_date':
+            return self.published_date.isoformat() if self.published_date else None
+        return getattr(self, key)
+    
+    def get(self, key: str, default=None):
+        """Dict-style get over the to_dict() fields."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
     
-    def _generate_hash(self) -> str:
-        """Generate a unique hash for this news item."""
-        import hashlib
-        content_for_hash = f"{self.title}{self.url}{self.source}"
-        return hashlib.md5(content_for_hash.encode('utf-8')).hexdigest()
+    def keys(self):
+        return self.FIELDS
+    
+    def values(self):
+        return [self[field] for field in self.FIELDS]
+    
+    def items(self):
+        return [(field, self[field]) for field in self.FIELDS]
+    
+    def __iter__(self):
+        return iter(self.FIELDS)
+    
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+    
+    def __contains__(self, key) -> bool:
+        return key in self.FIELDS
     
     def to_dict(self) -> Dict:
         """Convert news item to dictionary."""
-        return {
-            'title': self.title,
-            'content': self.content,
-            'url': self.url,
-            'source': self.source,
-            'published_date': self.published_date.isoformat() if self.published_date else None,
-            'author': self.author,
-            'hash_id': self.hash_id
-        }
+        return {field: self[field] for field in self.FIELDS}
     
     def __str__(self) -> str:
         return f"NewsItem(title='{self.title[:50]}...', source='{self.source}')"
@@ -50,7 +101,15 @@ class BaseNewsSource(ABC):
     def __init__(self, name: str, logger: Optional[logging.Logger] = None):
         self.name = name
         self.logger = logger or logging.getLogger(__name__)
-        self._seen_hashes = set()
+        self.seen = TimeWindowedDedup()
+        self.last_error: Optional[str] = None
+        self.breaker = CircuitBreaker(name)
+        
+        # Publish times of every dated entry in the last fetch, before filtering (for poll scheduling)
+        self.last_publish_times: List[datetime] = []
+        
+        # True while new items are pushed to us, making polling a fallback
+        self.push_active = False
     
     @abstractmethod
     async def fetch_news(self) -> List[NewsItem]:
@@ -58,15 +117,17 @@ class BaseNewsSource(ABC):
         pass
     
     def is_duplicate(self, news_item: NewsItem) -> bool:
-        """Check if news item has been seen before."""
-        if news_item.hash_id in self._seen_hashes:
-            return True
-        self._seen_hashes.add(news_item.hash_id)
-        return False
-    
-    def filter_relevant_news(self, news_items: List[NewsItem], keywords: List[str]) -> List[NewsItem]:
-        """Filter news items for crypto relevance."""
+        """Check if news item has been seen within the dedup window."""
+        return self.seen.check_and_add(news_item.hash_id)
+    
+    async def filter_relevant_news(self, news_items: List[NewsItem], keywords: List[str]) -> List[NewsItem]:
+        """Filter news items for crypto relevance.
+        
+        Relevant items are claimed in the shared seen-store, so they won't be
+        returned again by this or any other worker (see SeenStore).
+        """
         relevant_items = []
+        matcher = get_matcher(keywords)
         
         for item in news_items:
             # Skip duplicates
@@ -74,12 +135,61 @@ class BaseNewsSource(ABC):
                 continue
             
             # Check if title or content contains crypto keywords
-            text_to_check = f"{item.title} {item.content}".lower()
-            if any(keyword.lower() in text_to_check for keyword in keywords):
+            if matcher.search(item.title) or matcher.search(item.content):
                 relevant_items.append(item)
                 self.logger.debug(f"Found relevant news: {item.title[:50]}...")
         
+        # Drop items already handled before a restart or by another worker
+        seen_store = get_seen_store(self.logger)
+        if seen_store is not None and relevant_items:
+            new_hashes = await seen_store.claim_async(item.hash_id for item in relevant_items)
+            relevant_items = [item for item in relevant_items if item.hash_id in new_hashes]
+        
         return relevant_items
     
+    def get_breaker_state(self) -> Dict:
+        """Get the circuit breaker state for this source."""
+        return self.breaker.to_dict()
+    
+    def get_dedup_stats(self) -> Dict:
+        """Get dedup memory and hit rate statistics for this source."""
+        return self.seen.get_stats()
+    
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(name='{self.name}')"
+
+class StreamingNewsSource(BaseNewsSource):
+    """Base class for sources that push items as they arrive instead of being polled.
+    
+    Items are buffered in a bounded queue; when the consumer falls behind
+    the producer blocks on put(), which propagates backpressure upstream.
+    """
+    
+    def __init__(self, name: str, logger: Optional[logging.Logger] = None, queue_size: int = 1000):
+        super().__init__(name, logger)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    
+    @abstractmethod
+    async def start(self):
+        """Start receiving items in the background."""
+        pass
+    
+    @abstractmethod
+    async def stop(self):
+        """Stop receiving items."""
+        pass
+    
+    async def stream(self, max_batch: int = 50) -> AsyncIterator[List[NewsItem]]:
+        """Yield batches of items as they arrive (waits for at least one)."""
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            yield batch
+    
+    async def fetch_news(self) -> List[NewsItem]:
+        """Drain whatever is currently queued."""
+        items = []
+        while not self.queue.empty():
+            items.append(self.queue.get_nowait())
+        return items
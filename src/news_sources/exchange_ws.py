@@ -0,0 +1,163 @@
+import asyncio
+import json
+import random
+import logging
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+import aiohttp
+from dateutil import parser as date_parser
+
+from .base import StreamingNewsSource, NewsItem
+from config import Config
+from ..utils.text_extract import html_to_text
+from ..utils.transport import get_session
+
+class WebSocketNewsSource(StreamingNewsSource):
+    """Push source for exchange announcements over a long-lived WebSocket.
+    
+    Each stream is configured with a URL and an optional subscribe message.
+    The subscribe message may contain "{since}", which is replaced with
+    the id of the last message seen, so a reconnect can resume where it
+    left off. Messages are plain JSON announcements, optionally wrapped in
+    a "data" envelope, and are deduplicated by id across reconnects.
+    """
+    
+    # Reconnect backoff bounds in seconds
+    RECONNECT_DELAY = 1
+    MAX_RECONNECT_DELAY = 60
+    
+    # Number of recent message ids remembered for dedup across reconnects
+    RECENT_IDS = 2000
+    
+    def __init__(self, name: str, stream_config: Dict, logger: Optional[logging.Logger] = None):
+        super().__init__(name, logger, queue_size=Config.EXCHANGE_WS_QUEUE_SIZE)
+        self.url = stream_config['url']
+        self.subscribe_message = stream_config.get('subscribe')
+        self.last_message_id: Optional[str] = None
+        self.messages_received = 0
+        self._recent_ids: OrderedDict = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+    
+    async def start(self):
+        """Start the connection loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            self.logger.info(f"🔌 Streaming exchange announcements from {self.name}")
+    
+    async def stop(self):
+        """Stop the connection loop."""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+    
+    async def _run(self):
+        """Keep a connection open, reconnecting with jittered backoff."""
+        delay = self.RECONNECT_DELAY
+        
+        while True:
+            try:
+                session = await get_session()
+                async with session.ws_connect(self.url, heartbeat=Config.EXCHANGE_WS_HEARTBEAT_SECONDS) as ws:
+                    received = self.messages_received
+                    await self._subscribe(ws)
+                    await self._read_messages(ws)
+                    self.last_error = f"connection closed ({ws.close_code})"
+                
+                # Only a connection that delivered messages resets the backoff, so a
+                # server that accepts and immediately closes doesn't cause a tight loop
+                if self.messages_received > received:
+                    delay = self.RECONNECT_DELAY
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e) or e.__class__.__name__
+            
+            self.logger.warning(f"WebSocket {self.name} disconnected ({self.last_error}), reconnecting in {delay}s")
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            delay = min(self.MAX_RECONNECT_DELAY, delay * 2)
+    
+    async def _subscribe(self, ws: aiohttp.ClientWebSocketResponse):
+        """Send the subscribe message, resuming after the last seen message."""
+        if not self.subscribe_message:
+            return
+        
+        # Substitute before serializing so the id is JSON-escaped
+        await ws.send_str(json.dumps(self._fill_since(self.subscribe_message)))
+    
+    def _fill_since(self, value):
+        """Replace "{since}" in every string of the subscribe message."""
+        if isinstance(value, str):
+            return value.replace('{since}', self.last_message_id or '')
+        if isinstance(value, dict):
+            return {key: self._fill_since(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._fill_since(item) for item in value]
+        return value
+    
+    async def _read_messages(self, ws: aiohttp.ClientWebSocketResponse):
+        """Convert incoming messages into news items until the socket closes."""
+        async for msg in ws:
+            if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                self.messages_received += 1
+                self.last_error = None
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                if msg.type == aiohttp.WSMsgType.ERROR:
+                    raise ws.exception() or ConnectionError("WebSocket error")
+                continue
+            
+            try:
+                payload = json.loads(msg.data)
+            except ValueError:
+                self.logger.debug(f"Ignoring non-JSON message from {self.name}")
+                continue
+            
+            if not isinstance(payload, dict):
+                continue
+            
+            # Application-level heartbeats
+            if 'ping' in payload or payload.get('type') == 'ping':
+                await ws.send_str(json.dumps({'pong': payload.get('ping', payload.get('ts'))}))
+                continue
+            
+            news_item = self._to_news_item(payload.get('data', payload))
+            if news_item is not None:
+                await self.queue.put(news_item)
+    
+    def _to_news_item(self, data: Dict) -> Optional[NewsItem]:
+        """Convert an announcement message into a news item, skipping ones already seen."""
+        if not isinstance(data, dict) or not data.get('title'):
+            return None
+        
+        message_id = str(data.get('id') or data.get('url') or data['title'])
+        if message_id in self._recent_ids:
+            return None
+        
+        self._recent_ids[message_id] = None
+        if len(self._recent_ids) > self.RECENT_IDS:
+            self._recent_ids.popitem(last=False)
+        self.last_message_id = message_id
+        
+        return NewsItem(
+            title=html_to_text(data['title']),
+            content=html_to_text(data.get('body') or data.get('content') or ''),
+            url=data.get('url') or '',
+            source=self.name,
+            published_date=self._parse_timestamp(data.get('published') or data.get('timestamp')),
+            author=data.get('author')
+        )
+    
+    @staticmethod
+    def _parse_timestamp(value) -> Optional[datetime]:
+        """Parse an epoch (seconds or milliseconds) or ISO timestamp."""
+        if value is None:
+            return None
+        try:
+            if isinstance(value, (int, float)):
+                seconds = value / 1000 if value > 1e11 else value
+                return datetime.fromtimestamp(seconds, tz=timezone.utc)
+            return date_parser.parse(value)
+        except (ValueError, OverflowError, OSError):
+            return None
@@ -0,0 +1,81 @@
+import json
+import re
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+from lxml import etree
+
+from ..utils.helpers import validate_url
+
+def _unique_name(name: str, feeds: Dict[str, str]) -> str:
+    """Make a feed name unique within the feed list."""
+    base = re.sub(r'\s+', '_', name.strip().lower()) or 'feed'
+    candidate = base
+    suffix = 2
+    while candidate in feeds:
+        candidate = f"{base}_{suffix}"
+        suffix += 1
+    return candidate
+
+def load_opml(path: Path) -> Dict[str, str]:
+    """Load feeds from an OPML file (every outline with an xmlUrl)."""
+    parser = etree.XMLParser(resolve_entities=False, no_network=True, recover=True)
+    tree = etree.parse(str(path), parser)
+    
+    feeds = {}
+    for outline in tree.iter('outline'):
+        url = outline.get('xmlUrl')
+        if not url or not validate_url(url):
+            continue
+        name = outline.get('title') or outline.get('text') or url
+        feeds[_unique_name(name, feeds)] = url
+    return feeds
+
+def load_text_list(path: Path) -> Dict[str, str]:
+    """Load feeds from a text file with one 'url' or 'name url' per line."""
+    feeds = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split()
+            url = parts[-1]
+            if not validate_url(url):
+                continue
+            name = ' '.join(parts[:-1]) or url
+            feeds[_unique_name(name, feeds)] = url
+    return feeds
+
+def load_json_list(path: Path) -> Dict[str, str]:
+    """Load feeds from a JSON object of name -> url or a list of urls."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    items = data.items() if isinstance(data, dict) else ((url, url) for url in data)
+    feeds = {}
+    for name, url in items:
+        if validate_url(url):
+            feeds[_unique_name(name, feeds)] = url
+    return feeds
+
+def load_feed_list(path: str, logger: Optional[logging.Logger] = None) -> Dict[str, str]:
+    """Load a feed list from an OPML, JSON or plain text file."""
+    logger = logger or logging.getLogger(__name__)
+    feed_path = Path(path)
+    
+    try:
+        suffix = feed_path.suffix.lower()
+        if suffix in ('.opml', '.xml'):
+            feeds = load_opml(feed_path)
+        elif suffix == '.json':
+            feeds = load_json_list(feed_path)
+        else:
+            feeds = load_text_list(feed_path)
+    except (OSError, ValueError, etree.XMLSyntaxError) as e:
+        logger.error(f"Could not load feed list {path}: {e}")
+        return {}
+    
+    logger.info(f"Loaded {len(feeds)} feeds from {path}")
+    return feeds
@@ -0,0 +1,274 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional
+
+import feedparser
+from dateutil import parser as date_parser
+from lxml import etree
+
+from config import Config
+from ..utils.text_extract import html_to_text
+
+class FeedEntry(NamedTuple):
+    """Lightweight, picklable record for a single parsed feed entry."""
+    title: str
+    content: str
+    url: str
+    published_date: Optional[datetime]
+    author: Optional[str]
+    guid: Optional[str] = None
+
+class ParsedFeed(NamedTuple):
+    """Result of parsing a feed body."""
+    entries: List[FeedEntry]
+    bozo_message: Optional[str]
+    errors: List[str]
+    hub_url: Optional[str] = None
+    self_url: Optional[str] = None
+
+def parse_feed_entries(body: bytes) -> ParsedFeed:
+    """Parse raw feed bytes into entry records.
+
+    Runs inside a worker process, so it only takes and returns plain data.
+    """
+    feed = feedparser.parse(body)
+    bozo_message = str(feed.bozo_exception) if feed.bozo else None
+
+    entries = []
+    errors = []
+
+    for entry in feed.entries:
+        try:
+            # Extract published date
+            published_date = None
+            if hasattr(entry, 'published'):
+                try:
+                    published_date = date_parser.parse(entry.published)
+                except (ValueError, OverflowError):
+                    pass
+
+            # Get content (try different fields)
+            content = ""
+            if hasattr(entry, 'summary'):
+                content = entry.summary
+            elif hasattr(entry, 'description'):
+                content = entry.description
+            elif hasattr(entry, 'content'):
+                if isinstance(entry.content, list) and entry.content:
+                    content = entry.content[0].value
+                else:
+                    content = str(entry.content)
+
+            entries.append(FeedEntry(
+                title=html_to_text(entry.title),
+                content=html_to_text(content),
+                url=entry.link,
+                published_date=published_date,
+                author=getattr(entry, 'author', None),
+                guid=getattr(entry, 'id', None) or entry.link
+            ))
+
+        except Exception as e:
+            errors.append(str(e))
+
+    # WebSub discovery links advertised by the feed
+    links = {link.get('rel'): link.get('href') for link in feed.feed.get('links', [])}
+    
+    return ParsedFeed(entries, bozo_message, errors, links.get('hub'), links.get('self'))
+
+ENTRY_TAGS = {'item', 'entry'}
+DATE_TAGS = ('pubDate', 'published', 'updated', 'date')
+CONTENT_TAGS = ('description', 'summary', 'encoded', 'content')
+
+# GUIDs from the top of the previous pass kept as stop markers, so a deleted
+# or reordered newest entry doesn't force a full parse
+HIGH_WATER_GUIDS = 20
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse a feed date, treating naive timestamps as UTC."""
+    if not value:
+        return None
+    try:
+        parsed = date_parser.parse(value)
+    except (ValueError, OverflowError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+def _inner_markup(elem) -> str:
+    """Text of an element including its child markup (Atom type="xhtml" content)."""
+    if len(elem) == 0:
+        return elem.text or ''
+    return (elem.text or '') + ''.join(
+        etree.tostring(child, encoding='unicode', with_tail=True) for child in elem
+    )
+
+class StreamingFeedParser:
+    """Incremental RSS/Atom parser that stops at the last-seen entry.
+
+    Feed bytes are pushed in chunks as they arrive. Parsing stops as soon
+    as an entry's GUID/link is one of the GUIDs recorded at the top of the
+    feed on the previous pass, so work per poll scales with the number of
+    new entries. Publish dates are not used to stop: feeds don't reliably
+    list entries newest first. feed() does CPU-bound parsing and should be
+    called off the event loop.
+    """
+    
+    def __init__(self, high_water: Optional[Dict] = None):
+        high_water = high_water or {}
+        self.seen_guids: List[str] = high_water.get('guids') or (
+            [high_water['guid']] if high_water.get('guid') else []
+        )
+        self._stop_guids = set(self.seen_guids)
+        self.entries: List[FeedEntry] = []
+        self.errors: List[str] = []
+        self.hub_url: Optional[str] = None
+        self.self_url: Optional[str] = None
+        self.done = False
+        self._parser = etree.XMLPullParser(
+            events=('end',),
+            recover=True,
+            resolve_entities=False,
+            no_network=True
+        )
+    
+    def feed(self, chunk: bytes) -> bool:
+        """Feed a chunk of bytes; returns True once no more data is needed."""
+        if self.done:
+            return True
+        
+        self._parser.feed(chunk)
+        
+        for _, elem in self._parser.read_events():
+            if not isinstance(elem.tag, str):
+                continue
+            
+            name = etree.QName(elem).localname
+            if name == 'link' and elem.get('rel') in ('hub', 'self'):
+                # Feed-level WebSub discovery links (entry links are read with their entry)
+                parent = elem.getparent()
+                if parent is not None and etree.QName(parent).localname not in ENTRY_TAGS:
+                    setattr(self, f"{elem.get('rel')}_url", elem.get('href'))
+                continue
+            
+            if name not in ENTRY_TAGS:
+                continue
+            
+            try:
+                entry = self._entry_from_element(elem)
+            except Exception as e:
+                self.errors.append(str(e))
+                entry = None
+            
+            # Free the parsed subtree and anything before it
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+            
+            if entry is None:
+                continue
+            
+            if self._is_seen(entry):
+                self.done = True
+                break
+            
+            self.entries.append(entry)
+        
+        return self.done
+    
+    def close(self):
+        """Finish parsing whatever is buffered."""
+        if not self.done:
+            try:
+                self._parser.close()
+            except etree.XMLSyntaxError as e:
+                self.errors.append(str(e))
+            self.done = True
+    
+    def high_water(self) -> Optional[Dict]:
+        """Stop markers for the next pass: the newest GUIDs, then the previous markers."""
+        if not self.entries:
+            return None
+        guids = [entry.guid for entry in self.entries[:HIGH_WATER_GUIDS]]
+        guids += [guid for guid in self.seen_guids if guid not in guids]
+        return {'guids': guids[:HIGH_WATER_GUIDS]}
+    
+    def _is_seen(self, entry: FeedEntry) -> bool:
+        """Check whether an entry was at the top of the feed on the previous pass."""
+        return entry.guid in self._stop_guids
+    
+    @staticmethod
+    def _entry_from_element(elem) -> Optional[FeedEntry]:
+        """Build an entry record from an <item> or <entry> element."""
+        fields = {}
+        link = None
+        
+        for child in elem:
+            if not isinstance(child.tag, str):
+                continue
+            name = etree.QName(child).localname
+            
+            if name == 'link':
+                # Atom uses <link href="..." rel="alternate"/>, RSS uses text
+                href = child.get('href')
+                if href and child.get('rel', 'alternate') == 'alternate':
+                    link = link or href
+                elif child.text and not href:
+                    link = link or child.text.strip()
+            elif name == 'author':
+                author_name = child.findtext('{*}name')
+                fields.setdefault('author', (author_name or child.text or '').strip())
+            elif name == 'creator':
+                fields.setdefault('author', (child.text or '').strip())
+            elif name not in fields:
+                fields[name] = _inner_markup(child)
+        
+        title = fields.get('title', '').strip()
+        if not title or not link:
+            return None
+        
+        published_date = None
+        for tag in DATE_TAGS:
+            published_date = _parse_date(fields.get(tag))
+            if published_date:
+                break
+        
+        content = ''
+        for tag in CONTENT_TAGS:
+            if fields.get(tag):
+                content = fields[tag]
+                break
+        
+        guid = (fields.get('guid') or fields.get('id') or '').strip() or link
+        
+        return FeedEntry(
+            title=html_to_text(title),
+            content=html_to_text(content),
+            url=link,
+            published_date=published_date,
+            author=fields.get('author') or None,
+            guid=guid
+        )
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+def get_executor() -> Optional[ProcessPoolExecutor]:
+    """Get or create the shared parse process pool (None when disabled)."""
+    global _executor
+    if _executor is None and Config.FEED_PARSER_WORKERS > 0:
+        _executor = ProcessPoolExecutor(max_workers=Config.FEED_PARSER_WORKERS)
+    return _executor
+
+async def parse_feed(body: bytes) -> ParsedFeed:
+    """Parse a feed body off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), parse_feed_entries, body)
+
+def shutdown_executor():
+    """Shut down the parse process pool."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
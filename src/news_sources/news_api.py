@@ -1,12 +1,17 @@
 import asyncio
+import json
 import aiohttp
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
 import logging
 from dateutil import parser as date_parser
 
 from .base import BaseNewsSource, NewsItem
 from config import Config
+from ..utils.rate_limiter import TokenBucket
+from ..utils.state_cache import StateCache
+from ..utils.text_extract import html_to_text
+from ..utils.transport import get_session, get_timeout, read_limited
 
 class NewsAPISource(BaseNewsSource):
     """NewsAPI.org news source implementation."""
@@ -15,18 +20,19 @@ class NewsAPISource(BaseNewsSource):
         super().__init__("NewsAPI", logger)
         self.api_key = Config.NEWS_API_KEY
         self.base_url = "https://newsapi.org/v2"
-        self.session = None
+        self.headers = {
+            'X-API-Key': self.api_key or ''
+        }
+        self.queries = Config.NEWS_API_QUERIES
+        self.state_cache = StateCache(Config.NEWS_API_STATE_FILE, self.logger)
+        self.rate_limiter = TokenBucket.per_day(
+            Config.NEWS_API_REQUESTS_PER_DAY,
+            Config.NEWS_API_BURST
+        )
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self.session is None or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=30)
-            headers = {
-                'X-API-Key': self.api_key,
-                'User-Agent': 'CryptoAlertSystem/1.0'
-            }
-            self.session = aiohttp.ClientSession(timeout=timeout, headers=headers)
-        return self.session
+        """Get the shared pooled aiohttp session."""
+        return await get_session()
     
     async def fetch_news(self) -> List[NewsItem]:
         """Fetch crypto-related news from NewsAPI."""
@@ -34,22 +40,28 @@ class NewsAPISource(BaseNewsSource):
             self.logger.warning("NewsAPI key not configured, skipping")
             return []
         
+        if not self.breaker.allow_request():
+            self.last_error = "circuit open"
+            self.logger.debug("Skipping NewsAPI: circuit open")
+            return []
+        
+        self.last_error = None
+        self.last_publish_times = []
         try:
-            # Search for crypto-related news
-            crypto_queries = [
-                'cryptocurrency OR bitcoin OR ethereum',
-                'crypto regulation OR SEC bitcoin',
-                'blockchain OR DeFi OR NFT'
-            ]
+            # Run all queries concurrently; the token bucket enforces the plan quota
+            results = await asyncio.gather(
+                *(self._fetch_query(query) for query in self.queries),
+                return_exceptions=True
+            )
             
             all_news = []
             
-            for query in crypto_queries:
-                news_items = await self._fetch_query(query)
-                all_news.extend(news_items)
-                
-                # Small delay between queries to respect rate limits
-                await asyncio.sleep(1)
+            for query, result in zip(self.queries, results):
+                if isinstance(result, Exception):
+                    self.last_error = str(result) or result.__class__.__name__
+                    self.logger.error(f"NewsAPI query '{query}' failed: {result}")
+                else:
+                    all_news.extend(result)
             
             # Remove duplicates based on URL
             seen_urls = set()
@@ -60,80 +72,249 @@ class NewsAPISource(BaseNewsSource):
                     unique_news.append(item)
             
             self.logger.info(f"Fetched {len(unique_news)} unique items from NewsAPI")
+            
+            if self.last_error:
+                self.breaker.record_failure(self.last_error)
+            else:
+                self.breaker.record_success()
+            
+            # Persist per-query watermarks so restarts resume where we left off
+            self.state_cache.save()
+            
             return unique_news
             
         except Exception as e:
+            self.last_error = str(e) or e.__class__.__name__
+            self.breaker.record_failure(self.last_error)
             self.logger.error(f"Error fetching from NewsAPI: {e}")
             return []
     
     async def _fetch_query(self, query: str) -> List[NewsItem]:
-        """Fetch news for a specific query."""
-        session = await self._get_session()
+        """Fetch articles for a query published since its watermark, paging as needed.
+        
+        The watermark only advances when the walk got back to it (or ran out
+        of results), so a failed page is retried from the old watermark next
+        time instead of leaving a gap.
+        """
+        now = datetime.now(timezone.utc)
+        state = self.state_cache.get(query)
+        watermark = self._parse_timestamp(state.get('watermark'))
+        watermark_urls = set(state.get('watermark_urls', []))
+        last_fetch = self._parse_timestamp(state.get('last_fetch'))
+        backfill_floor = now - timedelta(hours=Config.NEWS_API_BACKFILL_HOURS)
         
-        # Get news from last 24 hours
-        from_date = (datetime.now() - timedelta(hours=24)).strftime('%Y-%m-%d')
+        if watermark is None:
+            # First run: look back over the initial window
+            from_date = now - timedelta(hours=Config.MAX_NEWS_AGE_HOURS)
+            max_pages = Config.NEWS_API_MAX_PAGES
+        elif last_fetch is None or last_fetch < now - timedelta(seconds=Config.POLL_MAX_INTERVAL_SECONDS * 2):
+            # We haven't fetched for a while: catch up, bounded by the backfill window
+            from_date = max(watermark, backfill_floor)
+            max_pages = Config.NEWS_API_BACKFILL_MAX_PAGES
+            self.logger.info(f"NewsAPI backfilling '{query}' from {from_date.isoformat()}")
+        else:
+            from_date = watermark
+            max_pages = Config.NEWS_API_MAX_PAGES
         
         params = {
             'q': query,
-            'from': from_date,
+            'from': from_date.strftime('%Y-%m-%dT%H:%M:%S'),
             'sortBy': 'publishedAt',
             'language': 'en',
-            'pageSize': 20  # Max 20 articles per query
+            'pageSize': Config.NEWS_API_PAGE_SIZE
         }
         
+        new_articles = []
+        complete = False
+        
+        for page in range(1, max_pages + 1):
+            data = await self._request({**params, 'page': page})
+            if data is None:
+                break
+            
+            articles = data.get('articles', [])
+            page_articles, reached_watermark = self._split_at_watermark(articles, watermark, watermark_urls)
+            new_articles.extend(page_articles)
+            
+            # Results are newest first, so stop once we're back at the watermark
+            if (
+                reached_watermark
+                or len(articles) < Config.NEWS_API_PAGE_SIZE
+                or page * Config.NEWS_API_PAGE_SIZE >= data.get('totalResults', 0)
+            ):
+                complete = True
+                break
+        else:
+            # Advance anyway so the next poll doesn't repeat the same pages; the gap is bounded
+            complete = True
+            if watermark is not None:
+                self.logger.warning(
+                    f"NewsAPI query '{query}' hit the {max_pages}-page limit before its watermark; "
+                    f"older articles were skipped"
+                )
+        
+        if complete:
+            self._advance_watermark(query, new_articles, watermark, watermark_urls, now)
+        else:
+            self.logger.warning(f"NewsAPI query '{query}' stopped early; keeping its watermark for the next poll")
+        
+        return self._parse_articles(new_articles)
+    
+    def _advance_watermark(
+        self,
+        query: str,
+        articles: List[Dict],
+        watermark: Optional[datetime],
+        watermark_urls: Set[str],
+        fetched_at: datetime
+    ):
+        """Move the watermark to the newest article, remembering every URL published at that instant."""
+        newest, newest_urls = watermark, set(watermark_urls)
+        for article in articles:
+            published = self._parse_timestamp(article.get('publishedAt'))
+            if not published:
+                continue
+            if newest is None or published > newest:
+                newest, newest_urls = published, set()
+            if published == newest and article.get('url'):
+                newest_urls.add(article['url'])
+        
+        fields = {'last_fetch': fetched_at.isoformat()}
+        if newest:
+            fields.update(watermark=newest.isoformat(), watermark_urls=sorted(newest_urls))
+        self.state_cache.update(query, **fields)
+    
+    def _split_at_watermark(
+        self,
+        articles: List[Dict],
+        watermark: Optional[datetime],
+        watermark_urls: Set[str]
+    ) -> Tuple[List[Dict], bool]:
+        """Keep articles not yet seen; report whether the walk got back to the watermark.
+        
+        Articles published in the watermark's own second are kept unless their
+        URL was already fetched, since timestamps only have second precision.
+        """
+        new_articles = []
+        reached = False
+        
+        for article in articles:
+            published = self._parse_timestamp(article.get('publishedAt'))
+            if published and watermark:
+                if published < watermark:
+                    reached = True
+                    continue
+                if published == watermark and article.get('url') in watermark_urls:
+                    reached = True
+                    continue
+            new_articles.append(article)
+        
+        return new_articles, reached
+    
+    @staticmethod
+    def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+        """Parse an ISO timestamp as timezone-aware UTC."""
+        if not value:
+            return None
+        try:
+            parsed = date_parser.parse(value)
+        except (ValueError, OverflowError):
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc)
+    
+    async def _request(self, params: Dict) -> Optional[Dict]:
+        """Make a rate-limited request to /everything, honouring Retry-After on 429."""
+        session = await self._get_session()
         url = f"{self.base_url}/everything"
         
-        async with session.get(url, params=params) as response:
-            if response.status != 200:
-                error_text = await response.text()
-                self.logger.error(f"NewsAPI request failed: {response.status} - {error_text}")
-                return []
+        for attempt in range(Config.NEWS_API_MAX_RETRIES + 1):
+            await self.rate_limiter.acquire()
             
-            data = await response.json()
+            async with session.get(
+                url,
+                params=params,
+                headers=self.headers,
+                timeout=get_timeout('api')
+            ) as response:
+                if response.status == 429 and attempt < Config.NEWS_API_MAX_RETRIES:
+                    retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+                    self.logger.warning(f"NewsAPI rate limited, retrying in {retry_after:.0f}s")
+                    self.rate_limiter.pause(retry_after)
+                    continue
+                
+                body = await read_limited(response, Config.NEWS_API_MAX_BODY_BYTES)
+                
+                if response.status != 200:
+                    error_text = body.decode('utf-8', errors='replace')
+                    self.last_error = f"HTTP {response.status}"
+                    self.logger.error(f"NewsAPI request failed: {response.status} - {error_text}")
+                    return None
+            
+            data = json.loads(body)
             
             if data['status'] != 'ok':
+                self.last_error = data.get('message', 'Unknown error')
                 self.logger.error(f"NewsAPI error: {data.get('message', 'Unknown error')}")
-                return []
-            
-            news_items = []
+                return None
             
-            for article in data['articles']:
+            return data
+        
+        return None
+    
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> float:
+        """Parse a Retry-After header (seconds or HTTP date)."""
+        if value:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
                 try:
-                    # Skip articles without content
-                    if not article.get('title') or not article.get('description'):
-                        continue
-                    
-                    # Parse published date
-                    published_date = None
-                    if article.get('publishedAt'):
-                        try:
-                            published_date = date_parser.parse(article['publishedAt'])
-                        except:
-                            pass
-                    
-                    # Combine description and content
-                    content = article.get('description', '')
-                    if article.get('content'):
-                        content += f" {article['content']}"
-                    
-                    news_item = NewsItem(
-                        title=article['title'],
-                        content=content,
-                        url=article['url'],
-                        source=f"NewsAPI-{article.get('source', {}).get('name', 'Unknown')}",
-                        published_date=published_date,
-                        author=article.get('author')
-                    )
-                    
-                    news_items.append(news_item)
-                    
-                except Exception as e:
-                    self.logger.error(f"Error parsing NewsAPI article: {e}")
-                    continue
-            
-            return news_items
+                    retry_at = date_parser.parse(value)
+                    return max(0.0, (retry_at - datetime.now(retry_at.tzinfo)).total_seconds())
+                except (ValueError, OverflowError):
+                    pass
+        return float(Config.NEWS_API_DEFAULT_RETRY_AFTER)
     
-    async def close(self):
-        """Close the aiohttp session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+    def _parse_articles(self, articles: List[Dict]) -> List[NewsItem]:
+        """Convert NewsAPI articles into news items."""
+        news_items = []
+        
+        for article in articles:
+            try:
+                # Skip articles without content
+                if not article.get('title') or not article.get('description'):
+                    continue
+                
+                # Parse published date
+                published_date = None
+                if article.get('publishedAt'):
+                    try:
+                        published_date = date_parser.parse(article['publishedAt'])
+                    except:
+                        pass
+                if published_date:
+                    self.last_publish_times.append(published_date)
+                
+                # Combine description and content
+                content = article.get('description', '')
+                if article.get('content'):
+                    content += f" {article['content']}"
+                
+                news_item = NewsItem(
+                    title=html_to_text(article['title']),
+                    content=html_to_text(content),
+                    url=article['url'],
+                    source=f"NewsAPI-{article.get('source', {}).get('name', 'Unknown')}",
+                    published_date=published_date,
+                    author=article.get('author')
+                )
+                
+                news_items.append(news_item)
+                
+            except Exception as e:
+                self.logger.error(f"Error parsing NewsAPI article: {e}")
+                continue
+        
+        return news_items
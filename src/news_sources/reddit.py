@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import logging
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from .base import StreamingNewsSource, NewsItem
+from config import Config
+
+class RedditSource(StreamingNewsSource):
+    """Streams new submissions from the configured subreddits.
+    
+    praw is synchronous, so a dedicated thread follows a single multireddit
+    listing (r/a+b+c) and hands items to the event loop through the bounded
+    queue. When the queue is full the thread blocks, so praw stops pulling
+    until the consumer catches up.
+    """
+    
+    # Seconds to wait before reconnecting after a stream error (doubles up to the max)
+    RETRY_DELAY = 5
+    MAX_RETRY_DELAY = 300
+    
+    def __init__(self, logger: Optional[logging.Logger] = None, subreddits: Optional[List[str]] = None):
+        super().__init__("Reddit", logger, queue_size=Config.REDDIT_QUEUE_SIZE)
+        self.subreddits = subreddits or Config.REDDIT_SUBREDDITS
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+    
+    async def start(self):
+        """Start the background streaming thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        
+        self._loop = asyncio.get_running_loop()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="reddit-stream", daemon=True)
+        self._thread.start()
+        self.logger.info(f"👽 Streaming Reddit submissions from {len(self.subreddits)} subreddits")
+    
+    async def stop(self):
+        """Stop the streaming thread."""
+        self._stop_event.set()
+        if self._thread:
+            await asyncio.get_running_loop().run_in_executor(None, self._thread.join, 10)
+    
+    def _run(self):
+        """Thread body: follow the multireddit stream, reconnecting on errors."""
+        import praw
+        
+        retry_delay = self.RETRY_DELAY
+        
+        # Backlog is skipped only on the first connect; after a reconnect the stream
+        # replays recent submissions so nothing posted during the outage is lost,
+        # and the dedup window and seen-store drop the ones already handled
+        skip_existing = True
+        
+        while not self._stop_event.is_set():
+            try:
+                reddit = praw.Reddit(
+                    client_id=Config.REDDIT_CLIENT_ID,
+                    client_secret=Config.REDDIT_CLIENT_SECRET,
+                    user_agent=Config.REDDIT_USER_AGENT
+                )
+                multireddit = reddit.subreddit('+'.join(self.subreddits))
+                
+                # pause_after=0 yields None after every empty poll so we can check for stop
+                stream = multireddit.stream.submissions(skip_existing=skip_existing, pause_after=0)
+                skip_existing = False
+                for submission in stream:
+                    if self._stop_event.is_set():
+                        break
+                    if submission is None:
+                        continue
+                    
+                    self.last_error = None
+                    retry_delay = self.RETRY_DELAY
+                    self._put(self._to_news_item(submission))
+            
+            except Exception as e:
+                self.last_error = str(e) or e.__class__.__name__
+                self.logger.error(f"Reddit stream error, reconnecting in {retry_delay}s: {e}")
+                self._stop_event.wait(retry_delay)
+                retry_delay = min(self.MAX_RETRY_DELAY, retry_delay * 2)
+    
+    def _put(self, news_item: NewsItem):
+        """Hand an item to the event loop, blocking while the queue is full."""
+        future = asyncio.run_coroutine_threadsafe(self.queue.put(news_item), self._loop)
+        while not self._stop_event.is_set():
+            try:
+                future.result(timeout=1)
+                return
+            except FutureTimeoutError:
+                continue
+        future.cancel()
+    
+    def _to_news_item(self, submission) -> NewsItem:
+        """Convert a praw submission into a news item."""
+        return NewsItem(
+            title=submission.title,
+            content=submission.selftext or submission.url,
+            url=f"https://www.reddit.com{submission.permalink}",
+            source=f"reddit-r/{submission.subreddit.display_name}",
+            published_date=datetime.fromtimestamp(submission.created_utc, tz=timezone.utc),
+            author=str(submission.author) if submission.author else None
+        )
@@ -1,104 +1,225 @@
 import asyncio
+import hashlib
 import aiohttp
-import feedparser
 from datetime import datetime
 from typing import List, Dict, Optional
 import logging
-from dateutil import parser as date_parser
 
 from .base import BaseNewsSource, NewsItem
+from .feed_parser import FeedEntry, StreamingFeedParser, parse_feed
+from .feed_list import load_feed_list
 from config import Config
+from ..utils.circuit_breaker import host_breakers
+from ..utils.helpers import extract_domain
+from ..utils.state_cache import StateCache
+from ..utils.transport import ResponseTooLarge, get_session, get_timeout, read_limited
+
+# Failures that count against the whole host rather than just one feed
+NETWORK_ERRORS = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
 
 class RSSFeedSource(BaseNewsSource):
     """RSS feed news source implementation."""
     
-    def __init__(self, name: str, feed_url: str, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        name: str,
+        feed_url: str,
+        logger: Optional[logging.Logger] = None,
+        state_cache: Optional[StateCache] = None,
+        max_body_bytes: Optional[int] = None
+    ):
         super().__init__(name, logger)
         self.feed_url = feed_url
-        self.session = None
+        self.host = extract_domain(feed_url)
+        self.state_cache = state_cache
+        self.max_body_bytes = max_body_bytes or Config.RSS_MAX_BODY_BYTES
+        
+        # WebSub hub and canonical topic URL, if the feed advertises them
+        self.hub_url: Optional[str] = None
+        self.topic_url: Optional[str] = None
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self.session is None or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
-        return self.session
+        """Get the shared pooled aiohttp session."""
+        return await get_session()
     
     async def fetch_news(self) -> List[NewsItem]:
         """Fetch news from RSS feed."""
+        self.last_error = None
+        self.last_publish_times = []
+        
+        # Don't spend a connection slot and timeout on a feed or host that keeps failing
+        host_breaker = host_breakers.get(self.host)
+        if not (self.breaker.allow_request() and host_breaker.allow_request()):
+            self.last_error = "circuit open"
+            self.logger.debug(f"Skipping RSS feed {self.name}: circuit open")
+            return []
+        
         try:
             session = await self._get_session()
             
-            async with session.get(self.feed_url) as response:
+            # Conditional GET using validators from the previous fetch
+            validators = self.state_cache.get(self.feed_url) if self.state_cache else {}
+            headers = {}
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+            
+            async with session.get(self.feed_url, headers=headers, timeout=get_timeout('feed')) as response:
+                if response.status == 304:
+                    self._record_success()
+                    self.logger.debug(f"RSS feed {self.name} not modified")
+                    return []
+                
                 if response.status != 200:
+                    # Server errors count against the whole host, others only this feed
+                    self._record_failure(f"HTTP {response.status}", host_failure=response.status >= 500)
                     self.logger.error(f"Failed to fetch RSS feed {self.name}: HTTP {response.status}")
                     return []
                 
-                content = await response.text()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                
+                if Config.RSS_STREAMING_PARSE:
+                    return await self._stream_new_entries(response, validators, etag, last_modified)
                 
-            # Parse RSS feed
-            feed = feedparser.parse(content)
+                body = await read_limited(response, self.max_body_bytes)
+            
+            # Skip parsing when the body is byte-identical to the last one
+            digest = hashlib.sha1(body).hexdigest()
+            if digest == validators.get('digest'):
+                self._update_validators(etag, last_modified, digest)
+                self._record_success()
+                self.logger.debug(f"RSS feed {self.name} body unchanged, skipping parse")
+                return []
+            
+            # Parse off the event loop in the parser process pool
+            parsed = await parse_feed(body)
+            
+            # Only remember validators once the body was parsed, so a failed parse is retried
+            self._update_validators(etag, last_modified, digest)
+            self._record_success()
             
-            if feed.bozo:
-                self.logger.warning(f"RSS feed {self.name} has parsing issues: {feed.bozo_exception}")
+            if parsed.bozo_message:
+                self.logger.warning(f"RSS feed {self.name} has parsing issues: {parsed.bozo_message}")
             
-            news_items = []
+            for error in parsed.errors:
+                self.logger.error(f"Error parsing RSS entry from {self.name}: {error}")
             
-            for entry in feed.entries:
-                try:
-                    # Extract published date
-                    published_date = None
-                    if hasattr(entry, 'published'):
-                        try:
-                            published_date = date_parser.parse(entry.published)
-                        except:
-                            pass
-                    
-                    # Get content (try different fields)
-                    content = ""
-                    if hasattr(entry, 'summary'):
-                        content = entry.summary
-                    elif hasattr(entry, 'description'):
-                        content = entry.description
-                    elif hasattr(entry, 'content'):
-                        if isinstance(entry.content, list) and entry.content:
-                            content = entry.content[0].value
-                        else:
-                            content = str(entry.content)
-                    
-                    # Clean HTML tags from content
-                    import re
-                    content = re.sub(r'<[^>]+>', '', content)
-                    
-                    # Get author
-                    author = getattr(entry, 'author', None)
-                    
-                    news_item = NewsItem(
-                        title=entry.title,
-                        content=content,
-                        url=entry.link,
-                        source=self.name,
-                        published_date=published_date,
-                        author=author
-                    )
-                    
-                    news_items.append(news_item)
-                    
-                except Exception as e:
-                    self.logger.error(f"Error parsing RSS entry from {self.name}: {e}")
-                    continue
+            self._set_discovery_links(parsed.hub_url, parsed.self_url)
+            
+            self._record_publish_times(parsed.entries)
+            news_items = self.to_news_items(parsed.entries)
             
             self.logger.info(f"Fetched {len(news_items)} items from RSS feed: {self.name}")
             return news_items
             
-        except Exception as e:
+        except ResponseTooLarge as e:
+            self._record_failure(str(e))
+            self.logger.error(f"RSS feed {self.name} is too large: {e}")
+            return []
+            
+        except NETWORK_ERRORS as e:
+            # Connection problems and timeouts are likely to affect every feed on the host
+            self._record_failure(str(e) or e.__class__.__name__, host_failure=True)
             self.logger.error(f"Error fetching RSS feed {self.name}: {e}")
             return []
+            
+        except Exception as e:
+            self._record_failure(str(e) or e.__class__.__name__)
+            self.logger.error(f"Error processing RSS feed {self.name}: {e}")
+            return []
+    
+    def _update_validators(self, etag: Optional[str], last_modified: Optional[str], digest: str):
+        """Store the validators for conditional requests on the next poll."""
+        if self.state_cache:
+            self.state_cache.update(
+                self.feed_url,
+                etag=etag,
+                last_modified=last_modified,
+                digest=digest
+            )
+    
+    def _record_success(self):
+        """Close the feed and host circuit breakers after a good response."""
+        self.breaker.record_success()
+        host_breakers.get(self.host).record_success()
     
-    async def close(self):
-        """Close the aiohttp session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+    def _record_failure(self, error: str, host_failure: bool = False):
+        """Record a failed fetch against the feed (and optionally host) breaker."""
+        self.last_error = error
+        self.breaker.record_failure(error)
+        if host_failure:
+            host_breakers.get(self.host).record_failure(error)
+        if self.breaker.state == self.breaker.OPEN:
+            self.logger.warning(f"Circuit opened for RSS feed {self.name} after {self.breaker.failures} failures")
+    
+    async def _stream_new_entries(
+        self,
+        response: aiohttp.ClientResponse,
+        validators: Dict,
+        etag: Optional[str],
+        last_modified: Optional[str]
+    ) -> List[NewsItem]:
+        """Parse the response stream until the last-seen entry is reached."""
+        parser = StreamingFeedParser(validators.get('high_water'))
+        bytes_read = 0
+        
+        # The parser keeps state between chunks, so it can't move to the parser
+        # process pool; chunks are parsed in a thread instead (lxml releases the GIL)
+        loop = asyncio.get_running_loop()
+        async for chunk in response.content.iter_chunked(Config.RSS_STREAM_CHUNK_SIZE):
+            bytes_read += len(chunk)
+            if bytes_read > self.max_body_bytes:
+                raise ResponseTooLarge(f"Response body exceeds {self.max_body_bytes} bytes")
+            if await loop.run_in_executor(None, parser.feed, chunk):
+                break
+        await loop.run_in_executor(None, parser.close)
+        
+        self._record_success()
+        
+        for error in parser.errors:
+            self.logger.warning(f"RSS feed {self.name} has parsing issues: {error}")
+        
+        self._set_discovery_links(parser.hub_url, parser.self_url)
+        
+        if self.state_cache:
+            self.state_cache.update(self.feed_url, etag=etag, last_modified=last_modified)
+            high_water = parser.high_water()
+            if high_water:
+                self.state_cache.update(self.feed_url, high_water=high_water)
+        
+        self._record_publish_times(parser.entries)
+        news_items = self.to_news_items(parser.entries)
+        
+        self.logger.info(
+            f"Fetched {len(news_items)} new items from RSS feed: {self.name} ({bytes_read} bytes read)"
+        )
+        return news_items
+    
+    def _record_publish_times(self, entries: List[FeedEntry]):
+        """Remember the feed's own entry timestamps; undated entries are skipped."""
+        self.last_publish_times = [entry.published_date for entry in entries if entry.published_date]
+    
+    def _set_discovery_links(self, hub_url: Optional[str], self_url: Optional[str]):
+        """Remember the WebSub hub and topic advertised by the feed."""
+        if hub_url:
+            self.hub_url = hub_url
+            self.topic_url = self_url or self.feed_url
+    
+    def to_news_items(self, entries: List[FeedEntry]) -> List[NewsItem]:
+        """Convert parsed entry records into news items for this source."""
+        return [
+            NewsItem(
+                title=entry.title,
+                content=entry.content,
+                url=entry.url,
+                source=self.name,
+                published_date=entry.published_date,
+                author=entry.author
+            )
+            for entry in entries
+        ]
 
 class RSSFeedManager:
     """Manages multiple RSS feed sources."""
@@ -106,37 +227,76 @@ class RSSFeedManager:
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
         self.sources = []
+        self.state_cache = StateCache(Config.FEED_STATE_FILE, self.logger)
+        
+        # Global and per-host limits on in-flight feed fetches
+        self._semaphore = asyncio.Semaphore(Config.RSS_MAX_CONCURRENCY)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
         
-        # Initialize RSS sources from config
-        for name, url in Config.RSS_FEEDS.items():
-            source = RSSFeedSource(name, url, self.logger)
+        # Initialize RSS sources from the feed list file, or the built-in feeds
+        feeds = Config.RSS_FEEDS
+        if Config.RSS_FEED_LIST_FILE:
+            feeds = load_feed_list(Config.RSS_FEED_LIST_FILE, self.logger) or feeds
+        
+        for name, url in feeds.items():
+            source = RSSFeedSource(name, url, self.logger, self.state_cache)
             self.sources.append(source)
     
+    async def _fetch_limited(self, source: RSSFeedSource) -> List[NewsItem]:
+        """Fetch a source while holding the global and per-host concurrency slots."""
+        host_semaphore = self._host_semaphores.get(source.host)
+        if host_semaphore is None:
+            host_semaphore = asyncio.Semaphore(Config.RSS_MAX_CONCURRENCY_PER_HOST)
+            self._host_semaphores[source.host] = host_semaphore
+        
+        async with host_semaphore:
+            async with self._semaphore:
+                return await source.fetch_news()
+    
+    async def fetch_source_news(self, source: RSSFeedSource) -> List[NewsItem]:
+        """Fetch and filter news from a single RSS source."""
+        news_items = await self._fetch_limited(source)
+        relevant_items = await source.filter_relevant_news(news_items, Config.CRYPTO_KEYWORDS)
+        
+        # Persist validators so restarts keep using conditional requests; with
+        # hundreds of feeds polled separately, rewrite the file at most once per interval
+        self.state_cache.save_if_due(Config.FEED_STATE_SAVE_INTERVAL_SECONDS)
+        
+        return relevant_items
+    
     async def fetch_all_news(self) -> List[NewsItem]:
         """Fetch news from all RSS sources."""
-        all_news = []
-        
-        # Fetch from all sources concurrently
-        tasks = [source.fetch_news() for source in self.sources]
+        # Fetch from all sources concurrently, within the concurrency limits
+        tasks = [self._fetch_limited(source) for source in self.sources]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                self.logger.error(f"Error fetching from {self.sources[i].name}: {result}")
-            else:
-                all_news.extend(result)
-        
-        # Filter for crypto relevance
+        # Results line up with sources, so filter each source's items directly
         relevant_news = []
-        for source in self.sources:
-            source_news = [item for item in all_news if item.source == source.name]
-            relevant_items = source.filter_relevant_news(source_news, Config.CRYPTO_KEYWORDS)
+        for source, result in zip(self.sources, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error fetching from {source.name}: {result}")
+                continue
+            relevant_items = await source.filter_relevant_news(result, Config.CRYPTO_KEYWORDS)
             relevant_news.extend(relevant_items)
         
         self.logger.info(f"Found {len(relevant_news)} relevant news items from RSS feeds")
+        
+        # Persist validators so restarts keep using conditional requests
+        self.state_cache.save()
+        
         return relevant_news
     
+    def get_breaker_states(self) -> Dict[str, Dict]:
+        """Get circuit breaker states for every feed and host."""
+        return {
+            'sources': {source.name: source.get_breaker_state() for source in self.sources},
+            'hosts': host_breakers.get_states()
+        }
+    
+    def get_dedup_stats(self) -> Dict[str, Dict]:
+        """Get dedup statistics for every feed."""
+        return {source.name: source.get_dedup_stats() for source in self.sources}
+    
     async def close_all(self):
-        """Close all RSS source sessions."""
-        for source in self.sources:
-            await source.close()
+        """Persist feed state (the shared session is closed by the transport)."""
+        self.state_cache.save()
@@ -0,0 +1,163 @@
+import asyncio
+import random
+import time
+import logging
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from .base import BaseNewsSource, NewsItem
+from config import Config
+
+class FeedSchedule:
+    """Polling state for a single source."""
+    
+    def __init__(self, source: BaseNewsSource, poll: Callable[[], Awaitable[List[NewsItem]]], interval: float):
+        self.source = source
+        self.poll = poll
+        self.interval = interval
+        self.cadence: Optional[float] = None
+        self.last_published: Optional[datetime] = None
+        self.consecutive_errors = 0
+        self.next_due = time.monotonic()
+    
+    def to_dict(self) -> Dict:
+        """Convert schedule state to dictionary."""
+        return {
+            'interval_seconds': round(self.interval, 1),
+            'cadence_seconds': round(self.cadence, 1) if self.cadence else None,
+            'consecutive_errors': self.consecutive_errors,
+            'next_poll_in_seconds': round(max(0, self.next_due - time.monotonic()), 1)
+        }
+
+class AdaptiveScheduler:
+    """Polls each source independently at an interval learned from its publish cadence."""
+    
+    # Weight given to the newest cadence sample in the moving average
+    CADENCE_SMOOTHING = 0.3
+    
+    # Growth factor applied to the interval after a poll with nothing new
+    IDLE_BACKOFF = 1.25
+    
+    # Cap on the error backoff exponent
+    MAX_BACKOFF_EXPONENT = 8
+    
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger(__name__)
+        self.min_interval = Config.POLL_MIN_INTERVAL_SECONDS
+        self.max_interval = Config.POLL_MAX_INTERVAL_SECONDS
+        self.schedules: List[FeedSchedule] = []
+        self._stop_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def add(self, source: BaseNewsSource, poll: Optional[Callable[[], Awaitable[List[NewsItem]]]] = None):
+        """Register a source; poll defaults to source.fetch_news."""
+        interval = self._clamp(Config.CHECK_INTERVAL_MINUTES * 60)
+        self.schedules.append(FeedSchedule(source, poll or source.fetch_news, interval))
+    
+    async def run(self, handler: Callable[[List[NewsItem]], Awaitable]):
+        """Poll all sources until stop() is called, passing new items to handler."""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        
+        tasks = [asyncio.create_task(self._run_source(schedule, handler)) for schedule in self.schedules]
+        try:
+            await self._stop_event.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def stop(self):
+        """Stop polling (safe to call from a signal handler)."""
+        if self._loop and self._stop_event:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+    
+    def get_status(self) -> Dict[str, Dict]:
+        """Get the current schedule of every source."""
+        return {schedule.source.name: schedule.to_dict() for schedule in self.schedules}
+    
+    async def _run_source(self, schedule: FeedSchedule, handler: Callable[[List[NewsItem]], Awaitable]):
+        """Poll loop for a single source."""
+        # Spread the first polls out so sources don't start in lockstep
+        await asyncio.sleep(random.uniform(0, min(schedule.interval, self.min_interval)))
+        
+        while True:
+            items = []
+            try:
+                items = await schedule.poll()
+                failed = schedule.source.last_error is not None
+            except Exception as e:
+                self.logger.error(f"Error polling {schedule.source.name}: {e}")
+                failed = True
+            
+            # Cadence comes from the source's raw entry timestamps, not just the relevant items
+            self._reschedule(schedule, schedule.source.last_publish_times, failed)
+            
+            if items:
+                try:
+                    await handler(items)
+                except Exception as e:
+                    self.logger.error(f"Error handling news from {schedule.source.name}: {e}")
+            
+            # Time spent handling counts towards the wait
+            await asyncio.sleep(max(0, schedule.next_due - time.monotonic()))
+    
+    def _reschedule(self, schedule: FeedSchedule, publish_times: List[datetime], failed: bool) -> float:
+        """Update a source's interval after a poll and return the delay to its next one."""
+        if failed:
+            schedule.consecutive_errors += 1
+            exponent = min(schedule.consecutive_errors, self.MAX_BACKOFF_EXPONENT)
+            delay = self._clamp(schedule.interval * (2 ** exponent))
+        else:
+            schedule.consecutive_errors = 0
+            self._learn_cadence(schedule, publish_times)
+            delay = schedule.interval
+        
+        # Sources receiving pushes are only polled as a slow fallback
+        if schedule.source.push_active:
+            delay = self.max_interval
+        
+        delay = self._clamp(delay * random.uniform(1 - Config.POLL_JITTER, 1 + Config.POLL_JITTER))
+        schedule.next_due = time.monotonic() + delay
+        
+        self.logger.debug(f"Next poll of {schedule.source.name} in {delay:.0f}s")
+        return delay
+    
+    def _learn_cadence(self, schedule: FeedSchedule, publish_times: List[datetime]):
+        """Adjust the poll interval from the publish timestamps seen in a poll."""
+        timestamps = sorted(self._as_utc(published) for published in publish_times)
+        if schedule.last_published:
+            timestamps = [ts for ts in timestamps if ts > schedule.last_published]
+        
+        if not timestamps:
+            # Nothing new: back off gradually towards the maximum interval
+            schedule.interval = self._clamp(schedule.interval * self.IDLE_BACKOFF)
+            return
+        
+        if schedule.last_published:
+            # Average gap between items published since the previous newest one
+            sample = (timestamps[-1] - schedule.last_published).total_seconds() / len(timestamps)
+        elif len(timestamps) > 1:
+            sample = (timestamps[-1] - timestamps[0]).total_seconds() / (len(timestamps) - 1)
+        else:
+            sample = None
+        
+        if sample:
+            if schedule.cadence is None:
+                schedule.cadence = sample
+            else:
+                schedule.cadence += self.CADENCE_SMOOTHING * (sample - schedule.cadence)
+            schedule.interval = self._clamp(schedule.cadence * Config.POLL_CADENCE_FACTOR)
+        
+        schedule.last_published = timestamps[-1]
+    
+    def _clamp(self, interval: float) -> float:
+        """Keep an interval within the configured bounds."""
+        return max(self.min_interval, min(self.max_interval, interval))
+    
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        """Normalise a datetime to timezone-aware UTC."""
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
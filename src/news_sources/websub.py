@@ -0,0 +1,229 @@
+import asyncio
+import hashlib
+import hmac
+import secrets
+import time
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from aiohttp import web
+
+from .base import NewsItem
+from .feed_parser import parse_feed
+from .rss_feeds import RSSFeedSource
+from config import Config
+from ..utils.transport import get_session, get_timeout
+
+class WebSubSubscription:
+    """State of a single WebSub subscription."""
+    
+    def __init__(self, source: RSSFeedSource, callback_id: str):
+        self.source = source
+        self.hub_url = source.hub_url
+        self.topic_url = source.topic_url
+        self.callback_id = callback_id
+        self.secret = secrets.token_hex(20)
+        self.verified = False
+        self.requested_at = 0.0
+        self.lease_expires = 0.0
+    
+    @property
+    def active(self) -> bool:
+        """Whether the hub has verified the subscription and the lease is current."""
+        return self.verified and time.time() < self.lease_expires
+    
+    def to_dict(self) -> Dict:
+        """Convert subscription state to dictionary."""
+        return {
+            'hub': self.hub_url,
+            'topic': self.topic_url,
+            'active': self.active,
+            'lease_remaining_seconds': round(max(0, self.lease_expires - time.time()))
+        }
+
+class WebSubReceiver:
+    """Receives WebSub (PubSubHubbub) pushes for feeds that advertise a hub.
+    
+    Runs a small aiohttp server for hub verification and content
+    delivery. Pushed entries go through the source's normal duplicate and
+    relevance filtering and are then handed to the same handler that
+    polled items use. While a subscription is active the source is marked
+    push_active, so the scheduler only polls it as a fallback.
+    """
+    
+    def __init__(self, handler: Callable[[List[NewsItem]], Awaitable], logger: Optional[logging.Logger] = None):
+        self.handler = handler
+        self.logger = logger or logging.getLogger(__name__)
+        self.subscriptions: Dict[str, WebSubSubscription] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self._renew_task: Optional[asyncio.Task] = None
+        self._tasks = set()
+    
+    async def start(self):
+        """Start the callback server and lease renewal loop."""
+        app = web.Application(client_max_size=Config.RSS_MAX_BODY_BYTES)
+        app.router.add_get('/websub/{callback_id}', self._handle_verification)
+        app.router.add_post('/websub/{callback_id}', self._handle_delivery)
+        
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, Config.WEBSUB_HOST, Config.WEBSUB_PORT).start()
+        
+        self._renew_task = asyncio.create_task(self._renew_leases())
+        self.logger.info(f"📬 WebSub receiver listening on {Config.WEBSUB_HOST}:{Config.WEBSUB_PORT}")
+    
+    async def stop(self):
+        """Stop the callback server."""
+        if self._renew_task:
+            self._renew_task.cancel()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._runner:
+            await self._runner.cleanup()
+        for subscription in self.subscriptions.values():
+            subscription.source.push_active = False
+    
+    async def ensure_subscribed(self, source: RSSFeedSource):
+        """Subscribe to a source's hub if it has one and we aren't already subscribed."""
+        if not source.hub_url:
+            return
+        
+        callback_id = hashlib.sha1(source.topic_url.encode('utf-8')).hexdigest()[:16]
+        subscription = self.subscriptions.get(callback_id)
+        
+        if subscription and subscription.hub_url == source.hub_url:
+            if subscription.active:
+                return
+            # Still waiting on the hub to verify a recent request
+            if not subscription.verified and time.time() - subscription.requested_at < Config.WEBSUB_VERIFY_TIMEOUT_SECONDS:
+                return
+        
+        if subscription is None or subscription.hub_url != source.hub_url:
+            subscription = WebSubSubscription(source, callback_id)
+            self.subscriptions[callback_id] = subscription
+        
+        await self._request_subscription(subscription)
+    
+    def get_status(self) -> Dict[str, Dict]:
+        """Get the state of every subscription."""
+        return {sub.source.name: sub.to_dict() for sub in self.subscriptions.values()}
+    
+    async def _request_subscription(self, subscription: WebSubSubscription, mode: str = 'subscribe'):
+        """Send a subscription request to the hub."""
+        subscription.requested_at = time.time()
+        
+        data = {
+            'hub.callback': f"{Config.WEBSUB_CALLBACK_URL.rstrip('/')}/websub/{subscription.callback_id}",
+            'hub.mode': mode,
+            'hub.topic': subscription.topic_url,
+            'hub.secret': subscription.secret,
+            'hub.lease_seconds': str(Config.WEBSUB_LEASE_SECONDS)
+        }
+        
+        try:
+            session = await get_session()
+            async with session.post(subscription.hub_url, data=data, timeout=get_timeout('api')) as response:
+                if response.status not in (202, 204):
+                    error_text = await response.text()
+                    self.logger.warning(
+                        f"WebSub hub rejected {mode} for {subscription.source.name}: "
+                        f"HTTP {response.status} - {error_text[:200]}"
+                    )
+                    return
+            self.logger.info(f"📬 Requested WebSub {mode} for {subscription.source.name} via {subscription.hub_url}")
+        except Exception as e:
+            self.logger.warning(f"WebSub {mode} request for {subscription.source.name} failed: {e}")
+    
+    async def _handle_verification(self, request: web.Request) -> web.Response:
+        """Answer the hub's intent verification (or denial) request."""
+        subscription = self.subscriptions.get(request.match_info['callback_id'])
+        mode = request.query.get('hub.mode')
+        topic = request.query.get('hub.topic')
+        
+        if subscription is None or topic != subscription.topic_url:
+            return web.Response(status=404)
+        
+        if mode == 'denied':
+            self.logger.warning(f"WebSub subscription denied for {subscription.source.name}: {request.query.get('hub.reason')}")
+            subscription.verified = False
+            subscription.source.push_active = False
+            return web.Response(status=200)
+        
+        if mode != 'subscribe':
+            return web.Response(status=404)
+        
+        try:
+            lease_seconds = int(request.query.get('hub.lease_seconds', Config.WEBSUB_LEASE_SECONDS))
+        except ValueError:
+            lease_seconds = Config.WEBSUB_LEASE_SECONDS
+        
+        subscription.verified = True
+        subscription.lease_expires = time.time() + lease_seconds
+        subscription.source.push_active = True
+        self.logger.info(f"✅ WebSub subscription active for {subscription.source.name} ({lease_seconds}s lease)")
+        
+        return web.Response(text=request.query.get('hub.challenge', ''))
+    
+    async def _handle_delivery(self, request: web.Request) -> web.Response:
+        """Accept pushed feed content from the hub."""
+        subscription = self.subscriptions.get(request.match_info['callback_id'])
+        if subscription is None:
+            return web.Response(status=410)
+        
+        body = await request.read()
+        
+        # Per the spec, acknowledge even when the signature is wrong but ignore the content
+        if not self._valid_signature(subscription.secret, body, request.headers.get('X-Hub-Signature')):
+            self.logger.warning(f"Ignoring WebSub delivery for {subscription.source.name} with invalid signature")
+            return web.Response(status=202)
+        
+        # Reply immediately; analysis happens in the background
+        task = asyncio.create_task(self._process_delivery(subscription, body))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        
+        return web.Response(status=202)
+    
+    async def _process_delivery(self, subscription: WebSubSubscription, body: bytes):
+        """Parse pushed content and hand relevant new items to the handler."""
+        source = subscription.source
+        try:
+            parsed = await parse_feed(body)
+            news_items = source.to_news_items(parsed.entries)
+            relevant_items = await source.filter_relevant_news(news_items, Config.CRYPTO_KEYWORDS)
+            
+            self.logger.info(f"📬 WebSub push from {source.name}: {len(relevant_items)} new relevant items")
+            if relevant_items:
+                await self.handler(relevant_items)
+        except Exception as e:
+            self.logger.error(f"Error processing WebSub delivery for {source.name}: {e}")
+    
+    @staticmethod
+    def _valid_signature(secret: str, body: bytes, header: Optional[str]) -> bool:
+        """Check the X-Hub-Signature HMAC of a delivery."""
+        if not header or '=' not in header:
+            return False
+        
+        method, signature = header.split('=', 1)
+        if method not in ('sha1', 'sha256', 'sha384', 'sha512'):
+            return False
+        
+        expected = hmac.new(secret.encode('utf-8'), body, method).hexdigest()
+        return hmac.compare_digest(expected, signature.strip())
+    
+    async def _renew_leases(self):
+        """Renew leases that are about to expire; expired ones fall back to polling."""
+        while True:
+            await asyncio.sleep(Config.WEBSUB_RENEW_CHECK_SECONDS)
+            
+            now = time.time()
+            for subscription in list(self.subscriptions.values()):
+                if subscription.verified and now >= subscription.lease_expires:
+                    self.logger.warning(f"WebSub lease expired for {subscription.source.name}, polling instead")
+                    subscription.verified = False
+                    subscription.source.push_active = False
+                
+                renewal_due = subscription.lease_expires - now < Config.WEBSUB_RENEW_MARGIN_SECONDS
+                recently_requested = now - subscription.requested_at < Config.WEBSUB_VERIFY_TIMEOUT_SECONDS
+                if subscription.verified and renewal_due and not recently_requested:
+                    await self._request_subscription(subscription)
@@ -0,0 +1,119 @@
+import random
+import time
+from typing import Dict, Optional
+
+from config import Config
+
+class CircuitBreaker:
+    """Circuit breaker with closed, open and half-open states.
+    
+    After `failure_threshold` consecutive failures the breaker opens and
+    rejects requests for an exponentially growing, jittered delay. Once the
+    delay expires it goes half-open: a single caller gets a trial request
+    whose outcome either closes the breaker or re-opens it with a longer
+    delay. Other callers are rejected until the trial reports back, or
+    until trial_timeout passes without a result.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        trial_timeout: Optional[float] = None
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold or Config.CIRCUIT_FAILURE_THRESHOLD
+        self.base_delay = base_delay or Config.CIRCUIT_BASE_DELAY_SECONDS
+        self.max_delay = max_delay or Config.CIRCUIT_MAX_DELAY_SECONDS
+        self.failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self.trial_timeout = trial_timeout or self.base_delay
+        self.last_error: Optional[str] = None
+        self._state = self.CLOSED
+        self._trial_started: Optional[float] = None
+    
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the delay expires."""
+        if self._state == self.OPEN and time.monotonic() >= self.open_until:
+            self._state = self.HALF_OPEN
+        return self._state
+    
+    def allow_request(self) -> bool:
+        """Check whether a request may be attempted (half-open admits one trial at a time)."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.OPEN:
+            return False
+        
+        now = time.monotonic()
+        if self._trial_started is not None and now - self._trial_started < self.trial_timeout:
+            return False
+        self._trial_started = now
+        return True
+    
+    def record_success(self):
+        """Record a successful request and close the breaker."""
+        self.failures = 0
+        self.trips = 0
+        self.last_error = None
+        self._state = self.CLOSED
+        self._trial_started = None
+    
+    def record_failure(self, error: str = ''):
+        """Record a failed request, opening the breaker if needed."""
+        self.failures += 1
+        self.last_error = error or None
+        
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self._trip()
+    
+    def _trip(self):
+        """Open the breaker for an exponentially increasing, jittered delay."""
+        self.trips += 1
+        delay = min(self.max_delay, self.base_delay * (2 ** min(self.trips - 1, 16)))
+        delay *= random.uniform(0.5, 1.0)
+        self.open_until = time.monotonic() + delay
+        self._state = self.OPEN
+        self._trial_started = None
+    
+    def to_dict(self) -> Dict:
+        """Convert breaker state to dictionary."""
+        state = self.state
+        return {
+            'state': state,
+            'failures': self.failures,
+            'trips': self.trips,
+            'retry_in_seconds': round(max(0, self.open_until - time.monotonic()), 1) if state == self.OPEN else 0,
+            'last_error': self.last_error
+        }
+
+class CircuitBreakerRegistry:
+    """Keeps one circuit breaker per key (e.g. per host)."""
+    
+    def __init__(self, failure_threshold: Optional[int] = None):
+        self.failure_threshold = failure_threshold
+        self._breakers: Dict[str, CircuitBreaker] = {}
+    
+    def get(self, key: str) -> CircuitBreaker:
+        """Get or create the breaker for a key."""
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(key, failure_threshold=self.failure_threshold)
+            self._breakers[key] = breaker
+        return breaker
+    
+    def get_states(self) -> Dict[str, Dict]:
+        """Get the state of every breaker."""
+        return {key: breaker.to_dict() for key, breaker in self._breakers.items()}
+
+# Shared per-host breakers, so one dead host doesn't tie up every feed on it
+host_breakers = CircuitBreakerRegistry(failure_threshold=Config.CIRCUIT_HOST_FAILURE_THRESHOLD)
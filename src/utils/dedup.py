@@ -0,0 +1,96 @@
+import sys
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Set, Tuple
+
+from config import Config
+
+class TimeWindowedDedup:
+    """Remembers item hashes for a fixed retention window.
+    
+    Hashes are kept in one set per time bucket; whole buckets are dropped
+    once they fall out of the window, so memory tracks the number of items
+    seen in the last `window_seconds` rather than since startup. An item
+    that keeps showing up (e.g. it stays in a feed) is moved to the newest
+    bucket on every hit, so it doesn't expire while still being served.
+    Hashes are truncated to 64-bit integers, so a new item is wrongly taken
+    for a duplicate with probability about n / 2**64 for n hashes held. Even
+    with a million items in the window, the chance that any two of them
+    collide is about n**2 / 2**65, roughly 1 in 37 million.
+    """
+    
+    def __init__(self, window_seconds: Optional[float] = None, bucket_seconds: Optional[float] = None):
+        self.window_seconds = window_seconds or Config.DEDUP_WINDOW_HOURS * 3600
+        self.bucket_seconds = bucket_seconds or Config.DEDUP_BUCKET_MINUTES * 60
+        self._buckets: Deque[Tuple[int, Set[int]]] = deque()
+        self.lookups = 0
+        self.hits = 0
+    
+    @staticmethod
+    def _key(hash_id: str) -> int:
+        """Compact a hex digest into a 64-bit integer."""
+        try:
+            return int(hash_id[:16], 16)
+        except ValueError:
+            return hash(hash_id) & 0xFFFFFFFFFFFFFFFF
+    
+    def _current_bucket(self, now: float) -> Set[int]:
+        """Get the newest bucket, expiring old ones and opening a new one if due."""
+        bucket_id = int(now // self.bucket_seconds)
+        oldest_kept = int((now - self.window_seconds) // self.bucket_seconds)
+        
+        while self._buckets and self._buckets[0][0] < oldest_kept:
+            self._buckets.popleft()
+        
+        if not self._buckets or self._buckets[-1][0] != bucket_id:
+            self._buckets.append((bucket_id, set()))
+        return self._buckets[-1][1]
+    
+    def check_and_add(self, hash_id: str) -> bool:
+        """Record a hash and return whether it was already seen within the window."""
+        key = self._key(hash_id)
+        newest = self._current_bucket(time.time())
+        self.lookups += 1
+        
+        if key in newest:
+            self.hits += 1
+            return True
+        
+        newest.add(key)
+        for _, bucket in self._buckets:
+            if bucket is not newest and key in bucket:
+                self.hits += 1
+                return True
+        return False
+    
+    def __contains__(self, hash_id: str) -> bool:
+        key = self._key(hash_id)
+        return any(key in bucket for _, bucket in self._buckets)
+    
+    def __len__(self) -> int:
+        return sum(len(bucket) for _, bucket in self._buckets)
+    
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the stored hashes."""
+        total = sys.getsizeof(self._buckets)
+        for _, bucket in self._buckets:
+            # Set table plus one int object per element
+            total += sys.getsizeof(bucket) + len(bucket) * 32
+        return total
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were duplicates."""
+        return self.hits / self.lookups if self.lookups else 0.0
+    
+    def get_stats(self) -> Dict:
+        """Get size and effectiveness statistics."""
+        return {
+            'entries': len(self),
+            'buckets': len(self._buckets),
+            'memory_bytes': self.memory_bytes,
+            'lookups': self.lookups,
+            'hit_rate': round(self.hit_rate, 4),
+            'window_hours': round(self.window_seconds / 3600, 2)
+        }
@@ -1,25 +1,44 @@
 import re
 import hashlib
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
 import pytz
 
+from .keyword_matcher import get_matcher
+from .text_extract import html_to_text
+
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s.,!?;:\-$%]')
+
+# Click ids and campaign parameters that only track where a click came from.
+# Generic names like "source" or "ref" are kept: some sites use them to pick content.
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'twclid', 'taid',
+    'mc_cid', 'mc_eid', 'mkt_tok', '_ga', '_gl',
+    'guccounter', 'guce_referrer', 'guce_referrer_sig'
+}
+TRACKING_PREFIXES = ('utm_', 'pk_', 'hsa_')
+
+# Query flags that only select the AMP rendering of a page, with the values that mean "AMP"
+AMP_QUERY_FLAGS = {'amp': {'', '1', 'true'}, 'outputtype': {'amp'}}
+
+# Host prefixes for mobile and AMP copies of the same page
+HOST_PREFIXES = ('www.', 'm.', 'mobile.', 'amp.')
+
+AMP_PATH_PATTERN = re.compile(r'(?:/amp|\.amp(?P<ext>\.html?)?)/?$', re.IGNORECASE)
+AMP_CACHE_PATTERN = re.compile(r'^/(?:c/)?(?:s/)?(?P<host>[^/]+)(?P<path>/.*)?$')
+
 def clean_text(text: str) -> str:
     """Clean and normalize text for analysis."""
     if not text:
         return ""
     
-    # Remove extra whitespace and newlines
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    # Remove HTML tags if any
-    text = re.sub(r'<[^>]+>', '', text)
+    # Strip markup, decode entities and collapse whitespace
+    text = html_to_text(text)
     
     # Remove special characters but keep basic punctuation
-    text = re.sub(r'[^\w\s.,!?;:\-$%]', '', text)
-    
-    return text
+    return SPECIAL_CHARS_PATTERN.sub('', text)
 
 def extract_crypto_mentions(text: str) -> List[str]:
     """Extract cryptocurrency mentions from text."""
@@ -70,10 +89,72 @@ def extract_domain(url: str) -> str:
     except:
         return "unknown"
 
+def _unwrap_amp_cache(host: str, path: str) -> Optional[tuple]:
+    """Return the (host, path) of the page behind a Google AMP cache URL."""
+    if host.endswith('.cdn.ampproject.org') or (host in ('google.com', 'www.google.com') and path.startswith('/amp/')):
+        match = AMP_CACHE_PATTERN.match(path[4:] if path.startswith('/amp/') else path)
+        if match:
+            return match.group('host').lower(), match.group('path') or '/'
+    return None
+
+def _is_tracking_param(key: str, value: str) -> bool:
+    """Whether a (lower-cased) query parameter can be dropped without changing the article."""
+    if key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES):
+        return True
+    return value in AMP_QUERY_FLAGS.get(key, ())
+
+@lru_cache(maxsize=16384)
+def canonicalize_url(url: str) -> str:
+    """Reduce an article URL to a canonical form shared by its variants.
+    
+    Drops tracking parameters, fragments, default ports, www/mobile/AMP
+    host prefixes and AMP path suffixes, unwraps AMP cache URLs, treats
+    http and https as the same and sorts the remaining query parameters.
+    Results are cached, since feeds keep returning the same URLs.
+    """
+    if not url:
+        return ""
+    
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+    
+    if not parts.netloc:
+        return url.strip()
+    
+    host = (parts.hostname or '').lower()
+    path = parts.path or '/'
+    
+    unwrapped = _unwrap_amp_cache(host, path)
+    if unwrapped:
+        host, path = unwrapped
+    
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    
+    path = re.sub(r'/{2,}', '/', path)
+    path = AMP_PATH_PATTERN.sub(r'\g<ext>', path)
+    if path.startswith('/amp/'):
+        path = path[4:]
+    if len(path) > 1:
+        path = path.rstrip('/')
+    
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(key.lower(), value.lower())
+    )
+    
+    return urlunsplit(('https', host, path or '/', urlencode(query), ''))
+
 def contains_crypto_keywords(text: str, keywords: List[str]) -> bool:
     """Check if text contains any cryptocurrency-related keywords."""
-    text_lower = text.lower()
-    return any(keyword.lower() in text_lower for keyword in keywords)
+    return get_matcher(keywords).search(text)
 
 def format_alert_message(alert_data: Dict) -> str:
     """Format alert data into a readable message."""
@@ -0,0 +1,166 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+class KeywordMatch(NamedTuple):
+    """A keyword found in a text."""
+    keyword: str
+    start: int
+    end: int
+
+VOWELS = set('aeiou')
+
+# Keywords this short only get the regular suffixes; agent nouns and doubled
+# consonants would turn "ban" into "banner" and "fed" into "feder"
+SHORT_WORD_LETTERS = 3
+
+# Trailing marker for a prefix keyword ("crypto*" also matches "CryptoPunks")
+PREFIX_MARKER = '*'
+
+def _normalize(keyword: str) -> str:
+    """Lower-case a keyword and collapse its whitespace."""
+    return ' '.join(keyword.lower().split())
+
+def _compact(text: str) -> str:
+    """Drop spaces and hyphens, which are optional between the words of a keyword."""
+    return re.sub(r'[\s-]+', '', text.lower())
+
+def _inflections(word: str) -> Set[str]:
+    """Common English inflections of a word: plurals, -ed and -ing, and for
+    words longer than SHORT_WORD_LETTERS also -er(s) and doubled consonants."""
+    forms = {word}
+    forms.update(word + suffix for suffix in ('s', 'es', 'ed', 'ing'))
+    if len(word) > 2 and word.endswith('y') and word[-2] not in VOWELS:
+        forms.update(word[:-1] + suffix for suffix in ('ies', 'ied'))
+    if word.endswith('e'):
+        forms.add(word + 'd')
+        forms.add(word[:-1] + 'ing')
+    if len(word) <= SHORT_WORD_LETTERS:
+        return forms
+    
+    forms.update(word + suffix for suffix in ('er', 'ers'))
+    if word.endswith('e'):
+        forms.update(word + suffix for suffix in ('r', 'rs'))
+    if (
+        word[-1] not in VOWELS and word[-1] not in 'wxy'
+        and word[-2] in VOWELS and word[-3] not in VOWELS
+    ):
+        # Doubled final consonant: regret -> regretted, regretting
+        forms.update(word + word[-1] + suffix for suffix in ('ed', 'ing', 'er', 'ers'))
+    return forms
+
+def _trie_pattern(node: Dict) -> str:
+    """Turn a character trie into a regex without redundant alternation."""
+    optional = '' in node
+    branches = []
+    single_chars = []
+    
+    if PREFIX_MARKER in node:
+        branches.append(r'\w*')
+    
+    for char in sorted(key for key in node if key and key != PREFIX_MARKER):
+        child = _trie_pattern(node[char])
+        token = r'[\s-]*' if char == ' ' else re.escape(char)
+        if child or char == ' ':
+            branches.append(token + child)
+        else:
+            single_chars.append(token)
+    
+    if len(single_chars) == 1:
+        branches.append(single_chars[0])
+    elif single_chars:
+        branches.append(f"[{''.join(single_chars)}]")
+    
+    if not branches:
+        return ''
+    
+    pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if optional:
+        pattern = f"(?:{pattern})?"
+    return pattern
+
+class KeywordMatcher:
+    """Finds a set of keywords in text in a single regex pass.
+    
+    The keywords are folded into a trie and compiled into one
+    case-insensitive pattern, so the cost per text barely grows with the
+    number of keywords. Matches must sit on word boundaries ("eth" does not
+    match "method") but may be inflected ("stablecoins", "hacked",
+    "cryptocurrencies", "regulators" for "regulator"), and the words of a
+    multi-word keyword may be joined or hyphenated ("memecoins" for
+    "meme coin"). A keyword ending in "*" matches as a prefix ("crypto*"
+    matches "CryptoPunks").
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Set[str] = {_normalize(k) for k in keywords if k and k.strip()}
+        
+        # Every accepted spelling, compacted, mapped back to its keyword
+        self._forms: Dict[str, str] = {}
+        self._prefixes: List[str] = []
+        
+        trie: Dict = {}
+        for keyword in self.keywords:
+            if keyword.endswith(PREFIX_MARKER):
+                stem = keyword.rstrip(PREFIX_MARKER)
+                self._prefixes.append(keyword)
+                self._insert(trie, stem).setdefault(PREFIX_MARKER, {})
+                continue
+            
+            head, _, last = keyword.rpartition(' ')
+            for form in _inflections(last):
+                spelling = f"{head} {form}" if head else form
+                self._forms.setdefault(_compact(spelling), keyword)
+                self._insert(trie, spelling)[''] = {}
+        
+        # Longest prefix first, so "cryptocurrency*" wins over "crypto*"
+        self._prefixes.sort(key=len, reverse=True)
+        
+        body = _trie_pattern(trie)
+        self.pattern: Optional[re.Pattern] = (
+            re.compile(rf"(?<!\w)(?:{body})(?!\w)", re.IGNORECASE) if body else None
+        )
+    
+    @staticmethod
+    def _insert(trie: Dict, text: str) -> Dict:
+        """Add a spelling to the trie and return its final node."""
+        node = trie
+        for char in text:
+            node = node.setdefault(char, {})
+        return node
+    
+    def _keyword_for(self, matched: str) -> str:
+        """Map matched text back to the keyword it came from."""
+        text = _compact(matched)
+        keyword = self._forms.get(text)
+        if keyword is not None:
+            return keyword
+        for prefix in self._prefixes:
+            if text.startswith(_compact(prefix.rstrip(PREFIX_MARKER))):
+                return prefix
+        return _normalize(matched)
+    
+    def search(self, text: str) -> bool:
+        """Whether the text contains any keyword."""
+        return bool(self.pattern and text and self.pattern.search(text))
+    
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """Every keyword occurrence in the text, with its position."""
+        if not self.pattern or not text:
+            return []
+        return [
+            KeywordMatch(self._keyword_for(m.group()), m.start(), m.end())
+            for m in self.pattern.finditer(text)
+        ]
+    
+    def matched_keywords(self, text: str) -> Set[str]:
+        """The distinct keywords found in the text."""
+        return {match.keyword for match in self.find_all(text)}
+
+@lru_cache(maxsize=32)
+def _cached_matcher(keywords: tuple) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+def get_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """Get a compiled matcher for a keyword list, reused until the list changes."""
+    return _cached_matcher(tuple(keywords))
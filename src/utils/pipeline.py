@@ -0,0 +1,147 @@
+import asyncio
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+class Stage:
+    """A pipeline stage: a bounded input queue drained by a pool of workers.
+    
+    Each worker passes queued items to the handler; a non-None result is
+    put on the downstream stage's queue. Because that put blocks while the
+    downstream queue is full, a saturated stage stalls the stages before
+    it instead of letting work pile up in memory. A handler error only
+    loses that one item.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Awaitable[Any]],
+        workers: int = 1,
+        queue_size: int = 100,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.logger = logger or logging.getLogger(__name__)
+        self.downstream: Optional['Stage'] = None
+        self.processed = 0
+        self.errors = 0
+        self._tasks: List[asyncio.Task] = []
+    
+    async def put(self, item: Any):
+        """Queue an item, waiting while the stage is full."""
+        await self.queue.put(self._wrap(item))
+    
+    def _wrap(self, item: Any) -> Any:
+        return item
+    
+    def _unwrap(self, entry: Any) -> Any:
+        return entry
+    
+    def start(self):
+        """Start the worker tasks."""
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"{self.name}-{i}")
+            for i in range(self.workers)
+        ]
+    
+    async def stop(self):
+        """Cancel the worker tasks."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+    
+    async def _work(self):
+        while True:
+            item = self._unwrap(await self.queue.get())
+            try:
+                result = await self.handler(item)
+                self.processed += 1
+                if result is not None and self.downstream:
+                    await self.downstream.put(result)
+            except Exception as e:
+                self.errors += 1
+                self.logger.error(f"Error in {self.name} stage: {e}")
+            finally:
+                self.queue.task_done()
+    
+    def get_status(self) -> Dict:
+        """Get queue depth and throughput counters."""
+        return {
+            'queue_depth': self.queue.qsize(),
+            'queue_size': self.queue.maxsize,
+            'workers': self.workers,
+            'processed': self.processed,
+            'errors': self.errors
+        }
+
+class PriorityStage(Stage):
+    """A stage whose workers take the highest-scoring queued item first.
+    
+    Waiting items gain aging_per_second priority for every second they sit
+    in the queue, so a steady stream of high scores cannot starve the rest.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Awaitable[Any]],
+        score: Callable[[Any], float],
+        aging_per_second: float = 0.0,
+        workers: int = 1,
+        queue_size: int = 100,
+        logger: Optional[logging.Logger] = None
+    ):
+        super().__init__(name, handler, workers, queue_size, logger)
+        self.queue = asyncio.PriorityQueue(maxsize=queue_size)
+        self.score = score
+        self.aging_per_second = aging_per_second
+        self._sequence = itertools.count()
+    
+    def _wrap(self, item: Any) -> Any:
+        # Aging is folded into the key at enqueue time: an item queued t seconds
+        # later needs aging_per_second * t more score to overtake this one
+        key = self.aging_per_second * time.monotonic() - self.score(item)
+        return key, next(self._sequence), item
+    
+    def _unwrap(self, entry: Any) -> Any:
+        return entry[2]
+
+class Pipeline:
+    """Stages chained in order, each feeding the next."""
+    
+    def __init__(self, stages: List[Stage], logger: Optional[logging.Logger] = None):
+        self.stages = stages
+        self.logger = logger or logging.getLogger(__name__)
+        for upstream, downstream in zip(stages, stages[1:]):
+            upstream.downstream = downstream
+    
+    async def submit(self, items: Iterable[Any]):
+        """Feed items into the first stage, waiting while it is full."""
+        for item in items:
+            await self.stages[0].put(item)
+    
+    def start(self):
+        for stage in self.stages:
+            stage.start()
+    
+    async def stop(self):
+        for stage in self.stages:
+            await stage.stop()
+    
+    async def join(self):
+        """Wait until every queued item has passed through all stages."""
+        for stage in self.stages:
+            await stage.queue.join()
+    
+    def get_status(self) -> Dict[str, Dict]:
+        """Get the status of every stage."""
+        return {stage.name: stage.get_status() for stage in self.stages}
+    
+    def get_queue_depths(self) -> Dict[str, int]:
+        return {stage.name: stage.queue.qsize() for stage in self.stages}
@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+class TokenBucket:
+    """Async token-bucket rate limiter.
+    
+    Tokens refill continuously at `rate` per second up to `capacity`, so
+    short bursts are allowed while the long-run rate stays within quota.
+    A server-requested pause (e.g. Retry-After on HTTP 429) blocks all
+    callers until it expires.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    @classmethod
+    def per_day(cls, requests_per_day: int, burst: int) -> 'TokenBucket':
+        """Create a bucket from a daily request quota."""
+        return cls(rate=requests_per_day / 86400, capacity=burst)
+    
+    def _refill(self, now: float):
+        """Add tokens accrued since the last update."""
+        elapsed = now - self._updated
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self._updated = now
+    
+    async def acquire(self, tokens: float = 1):
+        """Wait until the requested number of tokens is available and take them."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                
+                self._refill(now)
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+    
+    def pause(self, seconds: float):
+        """Block all callers for the given number of seconds and drain the bucket."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self.tokens = 0
+        self._updated = self._blocked_until
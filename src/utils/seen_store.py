@@ -0,0 +1,154 @@
+import asyncio
+import sqlite3
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+from config import Config
+
+# SQLite's default limit on bound parameters is 999 on older builds
+_QUERY_CHUNK = 500
+
+class SeenStore:
+    """On-disk record of item hashes that have already been processed.
+    
+    Backed by SQLite in WAL mode so several worker processes can share one
+    file: readers never block, and claim() runs inside an immediate
+    transaction so two processes can't both claim the same item. Writes for
+    a batch of items happen in a single transaction.
+    
+    Items are claimed when they pass the relevance filter, before analysis,
+    so processing is at-most-once: an item whose analysis fails, or that is
+    still queued when the process stops, is not picked up again. Async
+    callers use claim_async(), which runs on the store's own thread so a
+    busy database never blocks the event loop.
+    """
+    
+    def __init__(self, path: str, logger: Optional[logging.Logger] = None):
+        self.path = Path(path)
+        self.logger = logger or logging.getLogger(__name__)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Autocommit mode; transactions are opened explicitly
+        self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS seen ('
+            'hash_id TEXT PRIMARY KEY, first_seen REAL NOT NULL, last_seen REAL NOT NULL'
+            ') WITHOUT ROWID'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS seen_last_seen ON seen (last_seen)')
+        self._last_prune = 0.0
+        
+        # One thread owns the connection, so transactions from async callers never interleave
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='seen-store')
+    
+    def _select_seen(self, hash_ids: List[str], since: float) -> Set[str]:
+        """Return the hashes seen at or after `since`."""
+        seen = set()
+        for i in range(0, len(hash_ids), _QUERY_CHUNK):
+            chunk = hash_ids[i:i + _QUERY_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self._conn.execute(
+                f'SELECT hash_id FROM seen WHERE last_seen >= ? AND hash_id IN ({placeholders})',
+                [since, *chunk]
+            )
+            seen.update(row[0] for row in rows)
+        return seen
+    
+    def seen_within(self, hash_ids: Iterable[str], hours: float) -> Set[str]:
+        """Return the hashes that were seen in the last `hours` hours."""
+        hash_ids = list(hash_ids)
+        if not hash_ids:
+            return set()
+        return self._select_seen(hash_ids, time.time() - hours * 3600)
+    
+    def claim(self, hash_ids: Iterable[str], hours: Optional[float] = None) -> Set[str]:
+        """Mark hashes as seen and return those not already seen within `hours`."""
+        hash_ids = list(dict.fromkeys(hash_ids))
+        if not hash_ids:
+            return set()
+        
+        now = time.time()
+        since = now - (hours or Config.DEDUP_WINDOW_HOURS) * 3600
+        
+        try:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                already_seen = self._select_seen(hash_ids, since)
+                self._conn.executemany(
+                    'INSERT INTO seen (hash_id, first_seen, last_seen) VALUES (?, ?, ?) '
+                    'ON CONFLICT(hash_id) DO UPDATE SET last_seen = excluded.last_seen',
+                    [(hash_id, now, now) for hash_id in hash_ids]
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        except sqlite3.Error as e:
+            # Fail open: better to re-analyze than to drop news
+            self.logger.error(f"Seen store {self.path} unavailable: {e}")
+            return set(hash_ids)
+        
+        self._maybe_prune(now)
+        return {hash_id for hash_id in hash_ids if hash_id not in already_seen}
+    
+    async def claim_async(self, hash_ids: Iterable[str], hours: Optional[float] = None) -> Set[str]:
+        """claim() on the store's thread, off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.claim, list(hash_ids), hours)
+    
+    def prune(self, older_than_hours: Optional[float] = None) -> int:
+        """Delete hashes not seen in the retention period and return how many were removed."""
+        cutoff = time.time() - (older_than_hours or Config.SEEN_STORE_RETENTION_HOURS) * 3600
+        try:
+            cursor = self._conn.execute('DELETE FROM seen WHERE last_seen < ?', (cutoff,))
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not prune seen store {self.path}: {e}")
+            return 0
+        
+        if cursor.rowcount:
+            self.logger.info(f"🧹 Pruned {cursor.rowcount} old entries from seen store")
+        return cursor.rowcount
+    
+    def _maybe_prune(self, now: float):
+        """Prune at most once per SEEN_STORE_PRUNE_INTERVAL_MINUTES."""
+        if now - self._last_prune >= Config.SEEN_STORE_PRUNE_INTERVAL_MINUTES * 60:
+            self._last_prune = now
+            self.prune()
+    
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM seen').fetchone()[0]
+    
+    def close(self):
+        """Close the database connection."""
+        self._executor.shutdown(wait=True)
+        self._conn.close()
+
+_store: Optional[SeenStore] = None
+_store_failed = False
+
+def get_seen_store(logger: Optional[logging.Logger] = None) -> Optional[SeenStore]:
+    """Get the process-wide seen store (None when SEEN_STORE_FILE is empty)."""
+    global _store, _store_failed
+    if _store is None and Config.SEEN_STORE_FILE and not _store_failed:
+        try:
+            _store = SeenStore(Config.SEEN_STORE_FILE, logger)
+        except (sqlite3.Error, OSError) as e:
+            # Fail open, and don't retry (and log) on every batch
+            _store_failed = True
+            (logger or logging.getLogger(__name__)).error(
+                f"Could not open seen store {Config.SEEN_STORE_FILE}, continuing without it: {e}"
+            )
+    return _store
+
+def close_seen_store():
+    """Close the process-wide seen store."""
+    global _store, _store_failed
+    if _store is not None:
+        _store.close()
+        _store = None
+    _store_failed = False
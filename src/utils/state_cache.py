@@ -0,0 +1,63 @@
+import json
+import os
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+class StateCache:
+    """Small JSON-backed store for per-source state that should survive restarts."""
+
+    def __init__(self, path: str, logger: Optional[logging.Logger] = None):
+        self.path = Path(path)
+        self.logger = logger or logging.getLogger(__name__)
+        self._data: Dict[str, Dict] = {}
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self._load()
+
+    def _load(self):
+        """Load state from disk, starting empty if the file is missing or corrupt."""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._data = data
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not load state cache {self.path}: {e}")
+
+    def get(self, key: str) -> Dict:
+        """Return the stored state for a key (empty dict if unknown)."""
+        return self._data.get(key, {})
+
+    def update(self, key: str, **fields):
+        """Merge fields into the state stored for a key."""
+        entry = self._data.setdefault(key, {})
+        for field, value in fields.items():
+            if entry.get(field) != value:
+                entry[field] = value
+                self._dirty = True
+
+    def save(self):
+        """Write state to disk if anything changed since the last save."""
+        if not self._dirty:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, indent=2)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+            self._last_save = time.monotonic()
+        except OSError as e:
+            self.logger.error(f"Could not save state cache {self.path}: {e}")
+
+    def save_if_due(self, interval: float):
+        """Save at most once per interval seconds; save() still flushes immediately."""
+        if time.monotonic() - self._last_save >= interval:
+            self.save()
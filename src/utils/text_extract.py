@@ -0,0 +1,44 @@
+import html
+import re
+from typing import Iterable, List
+
+# Elements whose bodies are never readable text
+HIDDEN_ELEMENT_PATTERN = re.compile(
+    r'<(script|style|noscript|template|iframe|svg)\b[^>]*>.*?</\1\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+COMMENT_PATTERN = re.compile(r'<!--.*?-->|<!\[CDATA\[|\]\]>', re.DOTALL)
+
+# Inline tags are removed outright so "<b>Bit</b>coin" stays one word;
+# every other tag becomes a space so block elements don't run together
+INLINE_TAG_PATTERN = re.compile(
+    r'</?(?:a(?:bbr)?|b(?:d[io])?|c(?:ite|ode)|em|font|i|kbd|mark|q|s(?:mall|pan|trong|u[bp])?|time|u|var|wbr)\b[^>]*>',
+    re.IGNORECASE
+)
+TAG_PATTERN = re.compile(r'<[^>]*>')
+
+def html_to_text(markup: str) -> str:
+    """Convert an HTML fragment to plain text.
+    
+    Drops script/style bodies and comments, strips tags, decodes entities
+    and collapses whitespace. Plain text passes through with only the
+    whitespace collapsed.
+    """
+    if not markup:
+        return ""
+    
+    if '<' in markup:
+        markup = HIDDEN_ELEMENT_PATTERN.sub(' ', markup)
+        if '<!' in markup or ']]>' in markup:
+            markup = COMMENT_PATTERN.sub(' ', markup)
+        markup = INLINE_TAG_PATTERN.sub('', markup)
+        markup = TAG_PATTERN.sub(' ', markup)
+    
+    if '&' in markup:
+        markup = html.unescape(markup)
+    
+    return ' '.join(markup.split())
+
+def html_to_text_batch(fragments: Iterable[str]) -> List[str]:
+    """Convert many HTML fragments to plain text."""
+    return [html_to_text(fragment) for fragment in fragments]
@@ -0,0 +1,84 @@
+import aiohttp
+from typing import Dict, Optional
+
+from config import Config
+
+# aiohttp decodes brotli transparently when a brotli package is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+READ_CHUNK_SIZE = 65536
+
+# Per-purpose timeouts applied to individual requests on the shared session
+TIMEOUT_PROFILES = {
+    'feed': aiohttp.ClientTimeout(total=30, sock_connect=10),
+    'api': aiohttp.ClientTimeout(total=30, sock_connect=10),
+    'llm': aiohttp.ClientTimeout(total=60, sock_connect=10),
+    'webhook': aiohttp.ClientTimeout(total=15, sock_connect=5),
+}
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'CryptoAlertSystem/1.0',
+    'Accept-Encoding': ACCEPT_ENCODING
+}
+
+# Connection pools: feeds and APIs share 'default'; LLM calls get their own pool so the
+# LLM client's concurrency limit is not capped by the per-host limit meant for feeds
+_sessions: Dict[str, aiohttp.ClientSession] = {}
+
+class ResponseTooLarge(Exception):
+    """Raised when a response body exceeds its configured size limit."""
+    pass
+
+def get_timeout(purpose: str) -> aiohttp.ClientTimeout:
+    """Get the timeout profile for a request purpose (feed, api, llm, webhook)."""
+    return TIMEOUT_PROFILES.get(purpose, TIMEOUT_PROFILES['api'])
+
+def _limit_per_host(pool: str) -> int:
+    if pool == 'llm':
+        return Config.HTTP_LLM_MAX_CONNECTIONS_PER_HOST
+    return Config.HTTP_MAX_CONNECTIONS_PER_HOST
+
+async def get_session(pool: str = 'default') -> aiohttp.ClientSession:
+    """Get or create the process-wide pooled aiohttp session for a pool ('default' or 'llm')."""
+    session = _sessions.get(pool)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=Config.HTTP_MAX_CONNECTIONS,
+            limit_per_host=_limit_per_host(pool),
+            ttl_dns_cache=Config.HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=Config.HTTP_KEEPALIVE_SECONDS
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=get_timeout('api'),
+            headers=DEFAULT_HEADERS
+        )
+        _sessions[pool] = session
+    return session
+
+async def close_session():
+    """Close the shared sessions and their connection pools."""
+    for session in _sessions.values():
+        if not session.closed:
+            await session.close()
+    _sessions.clear()
+
+async def read_limited(response: aiohttp.ClientResponse, max_bytes: int) -> bytes:
+    """Read a (decompressed) response body as bytes, failing once it exceeds max_bytes."""
+    if response.content_length is not None and response.content_length > max_bytes:
+        raise ResponseTooLarge(f"Content-Length {response.content_length} exceeds {max_bytes} bytes")
+    
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+        body.extend(chunk)
+        if len(body) > max_bytes:
+            raise ResponseTooLarge(f"Response body exceeds {max_bytes} bytes")
+    return bytes(body)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Unit tests for URL canonicalisation on real-world URL variants
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+
+from src.utils.helpers import canonicalize_url
+
+# Each group lists URLs seen for one article (tracking parameters, AMP pages,
+# AMP caches, mobile hosts, http/https, trailing slashes)
+CORPUS = [
+    [
+        'https://www.coindesk.com/markets/2024/05/23/sec-approves-spot-ether-etfs/',
+        'https://www.coindesk.com/markets/2024/05/23/sec-approves-spot-ether-etfs/?utm_source=twitter&utm_medium=social&utm_campaign=coindesk',
+        'http://coindesk.com/markets/2024/05/23/sec-approves-spot-ether-etfs',
+        'https://www.coindesk.com/markets/2024/05/23/sec-approves-spot-ether-etfs/?outputType=amp',
+        'https://www-coindesk-com.cdn.ampproject.org/c/s/www.coindesk.com/markets/2024/05/23/sec-approves-spot-ether-etfs/?outputType=amp',
+        'https://www.coindesk.com/markets/2024/05/23/sec-approves-spot-ether-etfs/#comments',
+    ],
+    [
+        'https://cointelegraph.com/news/bitcoin-price-hits-new-all-time-high',
+        'https://cointelegraph.com/news/bitcoin-price-hits-new-all-time-high/amp',
+        'https://www.google.com/amp/s/cointelegraph.com/news/bitcoin-price-hits-new-all-time-high/amp',
+        'https://cointelegraph.com/news/bitcoin-price-hits-new-all-time-high?utm_source=rss_feed&utm_medium=rss&utm_campaign=rss_partner_inbound',
+    ],
+    [
+        'https://decrypt.co/234567/ethereum-dencun-upgrade-goes-live',
+        'https://decrypt.co/234567/ethereum-dencun-upgrade-goes-live?amp=1',
+        'https://decrypt.co/234567/ethereum-dencun-upgrade-goes-live?fbclid=IwAR2xYz',
+        'https://decrypt.co/234567/ethereum-dencun-upgrade-goes-live/?gclid=Cj0KCQ',
+    ],
+    [
+        'https://www.reuters.com/technology/binance-ceo-pleads-guilty-2023-11-21/',
+        'https://mobile.reuters.com/technology/binance-ceo-pleads-guilty-2023-11-21',
+        'https://www.reuters.com/technology/binance-ceo-pleads-guilty-2023-11-21/?taid=655d&utm_campaign=trueAnthem',
+    ],
+    [
+        'https://bitcoinist.com/bitcoin-etf-inflows-record/',
+        'https://bitcoinist.com/bitcoin-etf-inflows-record/amp/',
+        'https://bitcoinist.com/bitcoin-etf-inflows-record/?mc_cid=abc123&mc_eid=def456',
+    ],
+    [
+        'https://www.theblock.co/post/290000/sec-ethereum',
+        'https://theblock.co/post/290000/sec-ethereum?utm_source=newsletter&_gl=1*abc',
+    ],
+    [
+        'https://example.com/news/article?id=42&page=2',
+        'https://example.com/news/article?page=2&id=42&utm_content=top',
+    ],
+    [
+        'https://www.coinbureau.com/news/bitcoin-halving-explained.html',
+        'https://coinbureau.com/news/bitcoin-halving-explained.amp.html',
+    ],
+    ['https://example.com/news/article?id=43&page=2'],
+    ['https://cointelegraph.com/news/bitcoin-price-hits-new-all-time-high-again'],
+]
+
+def test_variants_collapse_to_one_url():
+    for group in CORPUS:
+        assert len({canonicalize_url(url) for url in group}) == 1, group
+
+def test_distinct_articles_keep_distinct_urls():
+    canonical = [canonicalize_url(group[0]) for group in CORPUS]
+    assert len(set(canonical)) == len(CORPUS)
+
+def test_generic_parameters_are_kept():
+    # Sites use these to pick content, so they can't be assumed to be tracking
+    for query in ('source=reuters', 'src=feed2', 'ref=v2', 'via=markets', 'share=1', 'amp=story'):
+        url = f'https://example.com/news?{query}'
+        assert canonicalize_url(url) != canonicalize_url('https://example.com/news'), query
+
+def test_amp_flags_only_stripped_for_amp_values():
+    assert canonicalize_url('https://example.com/a?outputType=amp') == canonicalize_url('https://example.com/a')
+    assert canonicalize_url('https://example.com/a?outputType=json') != canonicalize_url('https://example.com/a')
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the local-first analysis cascade
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+
+from src.ai_analysis.cascade import AnalysisCascade
+from src.ai_analysis.llm_client import LLMClient
+from test_llm_client import HIGH_IMPACT_HEADLINES
+
+LLM_REPLY = '{"importance": 9, "sentiment": "bearish", "summary": "Major incident", "confidence": 8}'
+
+def make_cascade(reply: str = LLM_REPLY, audit_rate: float = 0.0):
+    client = LLMClient()
+    prompts = []
+    
+    async def call_llm_api(prompt):
+        prompts.append(prompt)
+        return reply
+    client._call_llm_api = call_llm_api
+    return AnalysisCascade(client, escalate_importance=5, min_confidence=5, audit_rate=audit_rate), prompts
+
+def test_high_impact_headlines_escalate():
+    cascade, prompts = make_cascade()
+    for headline in HIGH_IMPACT_HEADLINES:
+        analysis, used_llm = asyncio.run(cascade.analyze(headline, "", "test"))
+        assert used_llm, headline
+        assert analysis['importance'] == 9
+    assert len(prompts) == len(HIGH_IMPACT_HEADLINES)
+    assert cascade.get_stats()['escalated'] == len(HIGH_IMPACT_HEADLINES)
+
+def test_routine_headlines_stay_local():
+    cascade, prompts = make_cascade()
+    analysis, used_llm = asyncio.run(cascade.analyze("Bitcoin trades sideways as volumes stay flat", "", "test"))
+    assert not used_llm and not prompts
+    assert analysis['importance'] == 3
+    assert cascade.get_stats()['local_only'] == 1
+
+def test_ambiguous_items_escalate_on_low_confidence():
+    cascade, prompts = make_cascade()
+    title = "Great gains for bitcoin bulls, terrible losses for bears"
+    local = asyncio.run(cascade.llm_client.analyze_news(title, "", "test", local_only=True))
+    assert local['importance'] < cascade.escalate_importance
+    assert local['confidence'] < cascade.min_confidence
+    
+    analysis, used_llm = asyncio.run(cascade.analyze(title, "", "test"))
+    assert used_llm and len(prompts) == 1
+    assert cascade.get_stats()['escalated'] == 1
+
+def test_unparseable_reply_keeps_local_analysis():
+    cascade, _ = make_cascade(reply="Sorry, I can't help with that.")
+    analysis, used_llm = asyncio.run(cascade.analyze("Binance hacked, $100M stolen", "", "test"))
+    assert not used_llm
+    assert analysis['importance'] == 8
+    assert cascade.get_stats()['llm_failures'] == 1
+
+def test_audit_counts_gate_misses():
+    cascade, prompts = make_cascade(audit_rate=1.0)
+    analysis, used_llm = asyncio.run(cascade.analyze("Bitcoin trades sideways as volumes stay flat", "", "test"))
+    assert used_llm and len(prompts) == 1
+    stats = cascade.get_stats()
+    assert stats['audited'] == 1 and stats['audit_misses'] == 1
+
+def test_news_storm_only_escalates_important_items():
+    cascade, prompts = make_cascade()
+    routine = [f"Bitcoin trades sideways in session {i}" for i in range(80)]
+    
+    async def run():
+        return await asyncio.gather(*(
+            cascade.analyze(title, "", "test") for title in routine + HIGH_IMPACT_HEADLINES
+        ))
+    
+    results = asyncio.run(run())
+    assert len(prompts) == len(HIGH_IMPACT_HEADLINES)
+    assert sum(used_llm for _, used_llm in results) == len(HIGH_IMPACT_HEADLINES)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the circuit breaker
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent))
+
+from src.utils import circuit_breaker
+from src.utils.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+
+@pytest.fixture
+def breaker(monkeypatch, clock) -> CircuitBreaker:
+    monkeypatch.setattr(circuit_breaker.time, 'monotonic', clock)
+    monkeypatch.setattr(circuit_breaker.random, 'uniform', lambda a, b: 1.0)
+    return CircuitBreaker('feed', failure_threshold=3, base_delay=10, max_delay=100, trial_timeout=5)
+
+def test_opens_after_threshold(breaker):
+    for _ in range(2):
+        breaker.record_failure('HTTP 500')
+    assert breaker.allow_request()
+    breaker.record_failure('HTTP 500')
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    assert breaker.to_dict()['retry_in_seconds'] == 10
+
+def test_half_open_admits_a_single_trial(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    
+    # A trial that never reports back doesn't block the breaker forever
+    clock.now += 5
+    assert breaker.allow_request()
+
+def test_trial_outcome_closes_or_reopens(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 10
+    breaker.allow_request()
+    breaker.record_failure('timeout')
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.open_until == clock.now + 20
+    
+    clock.now += 20
+    breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request() and breaker.allow_request()
+
+def test_registry_keeps_one_breaker_per_key():
+    registry = CircuitBreakerRegistry(failure_threshold=2)
+    assert registry.get('example.com') is registry.get('example.com')
+    assert registry.get('example.com').failure_threshold == 2
+    assert set(registry.get_states()) == {'example.com'}
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the time-windowed dedup
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent))
+
+from src.utils import dedup
+from src.utils.dedup import TimeWindowedDedup
+
+@pytest.fixture
+def store(monkeypatch, clock) -> TimeWindowedDedup:
+    monkeypatch.setattr(dedup.time, 'time', clock)
+    return TimeWindowedDedup(window_seconds=3600, bucket_seconds=600)
+
+def test_repeat_hashes_are_duplicates(store):
+    assert not store.check_and_add('a' * 32)
+    assert store.check_and_add('a' * 32)
+    assert not store.check_and_add('b' * 32)
+    assert 'a' * 32 in store and len(store) == 2
+    assert store.hit_rate == 1 / 3
+
+def test_hashes_expire_after_the_window(store, clock):
+    store.check_and_add('a' * 32)
+    clock.now += 3600 + 1200
+    assert not store.check_and_add('a' * 32)
+
+def test_hits_refresh_the_retention(store, clock):
+    store.check_and_add('a' * 32)
+    for _ in range(10):
+        clock.now += 1800
+        assert store.check_and_add('a' * 32)
+    assert store.get_stats()['buckets'] <= 7
+
+def test_non_hex_ids_are_supported(store):
+    assert not store.check_and_add('not a hex digest')
+    assert store.check_and_add('not a hex digest')
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the exchange announcement WebSocket source
+"""
+
+import asyncio
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+sys.path.append(str(Path(__file__).parent))
+
+from src.news_sources.exchange_ws import WebSocketNewsSource
+from src.utils.transport import close_session
+
+ANNOUNCEMENT = {'id': 'a"1', 'title': 'Binance will list TOKEN', 'body': '<p>Trading opens today</p>', 'timestamp': 1700000000000}
+
+def make_source(url: str = 'ws://localhost/ws') -> WebSocketNewsSource:
+    return WebSocketNewsSource('binance', {'url': url, 'subscribe': {'op': 'subscribe', 'args': ['news'], 'since': '{since}'}})
+
+def test_fill_since_escapes_the_resume_id():
+    source = make_source()
+    source.last_message_id = 'a"1'
+    message = json.dumps(source._fill_since(source.subscribe_message))
+    assert json.loads(message) == {'op': 'subscribe', 'args': ['news'], 'since': 'a"1'}
+
+def test_messages_become_items_once():
+    source = make_source()
+    item = source._to_news_item(ANNOUNCEMENT)
+    assert item.title == 'Binance will list TOKEN' and item.content == 'Trading opens today'
+    assert item.published_date == datetime.fromtimestamp(1700000000, tz=timezone.utc)
+    assert source._to_news_item(ANNOUNCEMENT) is None
+    assert source._to_news_item({'id': 'no-title'}) is None
+
+def test_stream_answers_pings_and_resumes_after_reconnect():
+    subscriptions, pongs = [], []
+    
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        subscriptions.append(json.loads(await ws.receive_str()))
+        if len(subscriptions) == 1:
+            await ws.send_json({'ping': 42})
+            pongs.append(json.loads(await ws.receive_str()))
+            await ws.send_json({'data': ANNOUNCEMENT})
+            await ws.send_json({'data': ANNOUNCEMENT})
+            await ws.close()
+        else:
+            await ws.receive()
+        return ws
+    
+    async def run():
+        app = web.Application()
+        app.router.add_get('/ws', handler)
+        async with TestServer(app) as server:
+            source = make_source(str(server.make_url('/ws')))
+            source.RECONNECT_DELAY = 0.01
+            await source.start()
+            try:
+                item = await asyncio.wait_for(source.queue.get(), 5)
+                for _ in range(500):
+                    if len(subscriptions) == 2:
+                        break
+                    await asyncio.sleep(0.01)
+            finally:
+                await source.stop()
+                await close_session()
+            return item, source.queue.qsize()
+    
+    item, queued = asyncio.run(run())
+    assert item.title == 'Binance will list TOKEN' and queued == 0
+    assert pongs == [{'pong': 42}]
+    assert [sub['since'] for sub in subscriptions] == ['', 'a"1']
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the keyword matcher
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+
+from config import Config
+from src.utils.keyword_matcher import KeywordMatcher, get_matcher
+
+def test_word_boundaries():
+    matcher = KeywordMatcher(['eth', 'sec'])
+    assert not matcher.search("The method works")
+    assert not matcher.search("Second quarter results")
+    assert matcher.search("ETH breaks $4k")
+    assert matcher.matched_keywords("SEC sues exchange") == {'sec'}
+
+def test_inflections():
+    matcher = KeywordMatcher(['cryptocurrency', 'hack', 'ban', 'stablecoin', 'regulator', 'trade'])
+    assert matcher.matched_keywords("Cryptocurrencies rally") == {'cryptocurrency'}
+    assert matcher.matched_keywords("Exchange hacked overnight") == {'hack'}
+    assert matcher.matched_keywords("Hackers drain protocol") == {'hack'}
+    assert matcher.matched_keywords("Country bans mining") == {'ban'}
+    assert matcher.matched_keywords("Stablecoins grow") == {'stablecoin'}
+    assert matcher.matched_keywords("US regulators act") == {'regulator'}
+    assert matcher.matched_keywords("Traders are trading") == {'trade'}
+
+def test_short_keywords_only_take_regular_suffixes():
+    matcher = KeywordMatcher(['ban', 'fed'])
+    assert not matcher.search("Click the banner below")
+    assert not matcher.search("Feder sells his stake")
+    assert not matcher.search("fedding")
+    assert matcher.matched_keywords("Fed holds rates as banks wait") == {'fed'}
+
+def test_multi_word_keywords():
+    matcher = KeywordMatcher(['meme coin', 'interest rate'])
+    assert matcher.matched_keywords("Memecoins pump") == {'meme coin'}
+    assert matcher.matched_keywords("meme-coin mania") == {'meme coin'}
+    assert matcher.matched_keywords("Fed holds interest  rates") == {'interest rate'}
+
+def test_prefix_keywords():
+    matcher = KeywordMatcher(['crypto*', 'regulat*'])
+    assert matcher.matched_keywords("CryptoPunks floor price") == {'crypto*'}
+    assert matcher.matched_keywords("New regulatory framework") == {'regulat*'}
+    assert not matcher.search("Encrypto is not a prefix match")
+
+def test_find_all_positions():
+    matches = KeywordMatcher(['bitcoin']).find_all("Bitcoin and bitcoins")
+    assert [(m.keyword, m.start, m.end) for m in matches] == [('bitcoin', 0, 7), ('bitcoin', 12, 20)]
+
+def test_default_keywords_relevance():
+    matcher = get_matcher(Config.CRYPTO_KEYWORDS)
+    for title in ["Cryptocurrencies rally", "CryptoPunks sell out", "Memecoins surge on Solana"]:
+        assert matcher.search(title), title
+    assert not matcher.search("Local bakery wins award")
+    assert get_matcher(Config.CRYPTO_KEYWORDS) is matcher
+
+def test_empty_inputs():
+    assert not KeywordMatcher([]).search("bitcoin")
+    assert not KeywordMatcher(['bitcoin']).search("")
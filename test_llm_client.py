@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the LLM client's local scoring, reply parsing and limits
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent))
+
+from config import Config
+from src.ai_analysis.llm_client import LLMClient, keyword_importance
+
+HIGH_IMPACT_HEADLINES = [
+    "Binance hacked, $100M stolen",
+    "Hackers drain DeFi protocol",
+    "Exchange exploited in bridge attack",
+    "US regulators propose new regulatory framework",
+    "SEC approves spot bitcoin ETFs",
+    "China bans crypto mining",
+]
+
+def test_high_impact_headlines_score_high():
+    for headline in HIGH_IMPACT_HEADLINES:
+        assert keyword_importance(headline) >= 8, headline
+
+def test_routine_headlines_keep_base_score():
+    for headline in [
+        "Bitcoin trades sideways", "Analyst shares weekly outlook",
+        "Secondary market volumes flat", "Click the banner below"
+    ]:
+        assert keyword_importance(headline) == 3, headline
+
+def test_highest_keyword_wins():
+    assert keyword_importance("Exchange ban follows partnership talks") == 9
+    assert keyword_importance("Nothing notable", base=1) == 1
+
+def test_local_confidence_follows_the_text():
+    client = LLMClient()
+    
+    def confidence(title):
+        return asyncio.run(client.analyze_news(title, "", "test", local_only=True))['confidence']
+    
+    clear = confidence("Binance hacked, $100M stolen")
+    neutral = confidence("Bitcoin trades sideways")
+    mixed = confidence("Great gains for bitcoin bulls, terrible losses for bears")
+    assert clear > neutral > mixed
+    assert mixed < Config.CASCADE_MIN_CONFIDENCE <= neutral
+
+def test_unparseable_reply_raises():
+    client = LLMClient()
+    with pytest.raises(ValueError):
+        client._parse_llm_response("no json here")
+    with pytest.raises(ValueError):
+        client._parse_llm_response('{"importance": 7}')
+
+def test_analyze_news_falls_back_on_unparseable_reply():
+    client = LLMClient()
+    client.provider = 'deepseek'
+    
+    async def call_llm_api(prompt):
+        return "not json"
+    client._call_llm_api = call_llm_api
+    
+    analysis = asyncio.run(client.analyze_news("Exchange exploited in bridge attack", "", "test"))
+    assert analysis['importance'] == 8
+    assert analysis['summary'] == "Exchange exploited in bridge attack"
+
+def make_client(monkeypatch, provider: str, concurrency: int = 0, requests_per_minute: float = 0) -> LLMClient:
+    monkeypatch.setattr(Config, 'get_active_llm_provider', classmethod(lambda cls: provider))
+    monkeypatch.setattr(Config, 'LLM_MAX_CONCURRENCY', concurrency)
+    monkeypatch.setattr(Config, 'LLM_REQUESTS_PER_MINUTE', requests_per_minute)
+    return LLMClient()
+
+def test_provider_default_limits(monkeypatch):
+    openrouter = make_client(monkeypatch, 'openrouter')
+    assert openrouter.max_concurrency == 2 and openrouter.rate_limiter.rate == 20 / 60
+    deepseek = make_client(monkeypatch, 'deepseek')
+    assert deepseek.max_concurrency == 8 and deepseek.rate_limiter is None
+    assert make_client(monkeypatch, 'deepseek', concurrency=3).max_concurrency == 3
+
+def test_concurrent_calls_are_bounded(monkeypatch):
+    client = make_client(monkeypatch, 'deepseek', concurrency=3)
+    in_flight, peak = 0, 0
+    
+    async def call_llm_api(prompt):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return '{"importance": 6, "sentiment": "neutral", "summary": "ok"}'
+    client._call_llm_api = call_llm_api
+    
+    async def run():
+        started = time.monotonic()
+        results = await asyncio.gather(*(client.analyze_news(f"Item {i}", "", "test") for i in range(12)))
+        return results, time.monotonic() - started
+    
+    results, elapsed = asyncio.run(run())
+    assert [result['importance'] for result in results] == [6] * 12
+    assert peak == 3
+    assert 0.2 <= elapsed < 0.5
+
+def test_request_quota_is_enforced(monkeypatch):
+    client = make_client(monkeypatch, 'openrouter', concurrency=2, requests_per_minute=1200)
+    
+    async def call_llm_api(prompt):
+        return '{"importance": 6, "sentiment": "neutral", "summary": "ok"}'
+    client._call_llm_api = call_llm_api
+    
+    async def run():
+        started = time.monotonic()
+        await asyncio.gather(*(client.llm_analysis(f"Item {i}", "", "test") for i in range(6)))
+        return time.monotonic() - started
+    
+    # Two calls fit in the burst, the other four wait for 20 tokens per second
+    assert asyncio.run(run()) >= 0.19
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Unit tests for LLM load shedding
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+
+from src.ai_analysis.llm_client import LLMClient
+from src.ai_analysis.load_shedder import ANALYZE, FALLBACK, LoadShedder
+
+def make_shedder() -> LoadShedder:
+    shedder = LoadShedder(workers=2, max_backlog_seconds=60, priority_score=7.0)
+    shedder.record_call(4.0)  # 2 workers at 4s per call: 0.5 analyses/s
+    return shedder
+
+def test_no_estimate_before_first_call():
+    shedder = LoadShedder(workers=2, max_backlog_seconds=60, priority_score=7.0)
+    assert shedder.throughput is None
+    assert shedder.decide(1.0, 1000) == ANALYZE
+
+def test_record_call_smooths_durations():
+    shedder = make_shedder()
+    shedder.record_call(14.0)
+    assert shedder.call_seconds == 4.0 + shedder.alpha * 10.0
+
+def test_low_priority_items_fall_back_under_backlog():
+    shedder = make_shedder()
+    assert shedder.decide(1.0, 10) == ANALYZE  # 20s backlog
+    assert shedder.decide(1.0, 100) == FALLBACK  # 200s backlog
+    assert shedder.decide(8.0, 100) == ANALYZE
+    assert shedder.get_stats()['decisions'] == {ANALYZE: 2, FALLBACK: 1}
+
+def test_items_are_never_dropped():
+    shedder = make_shedder()
+    assert {shedder.decide(score, 10000) for score in (-5.0, 0.0, 3.0, 6.9)} == {FALLBACK}
+
+def test_shedding_stops_below_resume_fraction():
+    shedder = make_shedder()
+    shedder.decide(1.0, 100)
+    assert shedder.decide(1.0, 20) == FALLBACK  # 40s: under the limit, above the resume point
+    assert shedder.decide(1.0, 10) == ANALYZE
+    assert not shedder.shedding
+
+def test_only_llm_api_calls_are_timed():
+    client = LLMClient()
+    durations = []
+    client.on_call_complete = durations.append
+    
+    async def call_llm_api(prompt):
+        await asyncio.sleep(0.01)
+        return '{"importance": 6, "sentiment": "bullish", "summary": "ok"}'
+    client._call_llm_api = call_llm_api
+    
+    async def run():
+        await client.analyze_news("Bitcoin rallies", "", "test", local_only=True)
+        return await client.llm_analysis("Bitcoin rallies", "", "test")
+    
+    assert asyncio.run(run())['importance'] == 6
+    assert len(durations) == 1 and durations[0] >= 0.01
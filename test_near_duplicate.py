@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Unit tests for near-duplicate story clustering
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+
+from src.ai_analysis.near_duplicate import NearDuplicateDetector, estimate_similarity, minhash
+from src.news_sources.base import NewsItem
+
+STORY = (
+    "The Securities and Exchange Commission approved applications for spot ether "
+    "exchange-traded funds on Thursday, clearing the way for trading to begin later this year"
+)
+
+def make_item(source: str, title: str = "SEC approves spot ether ETFs", content: str = STORY) -> NewsItem:
+    return NewsItem(title, content, f"https://{source}.example/ether-etf", source)
+
+def test_similarity_of_signatures():
+    assert estimate_similarity(minhash(STORY), minhash(STORY)) == 1.0
+    assert estimate_similarity(minhash(STORY), minhash("Dogecoin rallies after meme tweet")) < 0.2
+
+def test_copies_join_the_leaders_cluster():
+    detector = NearDuplicateDetector(window_seconds=3600, threshold=0.6)
+    cluster, is_leader = detector.assign(make_item('coindesk'))
+    copy_cluster, copy_leads = detector.assign(make_item('decrypt', title="SEC approves spot ether ETFs!"))
+    other, other_leads = detector.assign(make_item('reuters', "Dogecoin rallies", "Meme coins jump after a tweet"))
+    
+    assert is_leader and not copy_leads and other_leads
+    assert copy_cluster is cluster and other is not cluster
+    assert cluster.sources == ['coindesk', 'decrypt']
+    assert detector.get_stats()['duplicates'] == 1
+
+def test_copies_inherit_the_leaders_analysis():
+    detector = NearDuplicateDetector(window_seconds=3600, threshold=0.6)
+    cluster, _ = detector.assign(make_item('coindesk'))
+    assert cluster.set_analysis({'importance': 8}) is None
+    
+    copy = make_item('decrypt')
+    detector.assign(copy)
+    assert not cluster.follow(copy)
+    assert cluster.analysis == {'importance': 8}
+
+def test_waiting_copy_takes_over_when_the_leader_fails():
+    detector = NearDuplicateDetector(window_seconds=3600, threshold=0.6)
+    cluster, _ = detector.assign(make_item('coindesk'))
+    copy = make_item('decrypt')
+    detector.assign(copy)
+    assert not cluster.follow(copy)
+    
+    assert cluster.set_analysis(None) is copy
+    assert cluster.leader is copy and cluster.analyzing
+
+def test_next_copy_leads_after_a_failed_leader():
+    detector = NearDuplicateDetector(window_seconds=3600, threshold=0.6)
+    cluster, _ = detector.assign(make_item('coindesk'))
+    assert cluster.set_analysis(None) is None
+    
+    copy = make_item('decrypt')
+    detector.assign(copy)
+    assert cluster.follow(copy)
+    assert not cluster.follow(make_item('theblock'))
+    assert cluster.set_analysis({'importance': 6}) is None
+    assert not cluster.waiting
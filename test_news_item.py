@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Unit tests for NewsItem
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+
+from src.news_sources.base import NewsItem
+
+def make_item() -> NewsItem:
+    return NewsItem("SEC approves ETF", "Full text", "https://example.com/etf?utm_source=x", "coindesk", datetime(2024, 5, 23, 12, 0))
+
+def test_dict_style_access_matches_to_dict():
+    item = make_item()
+    as_dict = item.to_dict()
+    assert dict(item) == as_dict
+    assert list(item) == list(as_dict) and len(item) == len(as_dict)
+    assert dict(item.items()) == as_dict and item.values() == list(as_dict.values())
+    assert item['published_date'] == '2024-05-23T12:00:00'
+    assert item.get('missing', 'default') == 'default'
+
+def test_to_dict_is_json_serializable():
+    assert json.loads(json.dumps(make_item().to_dict()))['title'] == "SEC approves ETF"
+
+def test_content_is_kept_in_full():
+    content = "word " * 5000
+    assert NewsItem("Title", content, "https://example.com/a", "test").content == content
+
+def test_hash_id_ignores_tracking_parameters():
+    other = NewsItem("Different title", "", "https://www.example.com/etf", "decrypt")
+    assert make_item().hash_id == other.hash_id
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Unit tests for pre-scoring and the priority stage
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+
+from config import Config
+from src.ai_analysis.priority import pre_score, source_weight
+from src.news_sources.base import NewsItem
+from src.utils.pipeline import PriorityStage
+
+def make_item(title: str, content: str = "", source: str = "test", age_hours: float = 0.0) -> NewsItem:
+    published = datetime.now(timezone.utc) - timedelta(hours=age_hours)
+    return NewsItem(title, content, "https://example.com/" + title.replace(' ', '-'), source, published)
+
+def test_important_headlines_score_higher():
+    routine = pre_score(make_item("Bitcoin trades sideways"))
+    assert pre_score(make_item("Exchange exploited in bridge attack")) > routine
+    assert pre_score(make_item("US regulators propose new regulatory framework")) > routine
+
+def test_body_keywords_count_for_less_than_headline_keywords():
+    headline = pre_score(make_item("Exchange hacked"))
+    body = pre_score(make_item("Exchange update", "The exchange was hacked overnight"))
+    plain = pre_score(make_item("Exchange update"))
+    assert headline > body > plain
+
+def test_older_items_score_lower():
+    assert pre_score(make_item("SEC approves ETF")) > pre_score(make_item("SEC approves ETF", age_hours=12))
+
+def test_source_weights(monkeypatch):
+    monkeypatch.setattr(Config, 'SOURCE_WEIGHTS', {'coindesk': 1.5, 'NewsAPI-': 0.5})
+    assert source_weight('coindesk') == 1.5
+    assert source_weight('NewsAPI-Reuters') == 0.5
+    assert source_weight('reddit') == 1.0
+
+def test_priority_stage_serves_highest_score_first():
+    async def run():
+        handled = []
+        
+        async def handler(job):
+            handled.append(job)
+        
+        stage = PriorityStage('analyze', handler, lambda job: job, workers=1, queue_size=10)
+        for score in (1.0, 9.0, 5.0):
+            await stage.put(score)
+        stage.start()
+        await stage.queue.join()
+        await stage.stop()
+        return handled
+    
+    assert asyncio.run(run()) == [9.0, 5.0, 1.0]
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for fetching RSS feeds
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+sys.path.append(str(Path(__file__).parent))
+
+from config import Config
+from src.news_sources import rss_feeds
+from src.news_sources.rss_feeds import RSSFeedSource
+from src.utils import state_cache
+from src.utils.state_cache import StateCache
+from src.utils.transport import close_session
+
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>Bitcoin ETF approved</title><link>https://example.com/btc-etf</link>
+<description>Spot bitcoin ETFs begin trading</description></item>
+</channel></rss>"""
+
+async def serve_feed(request):
+    if request.headers.get('If-None-Match') == '"v1"':
+        return web.Response(status=304)
+    return web.Response(body=FEED, headers={'ETag': '"v1"'}, content_type='application/rss+xml')
+
+def fetch_twice(tmp_path, monkeypatch, first_parse):
+    """Fetch the feed with first_parse as the parser, then with the real one."""
+    monkeypatch.setattr(Config, 'RSS_STREAMING_PARSE', False)
+    monkeypatch.setattr(Config, 'FEED_PARSER_WORKERS', 0)
+    real_parse = rss_feeds.parse_feed
+    
+    async def run():
+        app = web.Application()
+        app.router.add_get('/feed', serve_feed)
+        async with TestServer(app) as server:
+            source = RSSFeedSource('test', str(server.make_url('/feed')), state_cache=StateCache(str(tmp_path / 'state.json')))
+            try:
+                monkeypatch.setattr(rss_feeds, 'parse_feed', first_parse)
+                first = await source.fetch_news()
+                monkeypatch.setattr(rss_feeds, 'parse_feed', real_parse)
+                second = await source.fetch_news()
+            finally:
+                await close_session()
+            return first, second
+    
+    return asyncio.run(run())
+
+def test_failed_parse_is_retried_next_poll(tmp_path, monkeypatch):
+    async def broken_parse(body):
+        raise RuntimeError("parser pool died")
+    
+    first, second = fetch_twice(tmp_path, monkeypatch, broken_parse)
+    assert first == []
+    assert [item.title for item in second] == ['Bitcoin ETF approved']
+
+def test_parsed_feed_uses_conditional_get_next_poll(tmp_path, monkeypatch):
+    first, second = fetch_twice(tmp_path, monkeypatch, rss_feeds.parse_feed)
+    assert [item.title for item in first] == ['Bitcoin ETF approved']
+    assert second == []
+
+def test_state_saves_are_debounced(tmp_path, monkeypatch, clock):
+    monkeypatch.setattr(state_cache.time, 'monotonic', clock)
+    path = tmp_path / 'state.json'
+    cache = StateCache(str(path))
+    
+    cache.update('feed', etag='"v1"')
+    cache.save_if_due(60)
+    assert not path.exists()
+    
+    clock.now += 60
+    cache.save_if_due(60)
+    assert StateCache(str(path)).get('feed') == {'etag': '"v1"'}
+    
+    cache.update('feed', etag='"v2"')
+    cache.save_if_due(60)
+    assert StateCache(str(path)).get('feed') == {'etag': '"v1"'}
+    
+    cache.save()
+    assert StateCache(str(path)).get('feed') == {'etag': '"v2"'}
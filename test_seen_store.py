@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared seen-store
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+
+from config import Config
+from src.utils import seen_store
+from src.utils.seen_store import SeenStore
+
+def test_claim_returns_only_new_hashes(tmp_path):
+    store = SeenStore(str(tmp_path / 'seen.db'))
+    try:
+        assert store.claim(['a', 'b']) == {'a', 'b'}
+        assert store.claim(['b', 'c']) == {'c'}
+        assert len(store) == 3
+    finally:
+        store.close()
+
+def test_claims_are_shared_between_connections(tmp_path):
+    first = SeenStore(str(tmp_path / 'seen.db'))
+    second = SeenStore(str(tmp_path / 'seen.db'))
+    try:
+        assert first.claim(['a']) == {'a'}
+        assert second.claim(['a', 'b']) == {'b'}
+    finally:
+        first.close()
+        second.close()
+
+def test_claim_async(tmp_path):
+    store = SeenStore(str(tmp_path / 'seen.db'))
+    
+    async def claim_twice():
+        return await asyncio.gather(store.claim_async(['a', 'b']), store.claim_async(['b', 'c']))
+    
+    try:
+        first, second = asyncio.run(claim_twice())
+        assert first | second == {'a', 'b', 'c'}
+        assert not first & second
+    finally:
+        store.close()
+
+def test_unopenable_store_fails_open_once(tmp_path, monkeypatch):
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_text('')
+    monkeypatch.setattr(Config, 'SEEN_STORE_FILE', str(blocker / 'seen.db'))
+    seen_store.close_seen_store()
+    
+    opened = []
+    monkeypatch.setattr(seen_store, 'SeenStore', lambda *args: opened.append(args) or SeenStore(*args))
+    try:
+        assert seen_store.get_seen_store() is None
+        assert seen_store.get_seen_store() is None
+        assert len(opened) == 1
+    finally:
+        seen_store.close_seen_store()
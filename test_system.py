@@ -15,6 +15,9 @@ from src.utils.logger import setup_logger
 from src.news_sources.rss_feeds import RSSFeedManager
 from src.ai_analysis.llm_client import LLMClient
 from src.alerts.alert_manager import AlertManager
+from src.news_sources.feed_parser import shutdown_executor
+from src.utils.transport import close_session
+from src.utils.seen_store import close_seen_store
 
 async def test_configuration():
     """Test system configuration."""
@@ -71,8 +74,6 @@ async def test_llm_analysis():
         print(f"  📊 Importance: {analysis['importance']}/10")
         print(f"  📈 Sentiment: {analysis['sentiment']}")
         print(f"  💡 Summary: {analysis['summary'][:50]}...")
-        
-        await llm_client.close()
         return True
         
     except Exception as e:
@@ -146,6 +147,10 @@ async def run_full_test():
             print(f"❌ {test_name} test crashed: {e}")
             results.append((test_name, False))
     
+    await close_session()
+    shutdown_executor()
+    close_seen_store()
+    
     # Summary
     print("\n" + "=" * 40)
     print("📋 TEST SUMMARY")
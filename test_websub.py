@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the WebSub receiver, including a stand-in hub
+"""
+
+import asyncio
+import hashlib
+import hmac
+import sys
+from pathlib import Path
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer, unused_port
+
+sys.path.append(str(Path(__file__).parent))
+
+from config import Config
+from src.news_sources.rss_feeds import RSSFeedSource
+from src.news_sources.websub import WebSubReceiver, WebSubSubscription
+from src.utils import seen_store
+from src.utils.transport import close_session, get_session
+
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>Bitcoin ETF approved</title><link>https://example.com/btc-etf</link>
+<description>Spot bitcoin ETFs begin trading</description></item>
+</channel></rss>"""
+
+def make_receiver(pushed):
+    async def handler(items):
+        pushed.extend(items)
+    
+    receiver = WebSubReceiver(handler)
+    source = RSSFeedSource('test', 'https://example.com/feed')
+    source.hub_url, source.topic_url = 'https://hub.example.com/', 'https://example.com/feed'
+    subscription = WebSubSubscription(source, 'abc')
+    receiver.subscriptions['abc'] = subscription
+    return receiver, subscription
+
+async def call(receiver: WebSubReceiver, method: str, path: str, **kwargs):
+    """Send one request to the receiver's callback routes; returns (status, text)."""
+    app = web.Application()
+    app.router.add_get('/websub/{callback_id}', receiver._handle_verification)
+    app.router.add_post('/websub/{callback_id}', receiver._handle_delivery)
+    async with TestClient(TestServer(app)) as client:
+        response = await client.request(method, path, **kwargs)
+        return response.status, await response.text()
+
+def sign(secret: str, body: bytes) -> str:
+    return 'sha256=' + hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+
+def test_signature_check():
+    body = b'payload'
+    assert WebSubReceiver._valid_signature('secret', body, sign('secret', body))
+    assert not WebSubReceiver._valid_signature('secret', body, sign('other', body))
+    assert not WebSubReceiver._valid_signature('secret', body, 'md5=abc')
+    assert not WebSubReceiver._valid_signature('secret', body, None)
+
+def test_verification_activates_the_subscription():
+    receiver, subscription = make_receiver([])
+    params = {
+        'hub.mode': 'subscribe', 'hub.topic': subscription.topic_url,
+        'hub.challenge': 'xyz', 'hub.lease_seconds': '3600'
+    }
+    assert asyncio.run(call(receiver, 'GET', '/websub/abc', params=params)) == (200, 'xyz')
+    assert subscription.active and subscription.source.push_active
+    
+    wrong_topic = {**params, 'hub.topic': 'https://example.com/other'}
+    assert asyncio.run(call(receiver, 'GET', '/websub/abc', params=wrong_topic))[0] == 404
+
+def test_signed_delivery_reaches_the_handler(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'FEED_PARSER_WORKERS', 0)
+    monkeypatch.setattr(Config, 'SEEN_STORE_FILE', str(tmp_path / 'seen.db'))
+    seen_store.close_seen_store()
+    pushed = []
+    receiver, subscription = make_receiver(pushed)
+    
+    async def deliver(signature):
+        status, _ = await call(receiver, 'POST', '/websub/abc', data=FEED, headers={'X-Hub-Signature': signature})
+        await asyncio.gather(*receiver._tasks)
+        return status
+    
+    try:
+        assert asyncio.run(deliver(sign('wrong', FEED))) == 202
+        assert not pushed
+        assert asyncio.run(deliver(sign(subscription.secret, FEED))) == 202
+        assert [item.title for item in pushed] == ['Bitcoin ETF approved']
+    finally:
+        seen_store.close_seen_store()
+
+def test_unknown_callback_is_gone():
+    receiver, _ = make_receiver([])
+    assert asyncio.run(call(receiver, 'POST', '/websub/missing', data=b''))[0] == 410
+
+def test_subscribes_through_a_hub_and_renews_the_lease(monkeypatch):
+    port = unused_port()
+    monkeypatch.setattr(Config, 'WEBSUB_HOST', '127.0.0.1')
+    monkeypatch.setattr(Config, 'WEBSUB_PORT', port)
+    monkeypatch.setattr(Config, 'WEBSUB_CALLBACK_URL', f'http://127.0.0.1:{port}/')
+    monkeypatch.setattr(Config, 'WEBSUB_RENEW_CHECK_SECONDS', 0.05)
+    monkeypatch.setattr(Config, 'WEBSUB_RENEW_MARGIN_SECONDS', 1.5)
+    monkeypatch.setattr(Config, 'WEBSUB_VERIFY_TIMEOUT_SECONDS', 0.2)
+    requests, challenges = [], []
+    
+    async def verify(form):
+        # Like a real hub, confirm intent asynchronously after accepting the request
+        challenge = f'challenge-{len(requests)}'
+        params = {
+            'hub.mode': form['hub.mode'], 'hub.topic': form['hub.topic'],
+            'hub.challenge': challenge, 'hub.lease_seconds': '2'
+        }
+        session = await get_session()
+        async with session.get(form['hub.callback'], params=params) as response:
+            challenges.append((challenge, await response.text()))
+    
+    async def hub(request):
+        form = dict(await request.post())
+        requests.append(form)
+        asyncio.get_running_loop().create_task(verify(form))
+        return web.Response(status=202)
+    
+    async def run():
+        app = web.Application()
+        app.router.add_post('/hub', hub)
+        async with TestServer(app) as hub_server:
+            receiver = WebSubReceiver(lambda items: asyncio.sleep(0))
+            source = RSSFeedSource('test', 'https://example.com/feed')
+            source.hub_url, source.topic_url = str(hub_server.make_url('/hub')), 'https://example.com/feed'
+            await receiver.start()
+            try:
+                await receiver.ensure_subscribed(source)
+                for _ in range(300):
+                    if len(challenges) >= 2:
+                        break
+                    await asyncio.sleep(0.01)
+                status = receiver.get_status()['test']
+            finally:
+                await receiver.stop()
+                await close_session()
+            return source, status
+    
+    source, status = asyncio.run(run())
+    assert len(requests) >= 2
+    assert all(form['hub.mode'] == 'subscribe' and form['hub.topic'] == 'https://example.com/feed' for form in requests)
+    assert requests[0]['hub.callback'].startswith(f'http://127.0.0.1:{port}/websub/')
+    assert all(challenge == echoed for challenge, echoed in challenges)
+    assert status['active']
+    assert not source.push_active  # cleared by stop()